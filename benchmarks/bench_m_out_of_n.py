@@ -0,0 +1,135 @@
+import argparse
+import time
+from typing import Optional
+
+import numpy as np
+
+from config.settings import VOTING_SETTINGS
+from core.algorithms import M_OUT_OF_N_VECTORIZE_FROM, MOutOfNStrategy
+
+
+def reference_vote(
+    data: list[float],
+    historical_result: Optional[float],
+    threshold: float = VOTING_SETTINGS.THRESHOLD,
+    history_threshold: float = VOTING_SETTINGS.HISTORY_THRESHOLD,
+) -> Optional[float]:
+    if not data:
+        return None
+    
+    n = len(data)
+    m = n // 2 + 1
+    
+    object_list: list[Optional[float]] = [None] * n
+    tallies_list: list[float] = [0] * n
+    object_list[0] = data[0]
+    tallies_list[0] = 1
+    
+    for i in range(1, n):
+        matched_index = -1
+        for j in range(n):
+            if object_list[j] is not None and tallies_list[j] != 0:
+                if abs(data[i] - object_list[j]) <= threshold:
+                    matched_index = j
+                    break
+        
+        if matched_index != -1:
+            tallies_list[matched_index] += 1
+            continue
+        
+        free_index = next((j for j in range(n) if tallies_list[j] == 0), -1)
+        if free_index != -1:
+            object_list[free_index] = data[i]
+            tallies_list[free_index] = 1
+            continue
+        
+        min_val = min(tallies_list)
+        min_index = tallies_list.index(min_val)
+        if 1 <= min_val:
+            tallies_list = [max(0, tally - 1) for tally in tallies_list]
+        else:
+            object_list[min_index] = data[i]
+            tallies_list[min_index] = 1
+            tallies_list = [max(0, tally - min_val) for tally in tallies_list]
+    
+    tallies_list = [0] * n
+    for i in range(n):
+        for j in range(n):
+            if object_list[j] is not None and abs(data[i] - object_list[j]) <= threshold:
+                tallies_list[j] += 1
+                if tallies_list[j] >= m:
+                    return object_list[j]
+    
+    if historical_result is None:
+        return None
+    
+    distances = [abs(historical_result - reading) for reading in data]
+    min_distance = min(distances)
+    if min_distance <= history_threshold:
+        return data[distances.index(min_distance)]
+    return None
+
+
+def generate_samples(rows: int, sensors: int, seed: int) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    samples = 20.0 + rng.normal(0.0, 0.8, (rows, sensors))
+    faulty = rng.random((rows, sensors)) < 0.2
+    samples[faulty] += rng.normal(0.0, 6.0, faulty.sum())
+    return np.round(samples, 1)
+
+
+def time_per_sample(vote, samples: list[list[float]]) -> float:
+    historical: Optional[float] = None
+    start = time.perf_counter()
+    for data in samples:
+        result = vote(data, historical)
+        if result is not None:
+            historical = result
+    return (time.perf_counter() - start) / len(samples)
+
+
+def check_equivalence(strategy: MOutOfNStrategy, samples: list[list[float]]) -> int:
+    mismatches = 0
+    historical: Optional[float] = None
+    for data in samples:
+        expected = reference_vote(data, historical)
+        actual = strategy.vote(data, historical)
+        if expected != actual:
+            mismatches += 1
+        if expected is not None:
+            historical = expected
+    return mismatches
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Per-sample latency of MOutOfNStrategy")
+    # Sizes on both sides of the crossover, so both kernels are checked
+    parser.add_argument(
+        "--sensors",
+        type=int,
+        nargs="+",
+        default=[6, 32, M_OUT_OF_N_VECTORIZE_FROM - 1, M_OUT_OF_N_VECTORIZE_FROM, 512],
+    )
+    parser.add_argument("--rows", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    
+    print(f"{'sensors':>8} {'kernel':>11} {'reference [us]':>15} {'strategy [us]':>14} {'speedup':>8} {'mismatches':>11}")
+    
+    for sensors in args.sensors:
+        samples = generate_samples(args.rows, sensors, args.seed).tolist()
+        strategy = MOutOfNStrategy()
+        
+        mismatches = check_equivalence(strategy, samples)
+        reference = time_per_sample(reference_vote, samples)
+        dispatched = time_per_sample(strategy.vote, samples)
+        kernel = "vectorized" if sensors >= M_OUT_OF_N_VECTORIZE_FROM else "sequential"
+        
+        print(
+            f"{sensors:>8} {kernel:>11} {reference * 1e6:>15.1f} {dispatched * 1e6:>14.1f} "
+            f"{reference / dispatched:>7.1f}x {mismatches:>11}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+import argparse
+import tempfile
+import time
+
+import numpy as np
+
+from core.algorithms import (
+    Voter,
+    AverageStrategy,
+    MedianStrategy,
+    MOutOfNStrategy,
+    MajorityStrategy,
+    AverageAdaptiveStrategy,
+)
+from core.sample_record import SampleRecord
+from infrastructure.replay_service import REPLAY_AS_FAST_AS_POSSIBLE, ReplayService
+from infrastructure.session_recorder import SessionRecorder
+
+
+def record_session(directory: str, samples: int, sensors: int, fault_rate: float) -> str:
+    # Votes are not needed in the file, so the recorder gets no strategies
+    recorder = SessionRecorder(directory, strategies=[], flush_interval=0.05, max_pending=samples)
+    recorder.start()
+    
+    rng = np.random.default_rng(0)
+    values = 21.0 + rng.normal(0.0, 0.3, (samples, sensors))
+    values[rng.random((samples, sensors)) < fault_rate] = np.nan
+    registers = np.nan_to_num(values * 10, nan=-2731).astype(np.int64)
+    for row in range(samples):
+        recorder.record(SampleRecord.from_values(row, row * 0.1, 1.7e9 + row * 0.1, values[row]), registers[row])
+    
+    recorder.stop()
+    return recorder.session_directory
+
+
+def run(source: str, sensors: int, interval: float) -> dict:
+    # Mirrors MainWindow: drain the ring once per tick, then one batch vote
+    service = ReplayService(source, speed=REPLAY_AS_FAST_AS_POSSIBLE, num_sensors=sensors)
+    ring = service.get_sample_ring()
+    block = np.empty((ring.capacity, ring.width))
+    voter = Voter([
+        AverageStrategy(),
+        MedianStrategy(),
+        MOutOfNStrategy(),
+        MajorityStrategy(),
+        AverageAdaptiveStrategy(),
+    ])
+    
+    consumed = 0
+    vote_time = 0.0
+    start = time.perf_counter()
+    service.start()
+    while not service.finished or len(ring):
+        time.sleep(interval)
+        count = ring.drain_into(block)
+        if not count:
+            continue
+        
+        records = [SampleRecord.from_row(row) for row in block[:count]]
+        begin = time.perf_counter()
+        voter.vote_batch(
+            np.stack([record.values for record in records]),
+            np.stack([record.mask for record in records]),
+        )
+        vote_time += time.perf_counter() - begin
+        consumed += count
+    
+    elapsed = time.perf_counter() - start
+    service.stop()
+    return {
+        "consumed": consumed,
+        "rate": consumed / elapsed,
+        "vote_us": vote_time / max(1, consumed) * 1e6,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Voting throughput on a recorded session replayed at full speed")
+    parser.add_argument("--samples", type=int, default=20000)
+    parser.add_argument("--sensors", type=int, nargs="+", default=[6, 64])
+    parser.add_argument("--fault-rate", type=float, default=0.05)
+    parser.add_argument("--interval", type=float, default=0.05, help="Consumer poll interval [s]")
+    args = parser.parse_args()
+    
+    print(f"{'sensors':>8} {'samples':>9} {'samples/s':>10} {'vote [us]':>10}")
+    
+    with tempfile.TemporaryDirectory() as directory:
+        for sensors in args.sensors:
+            source = record_session(directory, args.samples, sensors, args.fault_rate)
+            result = run(source, sensors, args.interval)
+            print(f"{sensors:>8} {result['consumed']:>9} {result['rate']:>10.0f} {result['vote_us']:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+import argparse
+import queue
+import threading
+import time
+
+import numpy as np
+
+from core.sample_record import SampleRecord
+from utils.bounded_queue import BoundedSampleQueue
+from utils.spsc_ring import SpscRing
+
+
+class QueueTransport:
+    
+    def __init__(self, sample_queue: queue.Queue):
+        self._queue = sample_queue
+    
+    def produce(self, record: SampleRecord) -> None:
+        self._queue.put(record)
+    
+    def consume(self) -> int:
+        count = 0
+        try:
+            while not self._queue.empty():
+                self._queue.get_nowait()
+                count += 1
+        except queue.Empty:
+            pass
+        return count
+
+
+class RingTransport:
+    
+    def __init__(self, capacity: int, sensors: int):
+        width = SampleRecord.row_width(sensors)
+        self._ring = SpscRing(capacity, width)
+        self._block = np.empty((capacity, width))
+    
+    def produce(self, record: SampleRecord) -> None:
+        row = self._ring.reserve()
+        if row is not None:
+            record.write_row(row)
+            self._ring.commit()
+    
+    def consume(self) -> int:
+        return self._ring.drain_into(self._block)
+
+
+def run(transport, rate: float, duration: float, interval: float, sensors: int) -> dict:
+    record = SampleRecord.from_readings(0, 0.0, 0.0, [21.5] * sensors)
+    stop = threading.Event()
+    produce_time = [0.0]
+    produced = [0]
+    
+    def producer() -> None:
+        start = time.perf_counter()
+        while not stop.is_set():
+            target = int((time.perf_counter() - start) * rate)
+            begin = time.perf_counter()
+            while produced[0] < target:
+                record.sequence = produced[0]
+                transport.produce(record)
+                produced[0] += 1
+            produce_time[0] += time.perf_counter() - begin
+            time.sleep(0.0005)
+    
+    thread = threading.Thread(target=producer, daemon=True)
+    thread.start()
+    
+    consumed = 0
+    consume_time = 0.0
+    deadline = time.perf_counter() + duration
+    while time.perf_counter() < deadline:
+        time.sleep(interval)
+        begin = time.perf_counter()
+        consumed += transport.consume()
+        consume_time += time.perf_counter() - begin
+    
+    stop.set()
+    thread.join()
+    consumed += transport.consume()
+    
+    return {
+        "produced": produced[0],
+        "consumed": consumed,
+        "produce_us": produce_time[0] / max(1, produced[0]) * 1e6,
+        "consume_us": consume_time / max(1, consumed) * 1e6,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Sample transport cost at synthetic acquisition rates")
+    parser.add_argument("--rates", type=float, nargs="+", default=[1000.0, 10000.0])
+    parser.add_argument("--duration", type=float, default=2.0)
+    parser.add_argument("--interval", type=float, default=0.05, help="Consumer poll interval [s]")
+    parser.add_argument("--sensors", type=int, default=6)
+    args = parser.parse_args()
+    
+    print(f"{'rate [Hz]':>10} {'transport':>20} {'produced':>9} {'consumed':>9} {'put [us]':>9} {'get [us]':>9}")
+    
+    for rate in args.rates:
+        capacity = int(rate * args.duration) + 1
+        transports = {
+            "queue.Queue": QueueTransport(queue.Queue()),
+            "BoundedSampleQueue": QueueTransport(BoundedSampleQueue(capacity)),
+            "SpscRing": RingTransport(capacity, args.sensors),
+        }
+        
+        for name, transport in transports.items():
+            result = run(transport, rate, args.duration, args.interval, args.sensors)
+            print(
+                f"{rate:>10.0f} {name:>20} {result['produced']:>9} {result['consumed']:>9} "
+                f"{result['produce_us']:>9.2f} {result['consume_us']:>9.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
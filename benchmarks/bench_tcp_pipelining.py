@@ -0,0 +1,48 @@
+import argparse
+import time
+
+from infrastructure.loopback_device import LoopbackDevice
+from infrastructure.register_plan import RegisterReadPlan
+from infrastructure.tcp_reader import TcpConnectionPool, TcpModbusReader
+from infrastructure.tcp_simulator import ModbusTcpSimulator
+
+
+def run(reader: TcpModbusReader, plan: RegisterReadPlan, cycles: int, pipelined: bool) -> float:
+    start = time.perf_counter()
+    for _ in range(cycles):
+        if pipelined:
+            plan.assemble(reader.read_register_blocks(plan.blocks))
+        else:
+            plan.read(reader.read_registers)
+    return (time.perf_counter() - start) / cycles
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare sequential and pipelined Modbus TCP block reads")
+    parser.add_argument("--sensors", type=int, default=500)
+    parser.add_argument("--latency", type=float, default=0.005, help="Simulated slave latency in seconds")
+    parser.add_argument("--cycles", type=int, default=50)
+    args = parser.parse_args()
+    
+    simulator = ModbusTcpSimulator({1: LoopbackDevice(args.sensors, latency=args.latency, seed=1)})
+    simulator.start()
+    host, port = simulator.address
+    
+    reader = TcpModbusReader(host, 1, port, pool=TcpConnectionPool())
+    reader.connect()
+    plan = RegisterReadPlan.contiguous(0, args.sensors)
+    
+    try:
+        print(f"{args.sensors} sensors in {len(plan.blocks)} blocks, {args.latency * 1000:.1f} ms slave latency")
+        for pipelined in (False, True):
+            cycle_time = run(reader, plan, args.cycles, pipelined)
+            label = "pipelined" if pipelined else "sequential"
+            print(f"{label:>10}: {cycle_time * 1000:7.2f} ms/cycle")
+        print(f"connections opened: {simulator.connections}")
+    finally:
+        reader.disconnect()
+        simulator.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+import argparse
+import time
+from typing import Optional
+
+import numpy as np
+
+from core.algorithms import (
+    AverageStrategy,
+    MedianStrategy,
+    MOutOfNStrategy,
+    MajorityStrategy,
+    AverageAdaptiveStrategy,
+)
+
+
+STRATEGY_TYPES = [
+    AverageStrategy,
+    MedianStrategy,
+    MOutOfNStrategy,
+    MajorityStrategy,
+    AverageAdaptiveStrategy,
+]
+
+
+def generate_samples(rows: int, sensors: int, seed: int) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    samples = 20.0 + rng.normal(0.0, 0.8, (rows, sensors))
+    faulty = rng.random((rows, sensors)) < 0.2
+    samples[faulty] += rng.normal(0.0, 6.0, faulty.sum())
+    samples[rng.random((rows, sensors)) < 0.05] = np.nan
+    return np.round(samples, 1)
+
+
+def vote_per_sample(strategy, samples: np.ndarray) -> np.ndarray:
+    # The path Voter.vote takes, one sample at a time
+    results = np.full(len(samples), np.nan)
+    historical: Optional[float] = None
+    for row, values in enumerate(samples):
+        result = strategy.vote(values[~np.isnan(values)].tolist(), historical)
+        if result is not None:
+            results[row] = result
+            historical = result
+    return results
+
+
+def timed(vote, samples: np.ndarray) -> tuple[np.ndarray, float]:
+    start = time.perf_counter()
+    results = vote(samples)
+    return results, (time.perf_counter() - start) / max(1, len(samples))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="vote_batch against the per-sample vote path")
+    # Zero sensors is included on purpose: every strategy must give NaN rows, as vote([]) gives None
+    parser.add_argument("--sensors", type=int, nargs="+", default=[0, 1, 6, 64])
+    parser.add_argument("--rows", type=int, default=500)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    
+    print(f"{'strategy':>20} {'sensors':>8} {'vote [us]':>10} {'batch [us]':>11} {'mismatches':>11}")
+    
+    for sensors in args.sensors:
+        samples = generate_samples(args.rows, sensors, args.seed)
+        for strategy_type in STRATEGY_TYPES:
+            expected, per_sample = timed(lambda block: vote_per_sample(strategy_type(), block), samples)
+            actual, batch = timed(strategy_type().vote_batch, samples)
+            
+            mismatches = int(np.sum(~np.isclose(expected, actual, rtol=0.0, atol=1e-9, equal_nan=True)))
+            print(
+                f"{strategy_type().name:>20} {sensors:>8} {per_sample * 1e6:>10.1f} "
+                f"{batch * 1e6:>11.1f} {mismatches:>11}"
+            )
+
+
+if __name__ == "__main__":
+    main()
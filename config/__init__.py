@@ -3,6 +3,7 @@ from config.settings import (
     SensorSettings,
     ChartSettings,
     VotingSettings,
+    RecordingSettings,
 )
 
 __all__ = [
@@ -10,4 +11,5 @@ __all__ = [
     "SensorSettings",
     "ChartSettings",
     "VotingSettings",
+    "RecordingSettings",
 ]
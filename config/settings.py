@@ -15,6 +15,33 @@ class ModbusSettings:
     START_ADDRESS: int = 0
     FUNCTION_CODE: int = 3
     ERROR_VALUE: int = -2731
+    MAX_REGISTERS_PER_READ: int = 125
+    MAX_REGISTER_GAP: int = 0
+    TCP_HOST: str = ""
+    TCP_PORT: int = 502
+    RECONNECT_INITIAL_DELAY: float = 0.5
+    RECONNECT_MAX_DELAY: float = 30.0
+    RECONNECT_JITTER: float = 0.2
+    MAX_CONSECUTIVE_FAILURES: int = 5
+    WATCHDOG_TIMEOUT: float = 10.0
+    ADAPTIVE_TIMEOUT: bool = True
+    TIMEOUT_PERCENTILE: float = 99.0
+    TIMEOUT_MARGIN: float = 2.0
+    TIMEOUT_MIN_SAMPLES: int = 20
+    MIN_TIMEOUT_SLACK: float = 0.02
+    QUARANTINE_AFTER: int = 3
+    QUARANTINE_MAX_INTERVAL: int = 32
+    
+    # Optional multi-bus topology, e.g.
+    # [{"port": "COM3", "slaves": [{"address": 1, "num_sensors": 6}]}]
+    BUSES: list[dict] = field(default_factory=list)
+    
+    # Optional register layout of the device, relative to START_ADDRESS, e.g.
+    # [{"name": "temperature", "offset": 0, "count": 6, "divisor": 10,
+    #   "error_value": -2731, "quantity": "temperature"},
+    #  {"name": "humidity", "offset": 6, "type": "float32"},
+    #  {"name": "status", "offset": 8, "type": "uint16"}]
+    REGISTER_MAP: list[dict] = field(default_factory=list)
 
 
 @dataclass(frozen=True)
@@ -22,11 +49,17 @@ class SensorSettings:
     
     DEFAULT_NUM_SENSORS: int = 6
     MIN_SENSORS: int = 1
-    MAX_SENSORS: int = 6
+    MAX_SENSORS: int = 512
     DEFAULT_READING_FREQUENCY: float = 1.0
     MIN_READING_FREQUENCY: float = 0.1
     MAX_READING_FREQUENCY: float = 10.0
     TEMPERATURE_SCALE_FACTOR: float = 10.0
+    MISSED_READING_POLICY: str = "skip"
+    MAX_CATCH_UP_READINGS: int = 5
+    QUEUE_MAX_SIZE: int = 6000
+    QUEUE_POLICY: str = "drop_oldest"
+    SAMPLE_TRANSPORT: str = "ring"
+    ACQUISITION_MODE: str = "thread"
 
 
 @dataclass
@@ -73,6 +106,22 @@ class ChartSettings:
     DEFAULT_SMOOTHING_FACTOR: float = 1.0
     MIN_SMOOTHING_FACTOR: float = 0.05
     MAX_SMOOTHING_FACTOR: float = 1.0
+    
+    RENDER_MODE: str = "blit"
+    X_AXIS_HEADROOM: float = 0.25
+    Y_AXIS_MARGIN: float = 0.1
+    MIN_Y_AXIS_MARGIN: float = 0.5
+    
+    HISTORY_CAPACITY: int = 36000
+    SPILL_HISTORY: bool = True
+    HISTORY_MEMORY_LIMIT_MB: int = 64
+    
+    DECIMATION_METHOD: str = "minmax"
+    DECIMATION_POINTS_PER_PIXEL: float = 2.0
+    
+    GAP_THRESHOLD: float = 1.5
+    
+    MAX_INDIVIDUAL_LINES: int = 16
 
 
 @dataclass(frozen=True)
@@ -88,7 +137,18 @@ class VotingSettings:
     DEVIATION_THRESHOLD: float = 1.0
 
 
+@dataclass(frozen=True)
+class RecordingSettings:
+    
+    ENABLED: bool = False
+    DIRECTORY: str = "sessions"
+    SEGMENT_SIZE_MB: int = 256
+    FLUSH_INTERVAL: float = 1.0
+    MAX_PENDING: int = 6000
+
+
 MODBUS_SETTINGS: Final[ModbusSettings] = ModbusSettings()
 SENSOR_SETTINGS: Final[SensorSettings] = SensorSettings()
 CHART_SETTINGS: Final[ChartSettings] = ChartSettings()
 VOTING_SETTINGS: Final[VotingSettings] = VotingSettings()
+RECORDING_SETTINGS: Final[RecordingSettings] = RecordingSettings()
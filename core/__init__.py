@@ -1,4 +1,6 @@
 from core.interfaces import VotingStrategy, ModbusReader
+from core.sample_context import SampleContext
+from core.sample_record import SampleRecord
 from core.algorithms import (
     Voter,
     AverageStrategy,
@@ -11,6 +13,8 @@ from core.algorithms import (
 __all__ = [
     "VotingStrategy",
     "ModbusReader",
+    "SampleContext",
+    "SampleRecord",
     "Voter",
     "AverageStrategy",
     "MedianStrategy",
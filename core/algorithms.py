@@ -3,10 +3,15 @@ from typing import Optional
 
 import numpy as np
 
-from core.interfaces import VotingStrategy, StatefulVotingStrategy
+from core.interfaces import VotingStrategy, StatefulVotingStrategy, prepare_batch
+from core.sample_context import SampleContext
 from config.settings import VOTING_SETTINGS
 
 
+# Below this many readings the NumPy set-up costs more than the plain loops
+M_OUT_OF_N_VECTORIZE_FROM = 96
+
+
 class AverageStrategy(VotingStrategy):
     
     @property
@@ -14,9 +19,27 @@ class AverageStrategy(VotingStrategy):
         return "Average"
     
     def vote(self, data: list[float], historical_result: Optional[float] = None) -> Optional[float]:
-        if not data:
+        return self.vote_context(SampleContext(data), historical_result)
+    
+    def vote_context(
+        self,
+        context: SampleContext,
+        historical_result: Optional[float] = None,
+    ) -> Optional[float]:
+        if not context:
             return None
-        return float(np.average(data))
+        return context.mean
+    
+    def vote_batch(
+        self,
+        samples: np.ndarray,
+        mask: Optional[np.ndarray] = None,
+        historical_result: Optional[float] = None,
+    ) -> np.ndarray:
+        samples, mask = prepare_batch(samples, mask)
+        counts = mask.sum(axis=1)
+        totals = np.where(mask, samples, 0.0).sum(axis=1)
+        return np.divide(totals, counts, out=np.full(len(samples), np.nan), where=counts > 0)
 
 
 class MedianStrategy(VotingStrategy):
@@ -26,9 +49,28 @@ class MedianStrategy(VotingStrategy):
         return "Median"
     
     def vote(self, data: list[float], historical_result: Optional[float] = None) -> Optional[float]:
-        if not data:
+        return self.vote_context(SampleContext(data), historical_result)
+    
+    def vote_context(
+        self,
+        context: SampleContext,
+        historical_result: Optional[float] = None,
+    ) -> Optional[float]:
+        if not context:
             return None
-        return float(np.median(data))
+        return context.median
+    
+    def vote_batch(
+        self,
+        samples: np.ndarray,
+        mask: Optional[np.ndarray] = None,
+        historical_result: Optional[float] = None,
+    ) -> np.ndarray:
+        samples, mask = prepare_batch(samples, mask)
+        results = np.full(len(samples), np.nan)
+        has_data = mask.any(axis=1)
+        results[has_data] = np.nanmedian(np.where(mask, samples, np.nan)[has_data], axis=1)
+        return results
 
 
 class MOutOfNStrategy(VotingStrategy):
@@ -40,104 +82,123 @@ class MOutOfNStrategy(VotingStrategy):
     ):
         self._threshold = threshold
         self._history_threshold = history_threshold
+        self._object_buffer = np.empty(0, dtype=np.intp)
+        self._unassigned_buffer = np.empty(0, dtype=bool)
     
     @property
     def name(self) -> str:
         return "Advanced m out of n"
     
     def vote(self, data: list[float], historical_result: Optional[float] = None) -> Optional[float]:
-        if not data:
+        return self.vote_context(SampleContext(data), historical_result)
+    
+    def vote_context(
+        self,
+        context: SampleContext,
+        historical_result: Optional[float] = None,
+    ) -> Optional[float]:
+        if not context:
             return None
         
-        n = len(data)
+        n = len(context)
         m = n // 2 + 1  # Majority threshold
-        weights = [1] * n  # Equal weights for all sensors
+        if n < M_OUT_OF_N_VECTORIZE_FROM:
+            return self._vote_sequential(context.data, m, historical_result)
         
-        object_list: list[Optional[float]] = [None] * n
-        tallies_list: list[float] = [0] * n
+        values = context.values
+        objects = self._candidate_pass(context)
         
-        # Initialize with first reading
-        object_list[0] = data[0]
-        tallies_list[0] = weights[0]
+        # Second pass: count votes and check for majority. A candidate reaches
+        # the majority at the first (reading, candidate) pair in row-major
+        # order whose running tally hits m, exactly as the sequential loop did.
+        distances = np.stack([context.distances_from(index) for index in objects], axis=1)
+        matches = distances <= self._threshold
+        tallies = np.cumsum(matches, axis=0)
+        majority = matches & (tallies >= m)
         
-        # Process remaining readings
-        for i in range(1, n):
-            x_i = data[i]
-            w_i = weights[i]
-            matched_index = self._find_matching_object(x_i, object_list, tallies_list, n)
-            
-            if matched_index != -1:
-                tallies_list[matched_index] += w_i
-            else:
-                self._add_or_replace_object(x_i, w_i, object_list, tallies_list, n)
-        
-        # Second pass: count votes and check for majority
-        tallies_list = [0] * n
-        for i in range(n):
-            x_i = data[i]
-            w_i = weights[i]
-            for j in range(n):
-                if object_list[j] is not None and abs(x_i - object_list[j]) <= self._threshold:
-                    tallies_list[j] += w_i
-                    if tallies_list[j] >= m:
-                        return object_list[j]
+        if majority.any():
+            _, object_index = np.unravel_index(np.argmax(majority), majority.shape)
+            return float(values[objects[object_index]])
         
         # Fallback to historical result
-        return self._fallback_to_history(data, historical_result)
-    
-    def _find_matching_object(
-        self,
-        value: float,
-        object_list: list[Optional[float]],
-        tallies_list: list[float],
-        n: int,
-    ) -> int:
-        for j in range(n):
-            if object_list[j] is not None and tallies_list[j] != 0:
-                if abs(value - object_list[j]) <= self._threshold:
-                    return j
-        return -1
-    
-    def _add_or_replace_object(
-        self,
-        value: float,
-        weight: float,
-        object_list: list[Optional[float]],
-        tallies_list: list[float],
-        n: int,
-    ) -> None:
-        for j in range(n):
-            if tallies_list[j] == 0:
-                object_list[j] = value
-                tallies_list[j] = weight
-                return
-        
-        min_val = min(tallies_list)
-        min_index = tallies_list.index(min_val)
-        
-        if weight <= min_val:
-            for j in range(n):
-                tallies_list[j] = max(0, tallies_list[j] - weight)
-        else:
-            object_list[min_index] = value
-            tallies_list[min_index] = weight
-            for j in range(n):
-                tallies_list[j] = max(0, tallies_list[j] - min_val)
+        return self._fallback_to_history(values, historical_result)
     
-    def _fallback_to_history(
+    def _vote_sequential(
         self,
         data: list[float],
+        m: int,
         historical_result: Optional[float],
     ) -> Optional[float]:
+        # The same two passes as below on plain floats: each reading joins
+        # the oldest candidate within the threshold or opens a new one
+        threshold = self._threshold
+        objects: list[float] = []
+        for value in data:
+            for candidate in objects:
+                if abs(value - candidate) <= threshold:
+                    break
+            else:
+                objects.append(value)
+        
+        tallies = [0] * len(objects)
+        for value in data:
+            for j, candidate in enumerate(objects):
+                if abs(value - candidate) <= threshold:
+                    tallies[j] += 1
+                    if tallies[j] >= m:
+                        return candidate
+        
         if historical_result is None:
             return None
         
         distances = [abs(historical_result - reading) for reading in data]
         min_distance = min(distances)
-        min_index = distances.index(min_distance)
-        
         if min_distance <= self._history_threshold:
-            return data[min_index]
+            return data[distances.index(min_distance)]
+        return None
+    
+    def _candidate_pass(self, context: SampleContext) -> np.ndarray:
+        n = len(context)
+        if len(self._object_buffer) != n:
+            self._object_buffer = np.empty(n, dtype=np.intp)
+            self._unassigned_buffer = np.empty(n, dtype=bool)
+        
+        # Every reading carries weight 1 and there are as many slots as readings,
+        # so a free slot always exists and tallies never drop back to zero. Each
+        # reading therefore joins the oldest candidate within the threshold or
+        # opens the next slot. Opening candidates in reading order and claiming
+        # every reading they cover reproduces that assignment with one
+        # vectorized step per candidate instead of one Python loop per reading.
+        objects = self._object_buffer
+        unassigned = self._unassigned_buffer
+        unassigned.fill(True)
+        
+        count = 0
+        while True:
+            first = int(np.argmax(unassigned))
+            if not unassigned[first]:
+                break
+            
+            objects[count] = first
+            count += 1
+            unassigned &= context.distances_from(first) > self._threshold
+            unassigned[first] = False
+        
+        return objects[:count]
+    
+    def _fallback_to_history(
+        self,
+        values: np.ndarray,
+        historical_result: Optional[float],
+    ) -> Optional[float]:
+        if historical_result is None:
+            return None
+        
+        distances = np.abs(historical_result - values)
+        min_index = int(np.argmin(distances))
+        
+        if distances[min_index] <= self._history_threshold:
+            return float(values[min_index])
         return None
 
 
@@ -151,33 +212,84 @@ class MajorityStrategy(VotingStrategy):
         return "Majority"
     
     def vote(self, data: list[float], historical_result: Optional[float] = None) -> Optional[float]:
-        if not data:
+        return self.vote_context(SampleContext(data), historical_result)
+    
+    def vote_context(
+        self,
+        context: SampleContext,
+        historical_result: Optional[float] = None,
+    ) -> Optional[float]:
+        if not context:
             return None
         
-        majority_threshold = math.ceil((len(data) + 1) / 2)
-        sorted_data = sorted(data)
+        majority_threshold = math.ceil((len(context) + 1) / 2)
+        sorted_data = context.sorted_values
+        
+        group = self._find_majority_group(sorted_data, majority_threshold)
+        if group is None:
+            return None
+        
+        start, end = group
+        return float(np.average(sorted_data[start:end]))
+    
+    def vote_batch(
+        self,
+        samples: np.ndarray,
+        mask: Optional[np.ndarray] = None,
+        historical_result: Optional[float] = None,
+    ) -> np.ndarray:
+        samples, mask = prepare_batch(samples, mask)
+        rows, n = samples.shape
+        results = np.full(rows, np.nan)
+        if n == 0:
+            return results
+        
+        # Missing readings sort to the end of each row as +inf
+        sorted_data = np.sort(np.where(mask, samples, np.inf), axis=1)
+        counts = mask.sum(axis=1)
+        majority_thresholds = (counts + 2) // 2
+        
+        positions = np.arange(n)
+        window_ends = positions[np.newaxis, :] + majority_thresholds[:, np.newaxis] - 1
+        valid_starts = window_ends < counts[:, np.newaxis]
+        
+        with np.errstate(invalid="ignore"):
+            window_spans = np.take_along_axis(sorted_data, np.minimum(window_ends, n - 1), axis=1) - sorted_data
+            has_majority = valid_starts & (window_spans <= self._threshold)
+            
+            found = has_majority.any(axis=1) & (counts > 0)
+            starts = np.argmax(has_majority, axis=1)
+            group_starts = np.take_along_axis(sorted_data, starts[:, np.newaxis], axis=1)
+            members = (
+                (positions[np.newaxis, :] >= starts[:, np.newaxis])
+                & (positions[np.newaxis, :] < counts[:, np.newaxis])
+                & (sorted_data - group_starts <= self._threshold)
+            )
         
+        totals = np.where(members, sorted_data, 0.0).sum(axis=1)
+        sizes = members.sum(axis=1)
+        results[found] = totals[found] / sizes[found]
+        return results
+    
+    def _find_majority_group(
+        self,
+        sorted_data: np.ndarray,
+        majority_threshold: int,
+    ) -> Optional[tuple[int, int]]:
         n = len(sorted_data)
-        distance = np.zeros((n, n))
-        for i in range(n):
-            for j in range(i + 1, n):
-                distance[i, j] = abs(sorted_data[i] - sorted_data[j])
-        
-        groups_list: list[list[float]] = []
-        for i in range(n):
-            group = [sorted_data[i]]
-            for j in range(i + 1, n):
-                if distance[i, j] <= self._threshold:
-                    group.append(sorted_data[j])
-                else:
-                    break
-            groups_list.append(group)
         
-        for group in groups_list:
-            if len(group) >= majority_threshold:
-                return float(np.average(group))
+        # Distances grow with the index in sorted data, so the group opened at i
+        # reaches the majority exactly when its (majority - 1)-th neighbour is
+        # still within the threshold.
+        window_spans = sorted_data[majority_threshold - 1:] - sorted_data[:n - majority_threshold + 1]
+        within = window_spans <= self._threshold
+        if not within.any():
+            return None
         
-        return None
+        start = int(np.argmax(within))
+        distances = sorted_data[start:] - sorted_data[start]
+        end = start + int(np.searchsorted(distances, self._threshold, side="right"))
+        return start, end
 
 
 class AverageAdaptiveStrategy(StatefulVotingStrategy):
@@ -189,8 +301,8 @@ class AverageAdaptiveStrategy(StatefulVotingStrategy):
     ):
         self._max_error_count = max_error_count
         self._deviation_threshold = deviation_threshold
-        self._active_status_list: list[bool] = []
-        self._error_count: list[int] = []
+        self._active_status = np.ones(0, dtype=bool)
+        self._error_count = np.zeros(0, dtype=np.int64)
     
     @property
     def name(self) -> str:
@@ -198,109 +310,163 @@ class AverageAdaptiveStrategy(StatefulVotingStrategy):
     
     @property
     def active_status_list(self) -> list[bool]:
-        return self._active_status_list.copy()
+        return self._active_status.tolist()
     
     @property
     def error_count(self) -> list[int]:
-        return self._error_count.copy()
+        return self._error_count.tolist()
     
     def reset(self) -> None:
-        self._active_status_list.clear()
-        self._error_count.clear()
+        self._active_status = np.ones(0, dtype=bool)
+        self._error_count = np.zeros(0, dtype=np.int64)
     
     def vote(self, data: list[float], historical_result: Optional[float] = None) -> Optional[float]:
-        if not data:
+        return self.vote_context(SampleContext(data), historical_result)
+    
+    def vote_context(
+        self,
+        context: SampleContext,
+        historical_result: Optional[float] = None,
+    ) -> Optional[float]:
+        if not context:
             return None
         
-        self._ensure_state_initialized(len(data))
+        return self._step(context.values, historical_result)
+    
+    def vote_batch(
+        self,
+        samples: np.ndarray,
+        mask: Optional[np.ndarray] = None,
+        historical_result: Optional[float] = None,
+    ) -> np.ndarray:
+        samples, mask = prepare_batch(samples, mask)
+        rows, sensor_count = samples.shape
+        results = np.full(rows, np.nan)
+        if sensor_count == 0:
+            return results
+        
+        counts = mask.sum(axis=1)
+        complete = counts == sensor_count
+        
+        # While every sensor is active and none of them fails, each step returns
+        # the plain row average, which also becomes the next historical result.
+        # Those steady rows can be resolved for the whole matrix at once and
+        # skipped; the state machine only has to step through the others.
+        with np.errstate(invalid="ignore"):
+            steady_averages = np.cumsum(samples, axis=1)[:, -1] / sensor_count
+            previous_averages = np.roll(steady_averages, 1)
+            deviates_from_average = np.abs(samples - steady_averages[:, np.newaxis]) > self._deviation_threshold
+            deviates_from_history = np.abs(samples - previous_averages[:, np.newaxis]) > self._deviation_threshold
+        steady = complete & ~(deviates_from_average & deviates_from_history).any(axis=1)
+        unsteady_rows = np.flatnonzero(~steady)
         
-        average = self._calculate_active_average(data)
+        row = 0
+        while row < rows:
+            if not counts[row]:
+                row += 1
+                continue
+            
+            data = samples[row] if complete[row] else samples[row][mask[row]]
+            all_active = complete[row] and self._all_active(sensor_count)
+            
+            result = self._step(data, historical_result)
+            if result is not None:
+                results[row] = result
+                historical_result = result
+            row += 1
+            
+            if all_active and self._all_active(sensor_count):
+                next_unsteady = np.searchsorted(unsteady_rows, row)
+                end = unsteady_rows[next_unsteady] if next_unsteady < len(unsteady_rows) else rows
+                if end > row:
+                    results[row:end] = steady_averages[row:end]
+                    historical_result = float(steady_averages[end - 1])
+                    self._error_count[:sensor_count] = 0
+                    row = end
+        
+        return results
+    
+    def _all_active(self, sensor_count: int) -> bool:
+        return len(self._active_status) >= sensor_count and bool(self._active_status[:sensor_count].all())
+    
+    def _step(self, data: np.ndarray, historical_result: Optional[float]) -> Optional[float]:
+        sensor_count = len(data)
+        self._ensure_state_initialized(sensor_count)
+        
+        # Views into the persistent state, updated in place
+        active = self._active_status[:sensor_count]
+        errors = self._error_count[:sensor_count]
+        
+        average = self._calculate_active_average(data, active)
         
         if average is None:
-            return self._handle_all_disabled(data)
+            return self._handle_all_disabled(data, active, errors)
         
-        self._update_sensor_status(data, average, historical_result)
+        self._update_sensor_status(data, active, errors, average, historical_result)
         
         return average
     
     def _ensure_state_initialized(self, sensor_count: int) -> None:
-        current_count = len(self._active_status_list)
-        if current_count < sensor_count:
-            for _ in range(sensor_count - current_count):
-                self._active_status_list.append(True)
-                self._error_count.append(0)
-    
-    def _calculate_active_average(self, data: list[float]) -> Optional[float]:
-        total_value = 0.0
-        counter = 0
-        
-        for i, reading in enumerate(data):
-            if self._active_status_list[i]:
-                total_value += reading
-                counter += 1
-        
-        return total_value / counter if counter > 0 else None
-    
-    def _handle_all_disabled(self, data: list[float]) -> Optional[float]:
-        average = sum(data) / len(data)
-        
-        for i, reading in enumerate(data):
-            if abs(reading - average) <= self._deviation_threshold:
-                self._error_count[i] -= 1
-                if self._error_count[i] <= 0:
-                    self._active_status_list[i] = True
-            else:
-                self._error_count[i] = self._max_error_count
-        
-        return None
+        missing = sensor_count - len(self._active_status)
+        if missing > 0:
+            self._active_status = np.concatenate((self._active_status, np.ones(missing, dtype=bool)))
+            self._error_count = np.concatenate((self._error_count, np.zeros(missing, dtype=np.int64)))
+    
+    def _calculate_active_average(self, data: np.ndarray, active: np.ndarray) -> Optional[float]:
+        counter = np.count_nonzero(active)
+        if counter == 0:
+            return None
+        return float(self._sequential_sum(data[active]) / counter)
     
-    def _update_sensor_status(
+    @staticmethod
+    def _sequential_sum(values: np.ndarray) -> float:
+        # cumsum adds strictly left to right, unlike np.sum's pairwise summation,
+        # which keeps averages (and so sensor decisions) bit-identical to a plain loop
+        return float(np.cumsum(values)[-1])
+    
+    def _handle_all_disabled(
         self,
-        data: list[float],
-        average: float,
-        historical_result: Optional[float],
+        data: np.ndarray,
+        active: np.ndarray,
+        errors: np.ndarray,
     ) -> None:
-        for i, reading in enumerate(data):
-            if self._active_status_list[i]:
-                self._update_active_sensor(i, reading, average, historical_result)
-            else:
-                self._try_recover_sensor(i, reading, average)
+        average = self._sequential_sum(data) / len(data)
+        close = np.abs(data - average) <= self._deviation_threshold
+        
+        errors[close] -= 1
+        active[close & (errors <= 0)] = True
+        errors[~close] = self._max_error_count
+        
+        return None
     
-    def _update_active_sensor(
+    def _update_sensor_status(
         self,
-        index: int,
-        reading: float,
+        data: np.ndarray,
+        active: np.ndarray,
+        errors: np.ndarray,
         average: float,
         historical_result: Optional[float],
     ) -> None:
-        deviates_from_average = abs(reading - average) > self._deviation_threshold
-        deviates_from_history = (
-            historical_result is not None
-            and abs(reading - historical_result) > self._deviation_threshold
-        )
+        deviates_from_average = np.abs(data - average) > self._deviation_threshold
         
         if historical_result is not None:
-            if deviates_from_history and deviates_from_average:
-                self._error_count[index] += 1
-                if self._error_count[index] >= self._max_error_count:
-                    self._active_status_list[index] = False
-            else:
-                self._error_count[index] = 0
+            deviates_from_history = np.abs(data - historical_result) > self._deviation_threshold
+            failing = deviates_from_history & deviates_from_average
         else:
-            if deviates_from_average:
-                self._error_count[index] += 1
-                if self._error_count[index] >= self._max_error_count:
-                    self._active_status_list[index] = False
-            else:
-                self._error_count[index] = 0
-    
-    def _try_recover_sensor(self, index: int, reading: float, average: float) -> None:
-        if abs(reading - average) <= self._deviation_threshold:
-            self._error_count[index] -= 1
-            if self._error_count[index] <= 0:
-                self._active_status_list[index] = True
-        else:
-            self._error_count[index] = self._max_error_count
+            failing = deviates_from_average
+        
+        # Active sensors collect errors and are disabled at the limit, disabled
+        # sensors count down while they agree with the average again
+        errors[:] = np.where(
+            active,
+            np.where(failing, errors + 1, 0),
+            np.where(deviates_from_average, self._max_error_count, errors - 1),
+        )
+        active[:] = np.where(
+            active,
+            ~failing | (errors < self._max_error_count),
+            ~deviates_from_average & (errors <= 0),
+        )
 
 
 class Voter:
@@ -329,10 +495,11 @@ class Voter:
     
     def vote(self, data: list[float]) -> dict[str, Optional[float]]:
         results: dict[str, Optional[float]] = {}
+        context = SampleContext(data)
         
         for strategy in self._strategies:
             historical = self._historical_results.get(strategy.name)
-            result = strategy.vote(data, historical)
+            result = strategy.vote_context(context, historical)
             results[strategy.name] = result
             
             if result is not None:
@@ -340,6 +507,25 @@ class Voter:
         
         return results
     
+    def vote_batch(
+        self,
+        samples: np.ndarray,
+        mask: Optional[np.ndarray] = None,
+    ) -> dict[str, np.ndarray]:
+        samples, mask = prepare_batch(samples, mask)
+        results: dict[str, np.ndarray] = {}
+        
+        for strategy in self._strategies:
+            historical = self._historical_results.get(strategy.name)
+            result = strategy.vote_batch(samples, mask, historical)
+            results[strategy.name] = result
+            
+            voted = np.flatnonzero(~np.isnan(result))
+            if len(voted):
+                self._historical_results[strategy.name] = float(result[voted[-1]])
+        
+        return results
+    
     def reset(self) -> None:
         self._historical_results.clear()
         for strategy in self._strategies:
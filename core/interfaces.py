@@ -1,7 +1,15 @@
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 import queue
 
+import numpy as np
+
+from core.sample_context import SampleContext
+
+if TYPE_CHECKING:
+    # Only for the hint: core does not depend on the utils layer
+    from utils.spsc_ring import SpscRing
+
 
 class VotingStrategy(ABC):
     
@@ -14,10 +22,52 @@ class VotingStrategy(ABC):
     def vote(self, data: list[float], historical_result: Optional[float] = None) -> Optional[float]:
         pass
     
+    def vote_context(
+        self,
+        context: SampleContext,
+        historical_result: Optional[float] = None,
+    ) -> Optional[float]:
+        return self.vote(context.data, historical_result)
+    
+    def vote_batch(
+        self,
+        samples: np.ndarray,
+        mask: Optional[np.ndarray] = None,
+        historical_result: Optional[float] = None,
+    ) -> np.ndarray:
+        samples, mask = prepare_batch(samples, mask)
+        results = np.full(len(samples), np.nan)
+        
+        for row in range(len(samples)):
+            result = self.vote(samples[row][mask[row]].tolist(), historical_result)
+            if result is not None:
+                results[row] = result
+                historical_result = result
+        
+        return results
+    
     def reset(self) -> None:
         pass
 
 
+def prepare_batch(
+    samples: np.ndarray,
+    mask: Optional[np.ndarray] = None,
+) -> tuple[np.ndarray, np.ndarray]:
+    samples = np.asarray(samples, dtype=np.float64)
+    if samples.ndim != 2:
+        raise ValueError("Sample batch must be a 2D (samples x sensors) array")
+    
+    if mask is None:
+        mask = ~np.isnan(samples)
+    else:
+        mask = np.asarray(mask, dtype=bool)
+        if mask.shape != samples.shape:
+            raise ValueError("Mask shape must match the sample batch shape")
+    
+    return samples, mask
+
+
 class StatefulVotingStrategy(VotingStrategy):
     
     @abstractmethod
@@ -50,6 +100,9 @@ class DataQueueProvider(ABC):
     def get_data_queue(self) -> queue.Queue:
         pass
     
+    def get_sample_ring(self) -> Optional["SpscRing"]:
+        return None
+    
     @abstractmethod
     def start(self) -> None:
         pass
@@ -0,0 +1,55 @@
+from functools import cached_property
+from typing import Union
+
+import numpy as np
+
+
+class SampleContext:
+    
+    def __init__(self, data: Union[list[float], np.ndarray]):
+        self._data = data
+        self._distance_rows: dict[int, np.ndarray] = {}
+    
+    def __len__(self) -> int:
+        return len(self._data)
+    
+    def __bool__(self) -> bool:
+        return len(self._data) > 0
+    
+    @cached_property
+    def data(self) -> list[float]:
+        if isinstance(self._data, np.ndarray):
+            return self._data.tolist()
+        return self._data
+    
+    @cached_property
+    def values(self) -> np.ndarray:
+        return np.asarray(self._data, dtype=np.float64)
+    
+    @cached_property
+    def sorted_values(self) -> np.ndarray:
+        return np.sort(self.values)
+    
+    @cached_property
+    def mean(self) -> float:
+        return float(np.average(self.values))
+    
+    @cached_property
+    def median(self) -> float:
+        return float(np.median(self.values))
+    
+    @cached_property
+    def pairwise_distances(self) -> np.ndarray:
+        return np.abs(self.values[:, np.newaxis] - self.values[np.newaxis, :])
+    
+    def distances_from(self, index: int) -> np.ndarray:
+        # Reuse the full matrix when another strategy already paid for it,
+        # otherwise compute (and share) only the rows that are asked for
+        if "pairwise_distances" in self.__dict__:
+            return self.pairwise_distances[index]
+        
+        row = self._distance_rows.get(index)
+        if row is None:
+            row = np.abs(self.values[index] - self.values)
+            self._distance_rows[index] = row
+        return row
@@ -0,0 +1,91 @@
+import time
+from typing import Optional
+
+import numpy as np
+
+
+# Flat row layout used by array transports: header columns, then the values
+ROW_HEADER_WIDTH = 4
+
+
+class SampleRecord:
+    
+    __slots__ = ("sequence", "monotonic_time", "wall_time", "values", "mask")
+    
+    def __init__(
+        self,
+        sequence: int,
+        monotonic_time: float,
+        wall_time: float,
+        values: np.ndarray,
+        mask: np.ndarray,
+    ):
+        self.sequence = sequence
+        self.monotonic_time = monotonic_time
+        self.wall_time = wall_time
+        self.values = values
+        self.mask = mask
+    
+    @classmethod
+    def from_readings(
+        cls,
+        sequence: int,
+        monotonic_time: float,
+        wall_time: float,
+        readings: list[Optional[float]],
+    ) -> "SampleRecord":
+        values = np.array([np.nan if reading is None else reading for reading in readings], dtype=np.float64)
+        return cls.from_values(sequence, monotonic_time, wall_time, values)
+    
+    @classmethod
+    def from_values(
+        cls,
+        sequence: int,
+        monotonic_time: float,
+        wall_time: float,
+        values: np.ndarray,
+    ) -> "SampleRecord":
+        return cls(sequence, monotonic_time, wall_time, values, ~np.isnan(values))
+    
+    def __len__(self) -> int:
+        return len(self.values)
+    
+    def __repr__(self) -> str:
+        return (
+            f"SampleRecord(sequence={self.sequence}, monotonic_time={self.monotonic_time:.6f}, "
+            f"values={self.readings()})"
+        )
+    
+    @classmethod
+    def from_row(cls, row: np.ndarray) -> "SampleRecord":
+        count = int(row[3])
+        values = row[ROW_HEADER_WIDTH:ROW_HEADER_WIDTH + count].copy()
+        return cls(int(row[0]), float(row[1]), float(row[2]), values, ~np.isnan(values))
+    
+    @staticmethod
+    def row_width(max_values: int) -> int:
+        return ROW_HEADER_WIDTH + max_values
+    
+    def write_row(self, row: np.ndarray) -> None:
+        # Invalid readings are already NaN in values, so the mask needs no column
+        count = len(self.values)
+        row[0] = self.sequence
+        row[1] = self.monotonic_time
+        row[2] = self.wall_time
+        row[3] = count
+        row[ROW_HEADER_WIDTH:ROW_HEADER_WIDTH + count] = self.values
+        if len(row) > ROW_HEADER_WIDTH + count:
+            row[ROW_HEADER_WIDTH + count:] = np.nan
+    
+    @property
+    def valid_values(self) -> np.ndarray:
+        return self.values[self.mask]
+    
+    def readings(self) -> list[Optional[float]]:
+        return [
+            value if valid else None
+            for value, valid in zip(self.values.tolist(), self.mask.tolist())
+        ]
+    
+    def latency(self, now: Optional[float] = None) -> float:
+        return (time.monotonic() if now is None else now) - self.monotonic_time
@@ -1,3 +1,44 @@
+from infrastructure.adaptive_timeout import AdaptiveTimeout, DeviceTimingStats
+from infrastructure.async_service import AsyncModbusService
+from infrastructure.async_transport import AsyncModbusDevice, AsyncRtuTransport, AsyncTcpTransport
+from infrastructure.loopback_device import LoopbackDevice, LoopbackTransport
 from infrastructure.modbus_service import ModbusService
+from infrastructure.polling_engine import BusConfig, PollingEngine, SlaveConfig
+from infrastructure.polling_service import PollingModbusService
+from infrastructure.process_service import ProcessModbusService
+from infrastructure.scheduler import DeadlineScheduler, SchedulerStats
+from infrastructure.replay_service import ReplayService
+from infrastructure.session_recorder import RecorderStats, SessionReader, SessionRecorder, SessionSegment
+from infrastructure.supervisor import ConnectionMonitor, ConnectionStats, ExponentialBackoff
+from infrastructure.tcp_reader import TcpConnectionPool, TcpModbusReader
+from infrastructure.tcp_simulator import ModbusTcpSimulator
 
-__all__ = ["ModbusService"]
+__all__ = [
+    "ModbusService",
+    "ProcessModbusService",
+    "PollingModbusService",
+    "PollingEngine",
+    "BusConfig",
+    "SlaveConfig",
+    "DeadlineScheduler",
+    "SchedulerStats",
+    "ConnectionMonitor",
+    "ConnectionStats",
+    "ExponentialBackoff",
+    "AdaptiveTimeout",
+    "DeviceTimingStats",
+    "AsyncModbusService",
+    "AsyncModbusDevice",
+    "AsyncRtuTransport",
+    "AsyncTcpTransport",
+    "LoopbackDevice",
+    "LoopbackTransport",
+    "TcpModbusReader",
+    "TcpConnectionPool",
+    "ModbusTcpSimulator",
+    "SessionRecorder",
+    "SessionReader",
+    "SessionSegment",
+    "RecorderStats",
+    "ReplayService",
+]
@@ -0,0 +1,155 @@
+import time
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+import numpy as np
+
+from config.settings import MODBUS_SETTINGS
+
+
+RTU_REQUEST_LENGTH = 8
+RTU_RESPONSE_OVERHEAD = 5
+RTU_SILENT_CHARACTERS = 7.0
+
+
+@dataclass(frozen=True)
+class DeviceTimingStats:
+    
+    timeout: float = MODBUS_SETTINGS.TIMEOUT
+    overhead_percentile: float = 0.0
+    samples: int = 0
+    timeouts: int = 0
+    consecutive_timeouts: int = 0
+    quarantined: bool = False
+    poll_interval: int = 1
+
+
+class AdaptiveTimeout:
+    
+    def __init__(
+        self,
+        baudrate: int = MODBUS_SETTINGS.BAUDRATE,
+        window: int = 256,
+        percentile: float = MODBUS_SETTINGS.TIMEOUT_PERCENTILE,
+        margin: float = MODBUS_SETTINGS.TIMEOUT_MARGIN,
+        min_samples: int = MODBUS_SETTINGS.TIMEOUT_MIN_SAMPLES,
+        quarantine_after: int = MODBUS_SETTINGS.QUARANTINE_AFTER,
+        max_poll_interval: int = MODBUS_SETTINGS.QUARANTINE_MAX_INTERVAL,
+        enabled: bool = MODBUS_SETTINGS.ADAPTIVE_TIMEOUT,
+        fallback: Optional["AdaptiveTimeout"] = None,
+    ):
+        parity_bits = 0 if MODBUS_SETTINGS.PARITY == "N" else 1
+        bits_per_character = 1 + MODBUS_SETTINGS.BYTESIZE + parity_bits + MODBUS_SETTINGS.STOPBITS
+        self._character_time = bits_per_character / baudrate
+        
+        # Response times are stored minus the wire time of their frames, so
+        # reads of different sizes feed one distribution
+        self._overheads = np.zeros(window)
+        self._count = 0
+        self._percentile = percentile
+        self._margin = margin
+        self._min_samples = min_samples
+        self._enabled = enabled
+        self._cached_overhead: Optional[float] = None
+        self._last_timeout = MODBUS_SETTINGS.TIMEOUT
+        # A slave that has never answered borrows the timing of its bus
+        self._fallback = fallback
+        
+        self._quarantine_after = quarantine_after
+        self._max_poll_interval = max_poll_interval
+        self._timeouts = 0
+        self._consecutive_timeouts = 0
+        self._quarantined = False
+        self._poll_interval = 1
+        self._cycles_until_poll = 0
+    
+    @property
+    def quarantined(self) -> bool:
+        return self._quarantined
+    
+    def frame_time(self, count: int) -> float:
+        characters = RTU_REQUEST_LENGTH + RTU_RESPONSE_OVERHEAD + 2 * count + RTU_SILENT_CHARACTERS
+        return characters * self._character_time
+    
+    def timeout_for(self, count: int) -> float:
+        overhead = self._overhead_percentile()
+        if not self._enabled or overhead is None:
+            return MODBUS_SETTINGS.TIMEOUT
+        
+        # Never below what the bytes physically need, never above the configured ceiling
+        timeout = self.frame_time(count) + max(overhead * self._margin, MODBUS_SETTINGS.MIN_TIMEOUT_SLACK)
+        return min(timeout, MODBUS_SETTINGS.TIMEOUT)
+    
+    def record_response(self, count: int, duration: float) -> None:
+        self._overheads[self._count % len(self._overheads)] = max(0.0, duration - self.frame_time(count))
+        self._count += 1
+        self._cached_overhead = None
+        if self._fallback is not None:
+            self._fallback.record_response(count, duration)
+        
+        self._consecutive_timeouts = 0
+        self._quarantined = False
+        self._poll_interval = 1
+        self._cycles_until_poll = 0
+    
+    def record_timeout(self) -> None:
+        self._timeouts += 1
+        self._consecutive_timeouts += 1
+        
+        if not self._quarantine_after or self._consecutive_timeouts < self._quarantine_after:
+            return
+        
+        # Each failed probe doubles the gap before the next one
+        if self._quarantined:
+            self._poll_interval = min(self._poll_interval * 2, self._max_poll_interval)
+        else:
+            self._quarantined = True
+            self._poll_interval = 2
+        self._cycles_until_poll = self._poll_interval
+    
+    def should_poll(self) -> bool:
+        if not self._quarantined:
+            return True
+        
+        self._cycles_until_poll -= 1
+        if self._cycles_until_poll > 0:
+            return False
+        
+        self._cycles_until_poll = self._poll_interval
+        return True
+    
+    def timed(
+        self,
+        read_block: Callable[[int, int], list[int]],
+        set_timeout: Callable[[float], None],
+    ) -> Callable[[int, int], list[int]]:
+        def read(start: int, count: int) -> list[int]:
+            self._last_timeout = self.timeout_for(count)
+            set_timeout(self._last_timeout)
+            started = time.monotonic()
+            registers = read_block(start, count)
+            self.record_response(count, time.monotonic() - started)
+            return registers
+        
+        return read
+    
+    def stats(self) -> DeviceTimingStats:
+        overhead = self._overhead_percentile()
+        return DeviceTimingStats(
+            timeout=self._last_timeout,
+            overhead_percentile=overhead or 0.0,
+            samples=min(self._count, len(self._overheads)),
+            timeouts=self._timeouts,
+            consecutive_timeouts=self._consecutive_timeouts,
+            quarantined=self._quarantined,
+            poll_interval=self._poll_interval,
+        )
+    
+    def _overhead_percentile(self) -> Optional[float]:
+        if self._count < self._min_samples:
+            return self._fallback._overhead_percentile() if self._fallback is not None else None
+        
+        if self._cached_overhead is None:
+            filled = self._overheads[:min(self._count, len(self._overheads))]
+            self._cached_overhead = float(np.percentile(filled, self._percentile))
+        return self._cached_overhead
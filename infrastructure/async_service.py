@@ -0,0 +1,205 @@
+import asyncio
+import logging
+import queue
+import time
+from typing import Optional
+
+import numpy as np
+
+from config.settings import MODBUS_SETTINGS, SENSOR_SETTINGS
+from core.sample_record import SampleRecord
+from infrastructure.async_transport import AsyncModbusDevice
+from infrastructure.modbus_service import ModbusService
+from infrastructure.session_recorder import SessionRecorder
+from infrastructure.supervisor import ExponentialBackoff
+
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncModbusService(ModbusService):
+    
+    def __init__(
+        self,
+        devices: list[AsyncModbusDevice],
+        num_sensors: int = SENSOR_SETTINGS.DEFAULT_NUM_SENSORS,
+        reading_frequency: float = SENSOR_SETTINGS.DEFAULT_READING_FREQUENCY,
+        transport: str = SENSOR_SETTINGS.SAMPLE_TRANSPORT,
+        recorder: Optional[SessionRecorder] = None,
+    ):
+        if not devices:
+            raise ValueError("Asynchronous service needs at least one device")
+        
+        self._devices = devices
+        self._transports = list({id(device.transport): device.transport for device in devices}.values())
+        self._total_sensors = sum(device.num_sensors for device in devices)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        
+        super().__init__(
+            num_sensors=min(num_sensors, self._total_sensors),
+            reading_frequency=reading_frequency,
+            transport=transport,
+            recorder=recorder,
+        )
+    
+    @property
+    def total_sensors(self) -> int:
+        return self._total_sensors
+    
+    @property
+    def max_sensors(self) -> int:
+        return min(self._total_sensors, SENSOR_SETTINGS.MAX_SENSORS)
+    
+    def connect(self) -> None:
+        pass
+    
+    def disconnect(self) -> None:
+        pass
+    
+    def is_connected(self) -> bool:
+        return any(transport.is_open() for transport in self._transports)
+    
+    def stop(self) -> None:
+        # The loop sleeps on an asyncio event, which stop_event cannot wake
+        loop, wakeup = self._loop, self._wakeup
+        if loop is not None and wakeup is not None:
+            try:
+                loop.call_soon_threadsafe(wakeup.set)
+            except RuntimeError:
+                pass
+        super().stop()
+    
+    def _reading_loop(self, generation: int) -> None:
+        try:
+            asyncio.run(self._run())
+        except Exception as e:
+            logger.error(f"Unexpected error in asynchronous reading loop: {e}")
+    
+    async def _run(self) -> None:
+        self._loop = asyncio.get_running_loop()
+        self._wakeup = asyncio.Event()
+        
+        try:
+            self._connection_monitor.connecting()
+            if not await self._open_with_backoff():
+                return
+            self._scheduler.reset()
+            failures = 0
+            
+            while not self._stop_event.is_set():
+                if not self._running_event.is_set():
+                    await self._loop.run_in_executor(None, self._running_event.wait)
+                    self._scheduler.reset()
+                
+                if self._stop_event.is_set():
+                    break
+                
+                with self._config_lock:
+                    period = self._reading_frequency
+                self._scheduler.set_period(period)
+                
+                delay = self._scheduler.time_until_next()
+                if delay > 0:
+                    try:
+                        await asyncio.wait_for(self._wakeup.wait(), delay)
+                    except asyncio.TimeoutError:
+                        pass
+                
+                if self._stop_event.is_set():
+                    break
+                self._scheduler.start_slot()
+                
+                sequence = self._sequence
+                self._sequence += 1
+                monotonic_time = time.monotonic()
+                wall_time = time.time()
+                
+                raw_values, failed_devices = await self._read_all()
+                failures = failures + 1 if failed_devices == len(self._devices) else 0
+                
+                if failures >= MODBUS_SETTINGS.MAX_CONSECUTIVE_FAILURES:
+                    # Nothing answers any more: reopen the transports from scratch
+                    logger.warning(f"{failures} cycles without any response, reconnecting")
+                    self._connection_monitor.connection_lost(ConnectionError("No device responded"))
+                    await self._close_transports()
+                    if not await self._open_with_backoff():
+                        break
+                    self._scheduler.reset()
+                    failures = 0
+                    continue
+                
+                try:
+                    record = SampleRecord(sequence, monotonic_time, wall_time, *self._parse(raw_values))
+                    self._record(record, raw_values)
+                    self._publish(record)
+                except queue.Full:
+                    self._sample_dropped(sequence)
+                except Exception as e:
+                    logger.error(f"Error reading Modbus data: {e}")
+        
+        finally:
+            await self._close_transports()
+            self._wakeup = None
+            self._loop = None
+    
+    async def _open_with_backoff(self) -> bool:
+        backoff = ExponentialBackoff()
+        
+        while not self._stop_event.is_set():
+            try:
+                await self._open_transports()
+                self._connection_monitor.connected()
+                return True
+            except ConnectionError as e:
+                delay = backoff.next_delay()
+                self._connection_monitor.attempt_failed(e, delay)
+                logger.warning(f"Connection attempt {backoff.attempt} failed, retrying in {delay:.1f}s: {e}")
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), delay)
+                except asyncio.TimeoutError:
+                    pass
+        
+        return False
+    
+    async def _open_transports(self) -> None:
+        results = await asyncio.gather(
+            *[transport.open() for transport in self._transports],
+            return_exceptions=True,
+        )
+        
+        for transport, result in zip(self._transports, results):
+            if isinstance(result, Exception):
+                logger.error(f"Failed to open {transport.name}: {result}")
+        
+        if not self.is_connected():
+            raise ConnectionError("No Modbus transport could be opened")
+    
+    async def _close_transports(self) -> None:
+        for transport in self._transports:
+            try:
+                await transport.close()
+            except Exception as e:
+                logger.warning(f"Error closing {transport.name}: {e}")
+    
+    async def _read_all(self) -> tuple[np.ndarray, int]:
+        # Every device is read concurrently; transports serialise what has to
+        # share a line, and a slow device only delays its own sensors
+        results = await asyncio.gather(
+            *[device.read() for device in self._devices],
+            return_exceptions=True,
+        )
+        
+        blocks = []
+        failed_devices = 0
+        for device, result in zip(self._devices, results):
+            if isinstance(result, BaseException):
+                failed_devices += 1
+                reason = "timeout" if isinstance(result, asyncio.TimeoutError) else result
+                logger.warning(f"{device.transport.name}, slave {device.slave}: {reason}")
+                result = np.full(device.num_sensors, MODBUS_SETTINGS.ERROR_VALUE, dtype=np.int64)
+            blocks.append(result)
+        
+        with self._config_lock:
+            num_sensors = self._num_sensors
+        return np.concatenate(blocks)[:num_sensors], failed_devices
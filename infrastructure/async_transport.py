@@ -0,0 +1,205 @@
+import asyncio
+import logging
+from typing import Optional
+
+import numpy as np
+import serial
+
+from config.settings import MODBUS_SETTINGS
+from infrastructure.modbus_frames import EXCEPTION_FLAG, MBAP_HEADER_LENGTH, ModbusFrames
+from infrastructure.register_plan import RegisterReadPlan
+
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncRtuTransport:
+    
+    def __init__(
+        self,
+        port: str = MODBUS_SETTINGS.PORT,
+        baudrate: int = MODBUS_SETTINGS.BAUDRATE,
+    ):
+        self._port = port
+        self._baudrate = baudrate
+        self._serial: Optional[serial.Serial] = None
+        self._lock: Optional[asyncio.Lock] = None
+        
+        character_time = 11 / baudrate
+        self._poll_interval = max(0.001, 2 * character_time)
+        self._frame_gap = 3.5 * character_time
+    
+    @property
+    def name(self) -> str:
+        return self._port
+    
+    async def open(self) -> None:
+        # RTU is half-duplex: one transaction per bus at a time
+        self._lock = asyncio.Lock()
+        try:
+            # timeout=0 makes reads return immediately with what has arrived
+            self._serial = serial.Serial(
+                self._port,
+                self._baudrate,
+                bytesize=MODBUS_SETTINGS.BYTESIZE,
+                parity=serial.PARITY_NONE,
+                stopbits=MODBUS_SETTINGS.STOPBITS,
+                timeout=0,
+            )
+            logger.info(f"Opened {self._port} for asynchronous Modbus RTU")
+        except serial.SerialException as e:
+            raise ConnectionError(f"Failed to open {self._port}: {e}") from e
+    
+    async def close(self) -> None:
+        if self._serial is not None:
+            self._serial.close()
+            self._serial = None
+    
+    def is_open(self) -> bool:
+        return self._serial is not None and self._serial.is_open
+    
+    async def request(self, slave: int, pdu: bytes, response_length: int, timeout: float) -> bytes:
+        if self._serial is None:
+            raise ConnectionError(f"{self._port} is not open")
+        
+        # The timeout starts once the bus is ours, so queueing behind a
+        # silent slave does not count against the next one
+        async with self._lock:
+            try:
+                self._serial.reset_input_buffer()
+                self._serial.write(ModbusFrames.rtu_frame(slave, pdu))
+                frame = await asyncio.wait_for(self._read_frame(1 + response_length + 2), timeout)
+            finally:
+                await asyncio.sleep(self._frame_gap)
+        
+        return ModbusFrames.rtu_pdu(frame, slave)
+    
+    async def _read_frame(self, expected_length: int) -> bytes:
+        buffer = bytearray()
+        while True:
+            waiting = self._serial.in_waiting
+            if waiting:
+                buffer += self._serial.read(waiting)
+            
+            if len(buffer) >= 5 and buffer[1] & EXCEPTION_FLAG:
+                return bytes(buffer[:5])
+            if len(buffer) >= expected_length:
+                return bytes(buffer[:expected_length])
+            
+            await asyncio.sleep(self._poll_interval)
+
+
+class AsyncTcpTransport:
+    
+    def __init__(self, host: str, port: int = 502):
+        self._host = host
+        self._port = port
+        self._reader: Optional[asyncio.StreamReader] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
+        self._receiver: Optional[asyncio.Task] = None
+        self._pending: dict[int, asyncio.Future] = {}
+        self._transaction_id = 0
+    
+    @property
+    def name(self) -> str:
+        return f"{self._host}:{self._port}"
+    
+    async def open(self) -> None:
+        try:
+            self._reader, self._writer = await asyncio.open_connection(self._host, self._port)
+        except OSError as e:
+            raise ConnectionError(f"Failed to connect to {self.name}: {e}") from e
+        
+        self._receiver = asyncio.create_task(self._receive())
+        logger.info(f"Connected to Modbus TCP gateway {self.name}")
+    
+    async def close(self) -> None:
+        if self._receiver is not None:
+            self._receiver.cancel()
+            self._receiver = None
+        
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+        self._fail_pending(ConnectionError(f"{self.name} closed"))
+    
+    def is_open(self) -> bool:
+        return self._writer is not None and not self._writer.is_closing()
+    
+    async def request(self, slave: int, pdu: bytes, response_length: int, timeout: float) -> bytes:
+        if not self.is_open():
+            raise ConnectionError(f"{self.name} is not connected")
+        
+        # Transactions are pipelined: responses are matched by id, not order
+        self._transaction_id = (self._transaction_id + 1) & 0xFFFF
+        transaction_id = self._transaction_id
+        future = asyncio.get_running_loop().create_future()
+        self._pending[transaction_id] = future
+        
+        try:
+            self._writer.write(ModbusFrames.mbap_frame(transaction_id, slave, pdu))
+            await self._writer.drain()
+            return await asyncio.wait_for(future, timeout)
+        finally:
+            self._pending.pop(transaction_id, None)
+    
+    async def _receive(self) -> None:
+        try:
+            while True:
+                header = await self._reader.readexactly(MBAP_HEADER_LENGTH)
+                transaction_id, length, _ = ModbusFrames.parse_mbap_header(header)
+                pdu = await self._reader.readexactly(length)
+                
+                future = self._pending.get(transaction_id)
+                if future is not None and not future.done():
+                    future.set_result(pdu)
+        except (asyncio.IncompleteReadError, OSError, ValueError) as e:
+            logger.warning(f"Modbus TCP connection to {self.name} lost: {e}")
+            self._fail_pending(ConnectionError(str(e)))
+            if self._writer is not None:
+                self._writer.close()
+    
+    def _fail_pending(self, error: Exception) -> None:
+        for future in self._pending.values():
+            if not future.done():
+                future.set_exception(error)
+        self._pending.clear()
+
+
+class AsyncModbusDevice:
+    
+    def __init__(
+        self,
+        transport,
+        slave: int,
+        num_sensors: int,
+        start_address: int = MODBUS_SETTINGS.START_ADDRESS,
+        timeout: float = MODBUS_SETTINGS.TIMEOUT,
+    ):
+        self._transport = transport
+        self._slave = slave
+        self._num_sensors = num_sensors
+        self._timeout = timeout
+        self._plan = RegisterReadPlan.contiguous(start_address, num_sensors)
+    
+    @property
+    def transport(self):
+        return self._transport
+    
+    @property
+    def slave(self) -> int:
+        return self._slave
+    
+    @property
+    def num_sensors(self) -> int:
+        return self._num_sensors
+    
+    async def read(self) -> np.ndarray:
+        results = []
+        for block in self._plan.blocks:
+            pdu = ModbusFrames.read_request_pdu(MODBUS_SETTINGS.FUNCTION_CODE, block.start, block.count)
+            response = await self._transport.request(self._slave, pdu, 2 + 2 * block.count, self._timeout)
+            results.append(
+                ModbusFrames.parse_read_response_pdu(response, MODBUS_SETTINGS.FUNCTION_CODE, block.count)
+            )
+        return self._plan.assemble(results)
@@ -0,0 +1,111 @@
+import asyncio
+import logging
+from typing import Optional
+
+import numpy as np
+
+from config.settings import MODBUS_SETTINGS, SENSOR_SETTINGS
+from infrastructure.modbus_frames import READ_HOLDING_REGISTERS, READ_INPUT_REGISTERS, ModbusFrames
+
+
+logger = logging.getLogger(__name__)
+
+
+ILLEGAL_FUNCTION = 1
+ILLEGAL_DATA_ADDRESS = 2
+
+
+class LoopbackDevice:
+    
+    def __init__(
+        self,
+        num_registers: int,
+        base_temperature: float = 21.0,
+        noise: float = 0.3,
+        latency: float = 0.005,
+        failure_rate: float = 0.0,
+        error_rate: float = 0.0,
+        seed: Optional[int] = None,
+    ):
+        self._num_registers = num_registers
+        self._base_temperature = base_temperature
+        self._noise = noise
+        self._latency = latency
+        self._failure_rate = failure_rate
+        self._error_rate = error_rate
+        self._rng = np.random.default_rng(seed)
+        # Each sensor gets its own offset so the channels are distinguishable
+        self._offsets = self._rng.uniform(-1.5, 1.5, num_registers)
+    
+    @property
+    def num_registers(self) -> int:
+        return self._num_registers
+    
+    @property
+    def latency(self) -> float:
+        return self._latency
+    
+    def registers(self) -> np.ndarray:
+        temperatures = self._base_temperature + self._offsets + self._rng.normal(0.0, self._noise, self._num_registers)
+        registers = np.round(temperatures * SENSOR_SETTINGS.TEMPERATURE_SCALE_FACTOR).astype(np.int64)
+        
+        if self._error_rate > 0:
+            registers[self._rng.random(self._num_registers) < self._error_rate] = MODBUS_SETTINGS.ERROR_VALUE
+        return registers
+    
+    def handle(self, pdu: bytes) -> Optional[bytes]:
+        # None means the device stays silent, as a disconnected slave would
+        if self._failure_rate > 0 and self._rng.random() < self._failure_rate:
+            return None
+        
+        function_code = pdu[0]
+        if function_code not in (READ_HOLDING_REGISTERS, READ_INPUT_REGISTERS):
+            return ModbusFrames.exception_pdu(function_code, ILLEGAL_FUNCTION)
+        
+        _, start_address, count = ModbusFrames.parse_read_request_pdu(pdu)
+        if start_address + count > self._num_registers:
+            return ModbusFrames.exception_pdu(function_code, ILLEGAL_DATA_ADDRESS)
+        
+        return ModbusFrames.read_response_pdu(function_code, self.registers()[start_address:start_address + count])
+
+
+class LoopbackTransport:
+    
+    def __init__(self, devices: dict[int, LoopbackDevice], name: str = "loopback"):
+        self._devices = devices
+        self._name = name
+        self._open = False
+        self._lock: Optional[asyncio.Lock] = None
+    
+    @property
+    def name(self) -> str:
+        return self._name
+    
+    async def open(self) -> None:
+        # Created here so the lock belongs to the loop that uses it
+        self._lock = asyncio.Lock()
+        self._open = True
+        logger.info(f"Opened {self._name} with {len(self._devices)} simulated slaves")
+    
+    async def close(self) -> None:
+        self._open = False
+    
+    def is_open(self) -> bool:
+        return self._open
+    
+    async def request(self, slave: int, pdu: bytes, response_length: int, timeout: float) -> bytes:
+        if not self._open:
+            raise ConnectionError(f"{self._name} is not open")
+        
+        async with self._lock:
+            device = self._devices.get(slave)
+            request = ModbusFrames.rtu_pdu(ModbusFrames.rtu_frame(slave, pdu), slave)
+            response = device.handle(request) if device is not None else None
+            
+            if response is None:
+                await asyncio.sleep(timeout)
+                raise asyncio.TimeoutError
+            
+            await asyncio.sleep(device.latency)
+        
+        return ModbusFrames.rtu_pdu(ModbusFrames.rtu_frame(slave, response), slave)
@@ -0,0 +1,98 @@
+import struct
+
+import numpy as np
+
+
+READ_HOLDING_REGISTERS = 3
+READ_INPUT_REGISTERS = 4
+EXCEPTION_FLAG = 0x80
+MBAP_HEADER_LENGTH = 7
+
+
+def _crc_table() -> list[int]:
+    table = []
+    for byte in range(256):
+        crc = byte
+        for _ in range(8):
+            crc = (crc >> 1) ^ 0xA001 if crc & 1 else crc >> 1
+        table.append(crc)
+    return table
+
+
+CRC_TABLE = _crc_table()
+
+
+class ModbusFrames:
+    
+    @staticmethod
+    def crc16(data: bytes) -> int:
+        crc = 0xFFFF
+        for byte in data:
+            crc = (crc >> 8) ^ CRC_TABLE[(crc ^ byte) & 0xFF]
+        return crc
+    
+    @staticmethod
+    def read_request_pdu(function_code: int, start_address: int, count: int) -> bytes:
+        return struct.pack(">BHH", function_code, start_address, count)
+    
+    @staticmethod
+    def read_response_pdu(function_code: int, registers: np.ndarray) -> bytes:
+        payload = np.asarray(registers, dtype=np.int64).astype(">u2").tobytes()
+        return struct.pack(">BB", function_code, len(payload)) + payload
+    
+    @staticmethod
+    def exception_pdu(function_code: int, exception_code: int) -> bytes:
+        return struct.pack(">BB", function_code | EXCEPTION_FLAG, exception_code)
+    
+    @staticmethod
+    def parse_read_request_pdu(pdu: bytes) -> tuple[int, int, int]:
+        if len(pdu) != 5:
+            raise ValueError(f"Read request PDU must be 5 bytes, got {len(pdu)}")
+        return struct.unpack(">BHH", pdu)
+    
+    @staticmethod
+    def parse_read_response_pdu(pdu: bytes, function_code: int, count: int) -> np.ndarray:
+        if len(pdu) >= 2 and pdu[0] == function_code | EXCEPTION_FLAG:
+            raise ValueError(f"Slave returned exception code {pdu[1]}")
+        
+        if len(pdu) < 2 or pdu[0] != function_code:
+            raise ValueError(f"Unexpected function code in response: {pdu[:1].hex()}")
+        
+        if pdu[1] != 2 * count or len(pdu) != 2 + 2 * count:
+            raise ValueError(f"Expected {count} registers, got {len(pdu) - 2} bytes")
+        
+        # Registers are signed on the wire (see MODBUS_SETTINGS.ERROR_VALUE)
+        return np.frombuffer(pdu, dtype=">i2", offset=2).astype(np.int64)
+    
+    @staticmethod
+    def rtu_frame(slave: int, pdu: bytes) -> bytes:
+        frame = bytes([slave]) + pdu
+        return frame + struct.pack("<H", ModbusFrames.crc16(frame))
+    
+    @staticmethod
+    def rtu_pdu(frame: bytes, slave: int) -> bytes:
+        if len(frame) < 4:
+            raise ValueError(f"RTU frame too short: {len(frame)} bytes")
+        
+        if ModbusFrames.crc16(frame[:-2]) != struct.unpack("<H", frame[-2:])[0]:
+            raise ValueError("RTU frame CRC mismatch")
+        
+        if frame[0] != slave:
+            raise ValueError(f"Response from slave {frame[0]}, expected {slave}")
+        
+        return frame[1:-2]
+    
+    @staticmethod
+    def rtu_read_response_length(count: int) -> int:
+        return 5 + 2 * count
+    
+    @staticmethod
+    def mbap_frame(transaction_id: int, unit: int, pdu: bytes) -> bytes:
+        return struct.pack(">HHHB", transaction_id, 0, len(pdu) + 1, unit) + pdu
+    
+    @staticmethod
+    def parse_mbap_header(header: bytes) -> tuple[int, int, int]:
+        transaction_id, protocol, length, unit = struct.unpack(">HHHB", header)
+        if protocol != 0:
+            raise ValueError(f"Unexpected MBAP protocol id {protocol}")
+        return transaction_id, length - 1, unit
@@ -5,16 +5,32 @@ import time
 from typing import Optional
 
 import minimalmodbus
+import numpy as np
 import serial
 
 from config.settings import MODBUS_SETTINGS, SENSOR_SETTINGS
-from core.interfaces import DataQueueProvider
+from core.interfaces import DataQueueProvider, ModbusReader
+from core.sample_record import SampleRecord
+from infrastructure.adaptive_timeout import AdaptiveTimeout, DeviceTimingStats
+from infrastructure.register_plan import RegisterReadPlan
+from infrastructure.scheduler import DeadlineScheduler, SchedulerStats
+from infrastructure.session_recorder import RecorderStats, SessionRecorder
+from infrastructure.supervisor import ConnectionMonitor, ConnectionStats, ExponentialBackoff
+from utils.bounded_queue import BoundedSampleQueue, QueueStats
 from utils.data_parser import DataParser
+from utils.register_map import QUANTITY_TEMPERATURE, DecodedRegisters, RegisterMap
+from utils.spsc_ring import SpscRing
 
 
 logger = logging.getLogger(__name__)
 
 
+TRANSPORT_QUEUE = "queue"
+TRANSPORT_RING = "ring"
+# While the consumer stays behind, drops are reported as totals this often [s]
+DROP_LOG_INTERVAL = 10.0
+
+
 class ModbusService(DataQueueProvider):
     
     def __init__(
@@ -24,27 +40,82 @@ class ModbusService(DataQueueProvider):
         baudrate: int = MODBUS_SETTINGS.BAUDRATE,
         num_sensors: int = SENSOR_SETTINGS.DEFAULT_NUM_SENSORS,
         reading_frequency: float = SENSOR_SETTINGS.DEFAULT_READING_FREQUENCY,
+        transport: str = SENSOR_SETTINGS.SAMPLE_TRANSPORT,
+        sample_ring: Optional[SpscRing] = None,
+        reader: Optional[ModbusReader] = None,
+        register_map: Optional[RegisterMap] = None,
+        recorder: Optional[SessionRecorder] = None,
     ):
+        if transport not in (TRANSPORT_QUEUE, TRANSPORT_RING):
+            raise ValueError(f"Unknown sample transport: {transport}")
+        
         self._port = port
         self._address = address
         self._baudrate = baudrate
         self._num_sensors = num_sensors
         self._reading_frequency = reading_frequency
         self._start_address = MODBUS_SETTINGS.START_ADDRESS
+        # With a register map the whole mapped range is read in one go and
+        # its temperature fields become the sensors
+        self._register_map = register_map
+        self._last_decoded: Optional[DecodedRegisters] = None
+        if register_map is not None:
+            self._num_sensors = min(num_sensors, register_map.quantity_count(QUANTITY_TEMPERATURE))
+            self._read_plan = RegisterReadPlan.contiguous(self._start_address, register_map.register_count)
+        else:
+            self._read_plan = RegisterReadPlan.contiguous(self._start_address, num_sensors)
+        self._timing = AdaptiveTimeout(baudrate)
         
+        # Without a reader the service talks RTU through minimalmodbus itself
+        self._reader = reader
         self._instrument: Optional[minimalmodbus.Instrument] = None
-        self._data_queue: queue.Queue[list[Optional[float]]] = queue.Queue()
+        self._data_queue: BoundedSampleQueue = BoundedSampleQueue(
+            SENSOR_SETTINGS.QUEUE_MAX_SIZE,
+            SENSOR_SETTINGS.QUEUE_POLICY,
+        )
+        self._sequence = 0
+        self._recorder = recorder
+        self._dropped_samples = 0
+        self._drops_logged = 0
+        self._drop_logged_at: Optional[float] = None
+        
+        self._sample_ring = sample_ring
+        if self._sample_ring is None and transport == TRANSPORT_RING:
+            self._sample_ring = SpscRing(
+                SENSOR_SETTINGS.QUEUE_MAX_SIZE,
+                SampleRecord.row_width(SENSOR_SETTINGS.MAX_SENSORS),
+                SENSOR_SETTINGS.QUEUE_POLICY,
+            )
         
         self._running_event = threading.Event()
         self._stop_event = threading.Event()
         self._read_thread: Optional[threading.Thread] = None
+        self._watchdog_thread: Optional[threading.Thread] = None
+        # A watchdog restart bumps the generation so a stalled thread that
+        # wakes up later knows it has been replaced
+        self._generation = 0
+        self._read_started: Optional[float] = None
+        self._connection_monitor = ConnectionMonitor()
         
         self._config_lock = threading.Lock()
+        
+        self._scheduler = DeadlineScheduler(
+            reading_frequency,
+            policy=SENSOR_SETTINGS.MISSED_READING_POLICY,
+            max_catch_up=SENSOR_SETTINGS.MAX_CATCH_UP_READINGS,
+        )
     
-    def get_data_queue(self) -> queue.Queue[list[Optional[float]]]:
+    def get_data_queue(self) -> queue.Queue[SampleRecord]:
         return self._data_queue
     
+    def get_sample_ring(self) -> Optional[SpscRing]:
+        return self._sample_ring
+    
     def connect(self) -> None:
+        if self._reader is not None:
+            self._reader.connect()
+            return
+        
         try:
             self._instrument = minimalmodbus.Instrument(self._port, self._address)
             self._instrument.serial.baudrate = self._baudrate
@@ -58,6 +129,10 @@ class ModbusService(DataQueueProvider):
             raise ConnectionError(f"Failed to connect to {self._port}: {e}") from e
     
     def disconnect(self) -> None:
+        if self._reader is not None:
+            self._reader.disconnect()
+            return
+        
         if self._instrument is not None:
             try:
                 if self._instrument.serial.is_open:
@@ -69,6 +144,9 @@ class ModbusService(DataQueueProvider):
                 self._instrument = None
     
     def is_connected(self) -> bool:
+        if self._reader is not None:
+            return self._reader.is_connected()
+        
         return (
             self._instrument is not None
             and self._instrument.serial.is_open
@@ -82,23 +160,33 @@ class ModbusService(DataQueueProvider):
         self._stop_event.clear()
         self._running_event.set()
         
-        self._read_thread = threading.Thread(
-            target=self._reading_loop,
-            name="ModbusReadThread",
+        self._start_reader()
+        self._watchdog_thread = threading.Thread(
+            target=self._watchdog_loop,
+            name="ModbusWatchdog",
             daemon=True,
         )
-        self._read_thread.start()
+        self._watchdog_thread.start()
+        if self._recorder is not None:
+            self._recorder.start()
         logger.info("Modbus reading thread started")
     
     def stop(self) -> None:
         self._stop_event.set()
         self._running_event.set()
         
+        if self._watchdog_thread is not None:
+            self._watchdog_thread.join(timeout=2.0)
+            self._watchdog_thread = None
+        
         if self._read_thread is not None:
             self._read_thread.join(timeout=2.0)
             self._read_thread = None
         
         self.disconnect()
+        self._connection_monitor.stopped()
+        if self._recorder is not None:
+            self._recorder.stop()
         logger.info("Modbus service stopped")
     
     def pause(self) -> None:
@@ -124,8 +212,10 @@ class ModbusService(DataQueueProvider):
         with self._config_lock:
             self._num_sensors = max(
                 SENSOR_SETTINGS.MIN_SENSORS,
-                min(num_sensors, SENSOR_SETTINGS.MAX_SENSORS),
+                min(num_sensors, self.max_sensors),
             )
+            if self._register_map is None:
+                self._read_plan = RegisterReadPlan.contiguous(self._start_address, self._num_sensors)
         logger.debug(f"Number of sensors updated to {self._num_sensors}")
     
     @property
@@ -133,57 +223,260 @@ class ModbusService(DataQueueProvider):
         with self._config_lock:
             return self._num_sensors
     
+    @property
+    def max_sensors(self) -> int:
+        # What the device side can actually deliver; update_num_sensors clamps to it
+        if self._register_map is not None:
+            return self._register_map.quantity_count(QUANTITY_TEMPERATURE)
+        return SENSOR_SETTINGS.MAX_SENSORS
+    
     @property
     def reading_frequency(self) -> float:
         with self._config_lock:
             return self._reading_frequency
     
-    def _reading_loop(self) -> None:
+    @property
+    def scheduler_stats(self) -> SchedulerStats:
+        return self._scheduler.stats()
+    
+    @property
+    def device_timing(self) -> DeviceTimingStats:
+        return self._timing.stats()
+    
+    @property
+    def connection_stats(self) -> ConnectionStats:
+        return self._connection_monitor.stats()
+    
+    @property
+    def recorder_stats(self) -> Optional[RecorderStats]:
+        return self._recorder.stats if self._recorder is not None else None
+    
+    @property
+    def queue_stats(self) -> QueueStats:
+        if self._sample_ring is not None:
+            return self._sample_ring.stats()
+        return self._data_queue.stats()
+    
+    def _start_reader(self) -> None:
+        self._generation += 1
+        self._read_started = None
+        self._read_thread = threading.Thread(
+            target=self._reading_loop,
+            args=(self._generation,),
+            name="ModbusReadThread",
+            daemon=True,
+        )
+        self._read_thread.start()
+    
+    def _is_current(self, generation: int) -> bool:
+        return generation == self._generation and not self._stop_event.is_set()
+    
+    def _reading_loop(self, generation: int) -> None:
+        backoff = ExponentialBackoff()
+        self._connection_monitor.connecting()
+        
         try:
-            self.connect()
-            
-            while not self._stop_event.is_set():
-                self._running_event.wait()
-                
-                if self._stop_event.is_set():
-                    break
-                
+            while self._is_current(generation):
                 try:
-                    raw_values = self._read_registers()
-                    parsed_data = DataParser.parse_temperature_registers(raw_values)
-                    self._data_queue.put(parsed_data)
-                except minimalmodbus.NoResponseError as e:
-                    logger.warning(f"No response from Modbus device: {e}")
-                except minimalmodbus.InvalidResponseError as e:
-                    logger.warning(f"Invalid Modbus response: {e}")
-                except Exception as e:
-                    logger.error(f"Error reading Modbus data: {e}")
+                    self.connect()
+                except ConnectionError as e:
+                    delay = backoff.next_delay()
+                    self._connection_monitor.attempt_failed(e, delay)
+                    logger.warning(f"Connection attempt {backoff.attempt} failed, retrying in {delay:.1f}s: {e}")
+                    self._stop_event.wait(delay)
+                    continue
                 
-                with self._config_lock:
-                    sleep_time = self._reading_frequency
+                backoff.reset()
+                self._connection_monitor.connected()
+                self._acquire(generation)
                 
-                time.sleep(sleep_time)
+                if self._is_current(generation):
+                    self.disconnect()
                 
-        except ConnectionError as e:
-            logger.error(f"Connection error in reading loop: {e}")
         except Exception as e:
             logger.error(f"Unexpected error in reading loop: {e}")
         finally:
-            self.disconnect()
+            # A replaced thread must not close the connection its successor opened
+            if generation == self._generation:
+                self.disconnect()
     
-    def _read_registers(self) -> list[int]:
-        if self._instrument is None:
-            raise RuntimeError("Not connected to Modbus device")
+    def _acquire(self, generation: int) -> None:
+        self._scheduler.reset()
+        failures = 0
+        
+        while self._is_current(generation):
+            if not self._running_event.is_set():
+                self._running_event.wait()
+                # Slots missed while paused are not overruns
+                self._scheduler.reset()
+            
+            if not self._is_current(generation):
+                break
+            
+            with self._config_lock:
+                period = self._reading_frequency
+            self._scheduler.set_period(period)
+            
+            if not self._scheduler.wait_next(self._stop_event):
+                break
+            
+            # Failed reads still consume a sequence number, so consumers see the gap
+            sequence = self._sequence
+            self._sequence += 1
+            monotonic_time = time.monotonic()
+            wall_time = time.time()
+            
+            # Skipped cycles of a quarantined device show up as sequence gaps
+            if not self._timing.should_poll():
+                continue
+            
+            self._read_started = time.monotonic()
+            try:
+                raw_values = self._read_registers()
+            except (ConnectionError, serial.SerialException) as e:
+                if self._is_current(generation):
+                    logger.warning(f"Modbus connection lost, reconnecting: {e}")
+                    self._connection_monitor.connection_lost(e)
+                return
+            except Exception as e:
+                if not self._is_current(generation):
+                    return
+                
+                if isinstance(e, minimalmodbus.NoResponseError):
+                    self._timing.record_timeout()
+                    logger.warning(f"No response from Modbus device: {e}")
+                elif isinstance(e, minimalmodbus.InvalidResponseError):
+                    logger.warning(f"Invalid Modbus response: {e}")
+                else:
+                    logger.error(f"Error reading Modbus data: {e}")
+                
+                failures += 1
+                if failures >= MODBUS_SETTINGS.MAX_CONSECUTIVE_FAILURES:
+                    logger.warning(f"{failures} consecutive failed reads, reconnecting")
+                    self._connection_monitor.connection_lost(e)
+                    return
+                continue
+            finally:
+                if generation == self._generation:
+                    self._read_started = None
+            
+            failures = 0
+            if not self._is_current(generation):
+                break
+            
+            try:
+                record = SampleRecord(sequence, monotonic_time, wall_time, *self._parse(raw_values))
+                self._record(record, raw_values)
+                self._publish(record)
+            except queue.Full:
+                self._sample_dropped(sequence)
+    
+    def _watchdog_loop(self) -> None:
+        timeout = MODBUS_SETTINGS.WATCHDOG_TIMEOUT
+        
+        while not self._stop_event.wait(min(1.0, timeout / 4)):
+            started = self._read_started
+            if started is None:
+                continue
+            
+            stalled_for = time.monotonic() - started
+            if stalled_for < timeout:
+                continue
+            
+            # Python threads cannot be killed: the stalled one is orphaned and
+            # the port closed under it, which usually unblocks the read
+            reason = f"Read stalled for {stalled_for:.1f}s"
+            logger.error(f"{reason}, restarting Modbus reader")
+            self._connection_monitor.watchdog_restart(reason, stalled_for)
+            self._generation += 1
+            self._read_started = None
+            try:
+                self.disconnect()
+            except Exception as e:
+                logger.warning(f"Error closing stalled connection: {e}")
+            
+            if not self._stop_event.is_set():
+                self._start_reader()
+    
+    @property
+    def last_decoded(self) -> Optional[DecodedRegisters]:
+        return self._last_decoded
+    
+    def _parse(self, raw_values: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        if self._register_map is None:
+            return DataParser.parse_temperature_array(raw_values)
         
+        decoded = self._register_map.decode(raw_values)
+        self._last_decoded = decoded
         with self._config_lock:
             num_sensors = self._num_sensors
+        return (
+            decoded.quantity(QUANTITY_TEMPERATURE)[0, :num_sensors],
+            decoded.quantity_mask(QUANTITY_TEMPERATURE)[0, :num_sensors],
+        )
+    
+    def _record(self, record: SampleRecord, raw_values: np.ndarray) -> None:
+        # Recorded before publishing, so samples the UI drops are still kept
+        if self._recorder is not None:
+            self._recorder.record(record, raw_values)
+    
+    def _sample_dropped(self, sequence: int) -> None:
+        # A full queue stays full for a while, so it is not worth a warning
+        # per sample: the first drop is logged, then running totals
+        self._dropped_samples += 1
+        now = time.monotonic()
+        if self._drop_logged_at is None:
+            logger.warning(f"Sample queue full, dropped sample {sequence}")
+        elif now - self._drop_logged_at >= DROP_LOG_INTERVAL:
+            logger.warning(
+                f"Sample queue full, {self._dropped_samples - self._drops_logged} more samples dropped "
+                f"({self._dropped_samples} in total)"
+            )
+        else:
+            return
+        self._drop_logged_at = now
+        self._drops_logged = self._dropped_samples
+    
+    def _publish(self, record: SampleRecord) -> None:
+        if self._sample_ring is None:
+            self._data_queue.put(record, timeout=self._scheduler.period)
+            return
+        
+        row = self._sample_ring.reserve(timeout=self._scheduler.period)
+        if row is None:
+            raise queue.Full
+        
+        record.write_row(row)
+        self._sample_ring.commit()
+    
+    def _read_registers(self) -> np.ndarray:
+        with self._config_lock:
+            read_plan = self._read_plan
         
+        if self._reader is not None:
+            # Readers that can pipeline get the whole plan in one call
+            if hasattr(self._reader, "read_register_blocks"):
+                return read_plan.assemble(self._reader.read_register_blocks(read_plan.blocks))
+            if hasattr(self._reader, "set_timeout"):
+                return read_plan.read(self._timing.timed(self._reader.read_registers, self._reader.set_timeout))
+            return read_plan.read(self._reader.read_registers)
+        
+        if self._instrument is None:
+            raise RuntimeError("Not connected to Modbus device")
+        
+        return read_plan.read(self._timing.timed(self._read_block, self._set_timeout))
+    
+    def _set_timeout(self, timeout: float) -> None:
+        self._instrument.serial.timeout = timeout
+    
+    def _read_block(self, start: int, count: int) -> list[int]:
         return self._instrument.read_registers(
-            self._start_address,
-            num_sensors,
+            start,
+            count,
             functioncode=MODBUS_SETTINGS.FUNCTION_CODE,
         )
     
     def clear_queue(self) -> None:
-        with self._data_queue.mutex:
-            self._data_queue.queue.clear()
+        self._data_queue.clear()
+        if self._sample_ring is not None:
+            self._sample_ring.clear()
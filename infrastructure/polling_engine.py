@@ -0,0 +1,212 @@
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable, Optional
+
+import minimalmodbus
+import numpy as np
+import serial
+
+from config.settings import MODBUS_SETTINGS
+from core.interfaces import ModbusReader
+from infrastructure.adaptive_timeout import AdaptiveTimeout, DeviceTimingStats
+from infrastructure.register_plan import RegisterReadPlan
+from infrastructure.rtu_reader import RtuModbusReader
+from infrastructure.supervisor import ExponentialBackoff
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class SlaveConfig:
+    
+    address: int
+    num_sensors: int
+    start_address: int = MODBUS_SETTINGS.START_ADDRESS
+
+
+@dataclass(frozen=True)
+class BusConfig:
+    
+    port: str
+    slaves: list[SlaveConfig] = field(default_factory=list)
+    baudrate: int = MODBUS_SETTINGS.BAUDRATE
+    
+    @classmethod
+    def from_dict(cls, config: dict) -> "BusConfig":
+        return cls(
+            port=config["port"],
+            slaves=[SlaveConfig(**slave) for slave in config.get("slaves", [])],
+            baudrate=config.get("baudrate", MODBUS_SETTINGS.BAUDRATE),
+        )
+    
+    @property
+    def num_sensors(self) -> int:
+        return sum(slave.num_sensors for slave in self.slaves)
+
+
+ReaderFactory = Callable[[str, int, int], ModbusReader]
+
+
+class BusPoller:
+    
+    def __init__(self, config: BusConfig, reader_factory: ReaderFactory = RtuModbusReader):
+        self._config = config
+        self._readers = [
+            reader_factory(config.port, slave.address, config.baudrate)
+            for slave in config.slaves
+        ]
+        self._plans = [
+            RegisterReadPlan.contiguous(slave.start_address, slave.num_sensors)
+            for slave in config.slaves
+        ]
+        self._bus_timing = AdaptiveTimeout(config.baudrate, quarantine_after=0)
+        self._timings = [AdaptiveTimeout(config.baudrate, fallback=self._bus_timing) for _ in config.slaves]
+        self._backoffs = [ExponentialBackoff() for _ in config.slaves]
+        self._retry_at = [0.0 for _ in config.slaves]
+        self._last_duration = 0.0
+    
+    @property
+    def port(self) -> str:
+        return self._config.port
+    
+    @property
+    def num_sensors(self) -> int:
+        return self._config.num_sensors
+    
+    @property
+    def last_duration(self) -> float:
+        return self._last_duration
+    
+    @property
+    def device_timings(self) -> dict[str, DeviceTimingStats]:
+        return {
+            f"{self.port}/{slave.address}": timing.stats()
+            for slave, timing in zip(self._config.slaves, self._timings)
+        }
+    
+    def connect(self) -> int:
+        connected = 0
+        for index in range(len(self._readers)):
+            self._retry_at[index] = 0.0
+            self._backoffs[index].reset()
+            if self._reconnect(index):
+                connected += 1
+        return connected
+    
+    def disconnect(self) -> None:
+        for reader in self._readers:
+            reader.disconnect()
+    
+    def is_connected(self) -> bool:
+        return any(reader.is_connected() for reader in self._readers)
+    
+    def poll(self) -> np.ndarray:
+        # Slaves on one bus share the line, so they are read back to back;
+        # a failing slave only blanks its own sensors
+        registers = np.full(self.num_sensors, MODBUS_SETTINGS.ERROR_VALUE, dtype=np.int64)
+        start = time.monotonic()
+        offset = 0
+        
+        for index, (slave, reader, plan, timing) in enumerate(
+            zip(self._config.slaves, self._readers, self._plans, self._timings)
+        ):
+            # Slaves that could not be opened are retried on their own backoff
+            if not reader.is_connected() and not self._reconnect(index):
+                offset += slave.num_sensors
+                continue
+            
+            try:
+                # A quarantined slave is only probed now and then so it
+                # cannot eat the cycle of the healthy ones
+                if timing.should_poll():
+                    read_block = reader.read_registers
+                    if hasattr(reader, 'set_timeout'):
+                        read_block = timing.timed(read_block, reader.set_timeout)
+                    registers[offset:offset + slave.num_sensors] = plan.read(read_block)
+            except minimalmodbus.NoResponseError as e:
+                timing.record_timeout()
+                logger.warning(f"Bus {self.port}, slave {slave.address}: {e}")
+            except minimalmodbus.ModbusException as e:
+                logger.warning(f"Bus {self.port}, slave {slave.address}: {e}")
+            except serial.SerialException as e:
+                # The port itself is gone: every slave on it is lost, and the
+                # service's supervisor has to reconnect
+                self.disconnect()
+                raise ConnectionError(f"Bus {self.port} lost: {e}") from e
+            offset += slave.num_sensors
+        
+        self._last_duration = time.monotonic() - start
+        return registers
+    
+    def _reconnect(self, index: int) -> bool:
+        if time.monotonic() < self._retry_at[index]:
+            return False
+        
+        try:
+            self._readers[index].connect()
+        except ConnectionError as e:
+            delay = self._backoffs[index].next_delay()
+            self._retry_at[index] = time.monotonic() + delay
+            logger.error(f"Bus {self.port}, slave {self._config.slaves[index].address}: {e}, retrying in {delay:.1f}s")
+            return False
+        
+        self._backoffs[index].reset()
+        return True
+
+
+class PollingEngine:
+    
+    def __init__(self, buses: list[BusConfig], reader_factory: ReaderFactory = RtuModbusReader):
+        if not buses:
+            raise ValueError("Polling engine needs at least one bus")
+        
+        self._pollers = [BusPoller(bus, reader_factory) for bus in buses]
+        self._executor: Optional[ThreadPoolExecutor] = None
+    
+    @property
+    def num_sensors(self) -> int:
+        return sum(poller.num_sensors for poller in self._pollers)
+    
+    @property
+    def bus_durations(self) -> dict[str, float]:
+        return {poller.port: poller.last_duration for poller in self._pollers}
+    
+    @property
+    def device_timings(self) -> dict[str, DeviceTimingStats]:
+        timings = {}
+        for poller in self._pollers:
+            timings.update(poller.device_timings)
+        return timings
+    
+    def connect(self) -> None:
+        if not any([poller.connect() for poller in self._pollers]):
+            raise ConnectionError("No Modbus slave could be connected")
+        
+        if len(self._pollers) > 1:
+            self._executor = ThreadPoolExecutor(
+                max_workers=len(self._pollers),
+                thread_name_prefix="ModbusBus",
+            )
+    
+    def disconnect(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        
+        for poller in self._pollers:
+            poller.disconnect()
+    
+    def is_connected(self) -> bool:
+        return any(poller.is_connected() for poller in self._pollers)
+    
+    def poll(self) -> np.ndarray:
+        # Buses are independent lines, so a cycle takes as long as the
+        # slowest bus rather than the sum of all of them
+        if self._executor is None:
+            return np.concatenate([poller.poll() for poller in self._pollers])
+        
+        futures = [self._executor.submit(poller.poll) for poller in self._pollers]
+        return np.concatenate([future.result() for future in futures])
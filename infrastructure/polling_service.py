@@ -0,0 +1,67 @@
+import logging
+from typing import Optional
+
+import numpy as np
+
+from config.settings import SENSOR_SETTINGS
+from infrastructure.adaptive_timeout import DeviceTimingStats
+from infrastructure.modbus_service import ModbusService
+from infrastructure.polling_engine import BusConfig, PollingEngine, ReaderFactory
+from infrastructure.rtu_reader import RtuModbusReader
+from infrastructure.session_recorder import SessionRecorder
+
+
+logger = logging.getLogger(__name__)
+
+
+class PollingModbusService(ModbusService):
+    
+    def __init__(
+        self,
+        buses: list[BusConfig],
+        num_sensors: int = SENSOR_SETTINGS.DEFAULT_NUM_SENSORS,
+        reading_frequency: float = SENSOR_SETTINGS.DEFAULT_READING_FREQUENCY,
+        transport: str = SENSOR_SETTINGS.SAMPLE_TRANSPORT,
+        reader_factory: ReaderFactory = RtuModbusReader,
+        recorder: Optional[SessionRecorder] = None,
+    ):
+        self._engine = PollingEngine(buses, reader_factory)
+        super().__init__(
+            num_sensors=min(num_sensors, self._engine.num_sensors),
+            reading_frequency=reading_frequency,
+            transport=transport,
+            recorder=recorder,
+        )
+    
+    @property
+    def total_sensors(self) -> int:
+        return self._engine.num_sensors
+    
+    @property
+    def max_sensors(self) -> int:
+        return min(self._engine.num_sensors, SENSOR_SETTINGS.MAX_SENSORS)
+    
+    @property
+    def bus_durations(self) -> dict[str, float]:
+        return self._engine.bus_durations
+    
+    @property
+    def device_timings(self) -> dict[str, DeviceTimingStats]:
+        return self._engine.device_timings
+    
+    def connect(self) -> None:
+        self._engine.connect()
+        logger.info(f"Polling {self._engine.num_sensors} sensors on {len(self._engine.bus_durations)} buses")
+    
+    def disconnect(self) -> None:
+        self._engine.disconnect()
+    
+    def is_connected(self) -> bool:
+        return self._engine.is_connected()
+    
+    def _read_registers(self) -> np.ndarray:
+        # The whole topology is polled every cycle so the stream stays
+        # aligned; the UI shows the first num_sensors of it
+        with self._config_lock:
+            num_sensors = self._num_sensors
+        return self._engine.poll()[:num_sensors]
@@ -0,0 +1,263 @@
+import logging
+import multiprocessing
+import threading
+import weakref
+from multiprocessing.connection import Connection
+from typing import Any, Optional
+
+from config.settings import MODBUS_SETTINGS, SENSOR_SETTINGS
+from core.interfaces import DataQueueProvider
+from core.sample_record import SampleRecord
+from infrastructure.modbus_service import ModbusService
+from infrastructure.scheduler import SchedulerStats
+from infrastructure.session_recorder import SessionRecorder
+from infrastructure.supervisor import ConnectionStats
+from utils.bounded_queue import BoundedSampleQueue, QueueStats
+from utils.register_map import QUANTITY_TEMPERATURE, RegisterMap
+from utils.spsc_ring import SpscRing
+
+
+logger = logging.getLogger(__name__)
+
+
+def _acquisition_main(
+    connection: Connection,
+    ring_name: str,
+    capacity: int,
+    width: int,
+    policy: str,
+    service_kwargs: dict[str, Any],
+    log_level: int,
+    record_directory: Optional[str] = None,
+) -> None:
+    logging.basicConfig(
+        level=log_level,
+        format="%(asctime)s - %(processName)s - %(name)s - %(levelname)s - %(message)s",
+    )
+    
+    ring = SpscRing.attach(ring_name, capacity, width, policy)
+    # The recorder holds a thread and open files, so it is built on this side
+    recorder = SessionRecorder(record_directory) if record_directory else None
+    service = ModbusService(sample_ring=ring, recorder=recorder, **service_kwargs)
+    service.start()
+    
+    try:
+        while True:
+            command, argument = connection.recv()
+            
+            if command == "stop":
+                break
+            elif command == "pause":
+                service.pause()
+            elif command == "resume":
+                service.resume()
+            elif command == "update_reading_frequency":
+                service.update_reading_frequency(argument)
+            elif command == "update_num_sensors":
+                service.update_num_sensors(argument)
+            elif command == "stats":
+                connection.send((service.scheduler_stats, service.connection_stats))
+            else:
+                logger.warning(f"Unknown control command: {command}")
+    except EOFError:
+        logger.warning("Control channel closed, stopping acquisition")
+    finally:
+        service.stop()
+        ring.close()
+        connection.close()
+
+
+def _release_ring(ring: SpscRing) -> None:
+    ring.close()
+    ring.unlink()
+
+
+class ProcessModbusService(DataQueueProvider):
+    
+    def __init__(
+        self,
+        port: str = MODBUS_SETTINGS.PORT,
+        address: int = MODBUS_SETTINGS.ADDRESS,
+        baudrate: int = MODBUS_SETTINGS.BAUDRATE,
+        num_sensors: int = SENSOR_SETTINGS.DEFAULT_NUM_SENSORS,
+        reading_frequency: float = SENSOR_SETTINGS.DEFAULT_READING_FREQUENCY,
+        register_map: Optional[RegisterMap] = None,
+        record_directory: Optional[str] = None,
+    ):
+        self._port = port
+        self._address = address
+        self._baudrate = baudrate
+        self._reading_frequency = reading_frequency
+        self._register_map = register_map
+        self._num_sensors = min(num_sensors, self.max_sensors)
+        self._record_directory = record_directory
+        
+        # Samples only ever arrive through the shared ring; the queue exists
+        # to satisfy the provider interface
+        self._data_queue = BoundedSampleQueue(1)
+        self._sample_ring = SpscRing.create_shared(
+            SENSOR_SETTINGS.QUEUE_MAX_SIZE,
+            SampleRecord.row_width(SENSOR_SETTINGS.MAX_SENSORS),
+            SENSOR_SETTINGS.QUEUE_POLICY,
+        )
+        self._finalizer = weakref.finalize(self, _release_ring, self._sample_ring)
+        
+        self._context = multiprocessing.get_context("spawn")
+        self._process: Optional[multiprocessing.process.BaseProcess] = None
+        self._connection: Optional[Connection] = None
+        self._control_lock = threading.Lock()
+        
+        self._is_paused = False
+        self._scheduler_stats = SchedulerStats()
+        self._connection_stats = ConnectionStats()
+        self._stats_requested = False
+    
+    def get_data_queue(self) -> BoundedSampleQueue:
+        return self._data_queue
+    
+    def get_sample_ring(self) -> Optional[SpscRing]:
+        return self._sample_ring
+    
+    def start(self) -> None:
+        if self._process is not None and self._process.is_alive():
+            logger.warning("Acquisition process already running")
+            return
+        
+        parent_connection, child_connection = self._context.Pipe()
+        self._stats_requested = False
+        service_kwargs = {
+            "port": self._port,
+            "address": self._address,
+            "baudrate": self._baudrate,
+            "num_sensors": self._num_sensors,
+            "reading_frequency": self._reading_frequency,
+            "register_map": self._register_map,
+        }
+        
+        self._process = self._context.Process(
+            target=_acquisition_main,
+            args=(
+                child_connection,
+                self._sample_ring.shared_name,
+                self._sample_ring.capacity,
+                self._sample_ring.width,
+                self._sample_ring.policy,
+                service_kwargs,
+                logging.getLogger().getEffectiveLevel(),
+                self._record_directory,
+            ),
+            name="ModbusAcquisition",
+            daemon=True,
+        )
+        self._process.start()
+        child_connection.close()
+        self._connection = parent_connection
+        
+        if self._is_paused:
+            self._send("pause")
+        logger.info(f"Modbus acquisition process started (pid {self._process.pid})")
+    
+    def stop(self) -> None:
+        if self._process is None:
+            return
+        
+        self._send("stop")
+        self._process.join(timeout=2.0)
+        if self._process.is_alive():
+            logger.warning("Acquisition process did not stop, terminating it")
+            self._process.terminate()
+            self._process.join()
+        
+        with self._control_lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+        
+        self._process = None
+        logger.info("Modbus acquisition process stopped")
+    
+    def pause(self) -> None:
+        self._is_paused = True
+        self._send("pause")
+    
+    def resume(self) -> None:
+        self._is_paused = False
+        self._send("resume")
+    
+    def is_paused(self) -> bool:
+        return self._is_paused
+    
+    def update_reading_frequency(self, frequency: float) -> None:
+        self._reading_frequency = max(
+            SENSOR_SETTINGS.MIN_READING_FREQUENCY,
+            min(frequency, SENSOR_SETTINGS.MAX_READING_FREQUENCY),
+        )
+        self._send("update_reading_frequency", self._reading_frequency)
+    
+    def update_num_sensors(self, num_sensors: int) -> None:
+        self._num_sensors = max(
+            SENSOR_SETTINGS.MIN_SENSORS,
+            min(num_sensors, self.max_sensors),
+        )
+        self._send("update_num_sensors", self._num_sensors)
+    
+    @property
+    def num_sensors(self) -> int:
+        return self._num_sensors
+    
+    @property
+    def max_sensors(self) -> int:
+        if self._register_map is not None:
+            return self._register_map.quantity_count(QUANTITY_TEMPERATURE)
+        return SENSOR_SETTINGS.MAX_SENSORS
+    
+    @property
+    def reading_frequency(self) -> float:
+        return self._reading_frequency
+    
+    @property
+    def scheduler_stats(self) -> SchedulerStats:
+        self._refresh_stats()
+        return self._scheduler_stats
+    
+    @property
+    def connection_stats(self) -> ConnectionStats:
+        self._refresh_stats()
+        return self._connection_stats
+    
+    @property
+    def queue_stats(self) -> QueueStats:
+        return self._sample_ring.stats()
+    
+    def clear_queue(self) -> None:
+        self._sample_ring.clear()
+    
+    def _refresh_stats(self) -> None:
+        # Called from the UI thread, so it never waits for the child: a
+        # reply that has arrived is taken, and a new request goes out only
+        # once the previous one is answered. The getters therefore lag one
+        # status tick behind and share a single request per tick.
+        with self._control_lock:
+            if self._connection is None:
+                return
+            
+            try:
+                while self._connection.poll():
+                    self._scheduler_stats, self._connection_stats = self._connection.recv()
+                    self._stats_requested = False
+                
+                if not self._stats_requested:
+                    self._connection.send(("stats", None))
+                    self._stats_requested = True
+            except (EOFError, OSError) as e:
+                logger.warning(f"Failed to query acquisition process: {e}")
+    
+    def _send(self, command: str, argument: Any = None) -> None:
+        with self._control_lock:
+            if self._connection is None:
+                return
+            
+            try:
+                self._connection.send((command, argument))
+            except (BrokenPipeError, OSError) as e:
+                logger.warning(f"Failed to send '{command}' to acquisition process: {e}")
@@ -0,0 +1,78 @@
+from dataclasses import dataclass
+from typing import Callable, Sequence
+
+import numpy as np
+
+from config.settings import MODBUS_SETTINGS
+
+
+@dataclass(frozen=True)
+class RegisterBlock:
+    
+    start: int
+    count: int
+
+
+class RegisterReadPlan:
+    
+    def __init__(
+        self,
+        addresses: Sequence[int],
+        max_registers: int = MODBUS_SETTINGS.MAX_REGISTERS_PER_READ,
+        max_gap: int = MODBUS_SETTINGS.MAX_REGISTER_GAP,
+    ):
+        if max_registers < 1:
+            raise ValueError("A read must cover at least one register")
+        
+        self._addresses = np.asarray(addresses, dtype=np.int64)
+        self._blocks = self._merge(np.unique(self._addresses), max_registers, max_gap)
+        
+        # Position of every requested address inside the concatenated block
+        # results, so one fancy index puts the registers back in sensor order
+        offsets = np.cumsum([0] + [block.count for block in self._blocks[:-1]])
+        starts = np.array([block.start for block in self._blocks], dtype=np.int64)
+        block_index = np.searchsorted(starts, self._addresses, side="right") - 1
+        self._positions = offsets[block_index] + self._addresses - starts[block_index]
+    
+    @classmethod
+    def contiguous(cls, start: int, count: int, **kwargs) -> "RegisterReadPlan":
+        return cls(range(start, start + count), **kwargs)
+    
+    @property
+    def blocks(self) -> list[RegisterBlock]:
+        return list(self._blocks)
+    
+    @property
+    def register_count(self) -> int:
+        return len(self._addresses)
+    
+    def read(self, read_block: Callable[[int, int], list[int]]) -> np.ndarray:
+        return self.assemble([read_block(block.start, block.count) for block in self._blocks])
+    
+    def assemble(self, block_results: list) -> np.ndarray:
+        if not self._blocks:
+            return np.empty(0, dtype=np.int64)
+        
+        registers = np.concatenate([np.asarray(result, dtype=np.int64) for result in block_results])
+        return registers[self._positions]
+    
+    @staticmethod
+    def _merge(addresses: np.ndarray, max_registers: int, max_gap: int) -> list[RegisterBlock]:
+        blocks: list[RegisterBlock] = []
+        if len(addresses) == 0:
+            return blocks
+        
+        # Bridging a small gap with filler registers is cheaper than paying
+        # for another request/response turnaround on the bus
+        run_starts = np.flatnonzero(np.diff(addresses) > max_gap + 1) + 1
+        for run in np.split(addresses, run_starts):
+            first = int(run[0])
+            end = int(run[-1]) + 1
+            while first < end:
+                count = min(max_registers, end - first)
+                blocks.append(RegisterBlock(first, count))
+                # Skip a gap that a split left at the start of the next block
+                remaining = run[run >= first + count]
+                first = int(remaining[0]) if len(remaining) else end
+        
+        return blocks
@@ -0,0 +1,322 @@
+import logging
+import os
+import queue
+import threading
+import time
+from datetime import datetime
+from typing import Iterator, Optional
+
+import numpy as np
+
+from config.settings import SENSOR_SETTINGS
+from core.interfaces import DataQueueProvider
+from core.sample_record import SampleRecord
+from infrastructure.modbus_service import TRANSPORT_QUEUE, TRANSPORT_RING
+from infrastructure.session_recorder import SessionReader
+from utils.bounded_queue import QUEUE_POLICY_BLOCK, BoundedSampleQueue, QueueStats
+from utils.spsc_ring import SpscRing
+
+
+logger = logging.getLogger(__name__)
+
+
+REPLAY_AS_FAST_AS_POSSIBLE = 0.0
+REPLAY_BATCH_SIZE = 1000
+# Upper bound on a single sleep, so pause, stop and speed changes apply promptly
+REPLAY_MAX_WAIT = 0.1
+BACKPRESSURE_WAIT = 0.005
+
+ReplayBatch = tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]
+
+
+class ReplayService(DataQueueProvider):
+    
+    def __init__(
+        self,
+        source: str,
+        speed: float = 1.0,
+        loop: bool = False,
+        num_sensors: int = SENSOR_SETTINGS.DEFAULT_NUM_SENSORS,
+        transport: str = SENSOR_SETTINGS.SAMPLE_TRANSPORT,
+    ):
+        if speed < 0:
+            raise ValueError("Replay speed cannot be negative")
+        
+        if transport not in (TRANSPORT_QUEUE, TRANSPORT_RING):
+            raise ValueError(f"Unknown sample transport: {transport}")
+        
+        # Opened up front so a bad path fails before the UI starts
+        self._source = source
+        self._session: Optional[SessionReader] = None
+        self._csv_batch: Optional[ReplayBatch] = None
+        if os.path.isdir(source):
+            self._session = SessionReader(source)
+            self._total_samples = len(self._session)
+            recorded_sensors = max(segment.num_sensors for segment in self._session.segments)
+        else:
+            self._csv_batch = self.read_csv(source)
+            self._total_samples = len(self._csv_batch[0])
+            recorded_sensors = self._csv_batch[3].shape[1]
+        self._max_sensors = max(SENSOR_SETTINGS.MIN_SENSORS, min(recorded_sensors, SENSOR_SETTINGS.MAX_SENSORS))
+        
+        self._speed = speed
+        self._loop = loop
+        self._num_sensors = min(num_sensors, self._max_sensors)
+        
+        # Unlike live acquisition, a replay never drops samples: it waits
+        # for the consumer instead
+        self._data_queue = BoundedSampleQueue(SENSOR_SETTINGS.QUEUE_MAX_SIZE, QUEUE_POLICY_BLOCK)
+        self._sample_ring: Optional[SpscRing] = None
+        if transport == TRANSPORT_RING:
+            self._sample_ring = SpscRing(
+                SENSOR_SETTINGS.QUEUE_MAX_SIZE,
+                SampleRecord.row_width(SENSOR_SETTINGS.MAX_SENSORS),
+                QUEUE_POLICY_BLOCK,
+            )
+        
+        self._running_event = threading.Event()
+        self._stop_event = threading.Event()
+        self._replay_thread: Optional[threading.Thread] = None
+        self._config_lock = threading.Lock()
+        
+        # Wall-clock time at which source time _source_origin is due
+        self._origin = 0.0
+        self._source_origin = 0.0
+        self._position: Optional[float] = None
+        self._rebase = True
+        self._replayed = 0
+        self._laps = 0
+        self._finished = False
+    
+    def get_data_queue(self) -> queue.Queue[SampleRecord]:
+        return self._data_queue
+    
+    def get_sample_ring(self) -> Optional[SpscRing]:
+        return self._sample_ring
+    
+    def start(self) -> None:
+        if self._replay_thread is not None and self._replay_thread.is_alive():
+            logger.warning("Replay already running")
+            return
+        
+        self._stop_event.clear()
+        self._running_event.set()
+        self._finished = False
+        self._replay_thread = threading.Thread(
+            target=self._replay_loop,
+            name="SessionReplay",
+            daemon=True,
+        )
+        self._replay_thread.start()
+        logger.info(f"Replaying {self._source} ({self._total_samples} samples) at {self.speed_label}")
+    
+    def stop(self) -> None:
+        self._stop_event.set()
+        self._running_event.set()
+        
+        if self._replay_thread is not None:
+            self._replay_thread.join(timeout=2.0)
+            self._replay_thread = None
+        logger.info("Replay stopped")
+    
+    def pause(self) -> None:
+        self._running_event.clear()
+    
+    def resume(self) -> None:
+        with self._config_lock:
+            self._rebase = True
+        self._running_event.set()
+    
+    def is_paused(self) -> bool:
+        return not self._running_event.is_set()
+    
+    def set_speed(self, speed: float) -> None:
+        if speed < 0:
+            raise ValueError("Replay speed cannot be negative")
+        
+        with self._config_lock:
+            self._speed = speed
+            self._rebase = True
+    
+    def update_num_sensors(self, num_sensors: int) -> None:
+        with self._config_lock:
+            self._num_sensors = max(
+                SENSOR_SETTINGS.MIN_SENSORS,
+                min(num_sensors, self._max_sensors),
+            )
+    
+    @property
+    def num_sensors(self) -> int:
+        return self._num_sensors
+    
+    @property
+    def max_sensors(self) -> int:
+        return self._max_sensors
+    
+    @property
+    def speed(self) -> float:
+        return self._speed
+    
+    @property
+    def speed_label(self) -> str:
+        speed = self._speed
+        return "maximum speed" if speed == REPLAY_AS_FAST_AS_POSSIBLE else f"{speed:g}x"
+    
+    @property
+    def finished(self) -> bool:
+        return self._finished
+    
+    @property
+    def replay_progress(self) -> tuple[int, int]:
+        return self._replayed, self._total_samples
+    
+    @property
+    def queue_stats(self) -> QueueStats:
+        if self._sample_ring is not None:
+            return self._sample_ring.stats()
+        return self._data_queue.stats()
+    
+    def clear_queue(self) -> None:
+        self._data_queue.clear()
+        if self._sample_ring is not None:
+            self._sample_ring.clear()
+    
+    @staticmethod
+    def read_csv(path: str) -> ReplayBatch:
+        # Reads ChartWidget.export_to_csv output: ';' separated, decimal
+        # commas, empty cells for missing readings. Older exports without
+        # Timestamp/Sequence columns are numbered and dated from load time.
+        with open(path, "r", encoding="utf-8") as file:
+            header = file.readline().rstrip("\r\n").split(";")
+            rows = [line.rstrip("\r\n").split(";") for line in file if line.strip()]
+        
+        if "Time [s]" not in header:
+            raise ValueError(f"Not a chart export: {path}")
+        
+        def number(text: str) -> float:
+            return float(text.replace(",", ".")) if text.strip() else np.nan
+        
+        sensor_columns = [index for index, name in enumerate(header) if name.startswith("Sensor_")]
+        time_column = header.index("Time [s]")
+        times = np.array([number(row[time_column]) for row in rows], dtype=np.float64)
+        values = np.array(
+            [[number(row[index]) if index < len(row) else np.nan for index in sensor_columns] for row in rows],
+            dtype=np.float64,
+        ).reshape(len(rows), len(sensor_columns))
+        
+        if "Sequence" in header:
+            sequence_column = header.index("Sequence")
+            sequences = np.array([int(row[sequence_column]) for row in rows], dtype=np.int64)
+        else:
+            sequences = np.arange(len(rows), dtype=np.int64)
+        
+        if "Timestamp" in header:
+            timestamp_column = header.index("Timestamp")
+            wall_times = np.array([datetime.fromisoformat(row[timestamp_column]).timestamp() for row in rows])
+        else:
+            wall_times = time.time() + times - (times[0] if len(times) else 0.0)
+        
+        return times, sequences, wall_times, values
+    
+    def _batches(self) -> Iterator[ReplayBatch]:
+        if self._session is None:
+            yield self._csv_batch
+            return
+        
+        # Sessions are streamed from their memory maps a batch at a time
+        for _, rows in self._session.iter_batches(REPLAY_BATCH_SIZE):
+            yield rows["monotonic_time"], rows["sequence"], rows["wall_time"], rows["values"]
+    
+    def _replay_loop(self) -> None:
+        try:
+            sequence_offset = 0
+            while not self._stop_event.is_set():
+                self._replayed = 0
+                last_sequence: Optional[int] = None
+                first_sequence: Optional[int] = None
+                with self._config_lock:
+                    self._rebase = True
+                self._position = None
+                
+                for times, sequences, wall_times, values in self._batches():
+                    times = np.asarray(times).tolist()
+                    sequences = np.asarray(sequences).tolist()
+                    wall_times = np.asarray(wall_times).tolist()
+                    values = np.asarray(values)
+                    
+                    for row, source_time in enumerate(times):
+                        if not self._wait_for(source_time):
+                            return
+                        
+                        sequence = sequences[row] + sequence_offset
+                        if first_sequence is None:
+                            first_sequence = sequence
+                        last_sequence = sequence
+                        
+                        if not self._emit(sequence, wall_times[row], values[row]):
+                            return
+                        self._replayed += 1
+                
+                self._laps += 1
+                if not self._loop or last_sequence is None:
+                    break
+                # Later laps continue the numbering so they do not look out of order
+                sequence_offset += last_sequence - first_sequence + 1
+            
+            self._finished = True
+            logger.info(f"Replay of {self._source} finished")
+        except Exception as e:
+            logger.error(f"Error replaying {self._source}: {e}")
+    
+    def _wait_for(self, source_time: float) -> bool:
+        while True:
+            if not self._running_event.is_set():
+                self._running_event.wait()
+            if self._stop_event.is_set():
+                return False
+            
+            with self._config_lock:
+                speed = self._speed
+                if self._rebase or self._position is None:
+                    # Pauses, speed changes and new laps restart the clock at
+                    # the current position instead of catching up
+                    self._origin = time.monotonic()
+                    self._source_origin = source_time if self._position is None else self._position
+                    self._rebase = False
+            
+            if speed == REPLAY_AS_FAST_AS_POSSIBLE:
+                break
+            
+            delay = self._origin + (source_time - self._source_origin) / speed - time.monotonic()
+            if delay <= 0:
+                break
+            self._stop_event.wait(min(delay, REPLAY_MAX_WAIT))
+        
+        self._position = source_time
+        return True
+    
+    def _emit(self, sequence: int, wall_time: float, values: np.ndarray) -> bool:
+        with self._config_lock:
+            num_sensors = self._num_sensors
+        
+        # The sensor count follows the settings panel like a live device:
+        # extra recorded sensors are hidden, missing ones read as faults
+        readings = np.full(num_sensors, np.nan)
+        count = min(num_sensors, len(values))
+        readings[:count] = values[:count]
+        record = SampleRecord.from_values(sequence, time.monotonic(), wall_time, readings)
+        
+        if self._sample_ring is None:
+            while self._data_queue.full():
+                if self._stop_event.wait(BACKPRESSURE_WAIT):
+                    return False
+            self._data_queue.put(record)
+            return True
+        
+        while len(self._sample_ring) >= self._sample_ring.capacity:
+            if self._stop_event.wait(BACKPRESSURE_WAIT):
+                return False
+        
+        record.write_row(self._sample_ring.reserve())
+        self._sample_ring.commit()
+        return True
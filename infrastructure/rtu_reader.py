@@ -0,0 +1,82 @@
+import logging
+from typing import Optional
+
+import minimalmodbus
+import serial
+
+from config.settings import MODBUS_SETTINGS
+from core.interfaces import ModbusReader
+
+
+logger = logging.getLogger(__name__)
+
+
+class RtuModbusReader(ModbusReader):
+    
+    def __init__(
+        self,
+        port: str = MODBUS_SETTINGS.PORT,
+        address: int = MODBUS_SETTINGS.ADDRESS,
+        baudrate: int = MODBUS_SETTINGS.BAUDRATE,
+        timeout: float = MODBUS_SETTINGS.TIMEOUT,
+    ):
+        self._port = port
+        self._address = address
+        self._baudrate = baudrate
+        self._timeout = timeout
+        self._instrument: Optional[minimalmodbus.Instrument] = None
+    
+    @property
+    def port(self) -> str:
+        return self._port
+    
+    @property
+    def address(self) -> int:
+        return self._address
+    
+    def connect(self) -> None:
+        # minimalmodbus shares one serial port between all instruments
+        # opened on the same port name, so slaves on a bus reuse it
+        try:
+            self._instrument = minimalmodbus.Instrument(self._port, self._address)
+            self._instrument.serial.baudrate = self._baudrate
+            self._instrument.serial.bytesize = MODBUS_SETTINGS.BYTESIZE
+            self._instrument.serial.parity = serial.PARITY_NONE
+            self._instrument.serial.stopbits = MODBUS_SETTINGS.STOPBITS
+            self._instrument.serial.timeout = self._timeout
+            logger.info(f"Connected to Modbus slave {self._address} on {self._port}")
+        except serial.SerialException as e:
+            logger.error(f"Failed to connect to Modbus slave {self._address} on {self._port}: {e}")
+            raise ConnectionError(f"Failed to connect to {self._port}: {e}") from e
+    
+    def disconnect(self) -> None:
+        if self._instrument is not None:
+            try:
+                if self._instrument.serial.is_open:
+                    self._instrument.serial.close()
+            except Exception as e:
+                logger.warning(f"Error closing {self._port}: {e}")
+            finally:
+                self._instrument = None
+    
+    def is_connected(self) -> bool:
+        return (
+            self._instrument is not None
+            and self._instrument.serial.is_open
+        )
+    
+    def set_timeout(self, timeout: float) -> None:
+        # Slaves sharing a port share one serial object, so this is set before every read
+        self._timeout = timeout
+        if self._instrument is not None:
+            self._instrument.serial.timeout = timeout
+    
+    def read_registers(self, start_address: int, count: int) -> list[int]:
+        if self._instrument is None:
+            raise RuntimeError("Not connected to Modbus device")
+        
+        return self._instrument.read_registers(
+            start_address,
+            count,
+            functioncode=MODBUS_SETTINGS.FUNCTION_CODE,
+        )
@@ -0,0 +1,166 @@
+import math
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+
+MISSED_SLOT_SKIP = "skip"
+MISSED_SLOT_CATCH_UP = "catch_up"
+
+
+@dataclass(frozen=True)
+class SchedulerStats:
+    
+    cycles: int = 0
+    overruns: int = 0
+    skipped_slots: int = 0
+    caught_up_slots: int = 0
+    last_jitter: float = 0.0
+    mean_jitter: float = 0.0
+    max_jitter: float = 0.0
+
+
+class DeadlineScheduler:
+    
+    def __init__(
+        self,
+        period: float,
+        policy: str = MISSED_SLOT_SKIP,
+        max_catch_up: int = 5,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if period <= 0:
+            raise ValueError("Scheduler period must be positive")
+        
+        if policy not in (MISSED_SLOT_SKIP, MISSED_SLOT_CATCH_UP):
+            raise ValueError(f"Unknown missed slot policy: {policy}")
+        
+        self._period = period
+        self._policy = policy
+        self._max_catch_up = max_catch_up
+        self._clock = clock
+        
+        self._anchor = clock()
+        self._slot = 0
+        self._next_slot = 0
+        # Last slot run late under catch-up, so a stall counts as one overrun
+        self._late_slot: Optional[int] = None
+        
+        self._stats_lock = threading.Lock()
+        self._cycles = 0
+        self._overruns = 0
+        self._skipped_slots = 0
+        self._caught_up_slots = 0
+        self._last_jitter = 0.0
+        self._jitter_sum = 0.0
+        self._max_jitter = 0.0
+    
+    @property
+    def period(self) -> float:
+        return self._period
+    
+    @property
+    def policy(self) -> str:
+        return self._policy
+    
+    @property
+    def slot(self) -> int:
+        return self._slot
+    
+    @property
+    def deadline(self) -> float:
+        return self._deadline_of(self._slot)
+    
+    def reset(self) -> None:
+        self._anchor = self._clock()
+        self._slot = 0
+        self._next_slot = 0
+        self._late_slot = None
+    
+    def set_period(self, period: float) -> None:
+        if period <= 0:
+            raise ValueError("Scheduler period must be positive")
+        
+        if period == self._period:
+            return
+        
+        # Keep the pending deadline and continue the new grid from there
+        self._anchor = self._deadline_of(self._next_slot)
+        self._period = period
+        self._slot = 0
+        self._next_slot = 0
+        self._late_slot = None
+    
+    def wait_next(self, stop_event: threading.Event) -> bool:
+        delay = self.time_until_next()
+        if delay > 0 and stop_event.wait(delay):
+            return False
+        
+        if stop_event.is_set():
+            return False
+        
+        self.start_slot()
+        return True
+    
+    def time_until_next(self) -> float:
+        # Split from wait_next so an event loop can do the waiting itself
+        now = self._clock()
+        late_slots = math.floor((now - self._deadline_of(self._next_slot)) / self._period)
+        
+        if late_slots >= 1:
+            self._next_slot = self._resolve_missed_slots(self._next_slot, late_slots)
+            return 0.0
+        
+        self._late_slot = None
+        return self._deadline_of(self._next_slot) - now
+    
+    def start_slot(self) -> None:
+        self._slot = self._next_slot
+        self._next_slot = self._slot + 1
+        self._record_jitter(self._clock() - self._deadline_of(self._slot))
+    
+    def stats(self) -> SchedulerStats:
+        with self._stats_lock:
+            return SchedulerStats(
+                cycles=self._cycles,
+                overruns=self._overruns,
+                skipped_slots=self._skipped_slots,
+                caught_up_slots=self._caught_up_slots,
+                last_jitter=self._last_jitter,
+                mean_jitter=self._jitter_sum / self._cycles if self._cycles else 0.0,
+                max_jitter=self._max_jitter,
+            )
+    
+    def _resolve_missed_slots(self, slot: int, late_slots: int) -> int:
+        # Catch-up slots of a stall are still late when their turn comes;
+        # only the slot that first went late counts as an overrun
+        continues_stall = self._late_slot is not None and slot == self._late_slot + 1
+        
+        if self._policy == MISSED_SLOT_CATCH_UP and late_slots <= self._max_catch_up:
+            resolved = slot
+        else:
+            # Skip to the most recent slot on the grid; with catch-up this only
+            # happens once the backlog exceeds the allowed burst
+            skipped = late_slots if self._policy == MISSED_SLOT_SKIP else late_slots - self._max_catch_up
+            with self._stats_lock:
+                self._skipped_slots += skipped
+            resolved = slot + skipped
+        
+        with self._stats_lock:
+            if not continues_stall:
+                self._overruns += 1
+            if self._policy == MISSED_SLOT_CATCH_UP:
+                self._caught_up_slots += 1
+        self._late_slot = resolved if self._policy == MISSED_SLOT_CATCH_UP else None
+        return resolved
+    
+    def _deadline_of(self, slot: int) -> float:
+        return self._anchor + slot * self._period
+    
+    def _record_jitter(self, jitter: float) -> None:
+        with self._stats_lock:
+            self._cycles += 1
+            self._last_jitter = jitter
+            self._jitter_sum += jitter
+            self._max_jitter = max(self._max_jitter, jitter)
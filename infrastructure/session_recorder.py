@@ -0,0 +1,377 @@
+import json
+import logging
+import os
+import queue
+import threading
+import time
+from dataclasses import dataclass
+from typing import BinaryIO, Iterator, Optional
+
+import numpy as np
+
+from config.settings import RECORDING_SETTINGS
+from core.algorithms import (
+    Voter,
+    AverageStrategy,
+    MedianStrategy,
+    MOutOfNStrategy,
+    MajorityStrategy,
+    AverageAdaptiveStrategy,
+)
+from core.interfaces import VotingStrategy
+from core.sample_record import SampleRecord
+
+
+logger = logging.getLogger(__name__)
+
+
+SESSION_MAGIC = b"SENSREC1"
+SESSION_VERSION = 1
+# Records start on a page boundary after a space-padded JSON header
+SESSION_HEADER_SIZE = 4096
+SEGMENT_SUFFIX = ".rec"
+
+
+def record_dtype(num_sensors: int, register_count: int, strategy_count: int) -> np.dtype:
+    return np.dtype([
+        ("sequence", "<i8"),
+        ("monotonic_time", "<f8"),
+        ("wall_time", "<f8"),
+        ("values", "<f8", (num_sensors,)),
+        ("mask", "?", (num_sensors,)),
+        ("registers", "<u2", (register_count,)),
+        ("votes", "<f8", (strategy_count,)),
+    ])
+
+
+@dataclass(frozen=True)
+class RecorderStats:
+    
+    records: int = 0
+    dropped: int = 0
+    segments: int = 0
+    bytes_written: int = 0
+    session_directory: str = ""
+
+
+class SessionRecorder:
+    
+    def __init__(
+        self,
+        directory: str = RECORDING_SETTINGS.DIRECTORY,
+        strategies: Optional[list[VotingStrategy]] = None,
+        segment_size_mb: int = RECORDING_SETTINGS.SEGMENT_SIZE_MB,
+        flush_interval: float = RECORDING_SETTINGS.FLUSH_INTERVAL,
+        max_pending: int = RECORDING_SETTINGS.MAX_PENDING,
+    ):
+        self._directory = directory
+        # The recorder votes with its own strategy instances so stateful ones
+        # see every sample, whatever the UI has switched on
+        if strategies is None:
+            strategies = [
+                AverageStrategy(),
+                MedianStrategy(),
+                MOutOfNStrategy(),
+                MajorityStrategy(),
+                AverageAdaptiveStrategy(),
+            ]
+        self._voter = Voter(strategies)
+        self._strategy_names = [strategy.name for strategy in strategies]
+        self._segment_size = segment_size_mb * 1024 * 1024
+        self._flush_interval = flush_interval
+        
+        self._pending: queue.Queue = queue.Queue(max_pending)
+        self._stop_event = threading.Event()
+        self._writer_thread: Optional[threading.Thread] = None
+        
+        self._session_directory = ""
+        self._file: Optional[BinaryIO] = None
+        self._layout: Optional[tuple[int, int]] = None
+        self._segment_bytes = 0
+        self._segments = 0
+        self._records = 0
+        self._dropped = 0
+        self._bytes_written = 0
+    
+    @property
+    def session_directory(self) -> str:
+        return self._session_directory
+    
+    @property
+    def is_recording(self) -> bool:
+        return self._writer_thread is not None and self._writer_thread.is_alive()
+    
+    @property
+    def stats(self) -> RecorderStats:
+        return RecorderStats(
+            records=self._records,
+            dropped=self._dropped,
+            segments=self._segments,
+            bytes_written=self._bytes_written,
+            session_directory=self._session_directory,
+        )
+    
+    def start(self) -> None:
+        if self.is_recording:
+            logger.warning("Session recorder already running")
+            return
+        
+        # Leftovers of a previous session that was stopped without a writer
+        while not self._pending.empty():
+            self._pending.get_nowait()
+        
+        self._session_directory = self._new_session_directory()
+        self._voter.reset()
+        self._stop_event.clear()
+        self._writer_thread = threading.Thread(
+            target=self._writer_loop,
+            name="SessionRecorder",
+            daemon=True,
+        )
+        self._writer_thread.start()
+        logger.info(f"Recording session to {self._session_directory}")
+    
+    def stop(self) -> None:
+        self._stop_event.set()
+        if self._writer_thread is not None:
+            # The writer closes its segment itself once the backlog is on disk
+            self._writer_thread.join(timeout=5.0)
+            if self._writer_thread.is_alive():
+                logger.warning("Session recorder is still writing its backlog")
+            self._writer_thread = None
+    
+    def record(self, record: SampleRecord, registers: np.ndarray) -> None:
+        # Called from the acquisition loop: never blocks it, a full backlog
+        # drops the sample instead
+        if self._stop_event.is_set():
+            return
+        
+        try:
+            self._pending.put_nowait((record, registers))
+        except queue.Full:
+            if self._dropped == 0:
+                logger.warning("Session recorder is falling behind, dropping samples")
+            self._dropped += 1
+    
+    def _new_session_directory(self) -> str:
+        base = os.path.join(self._directory, time.strftime("session_%Y%m%d_%H%M%S"))
+        path = base
+        suffix = 1
+        while os.path.exists(path):
+            path = f"{base}_{suffix}"
+            suffix += 1
+        os.makedirs(path)
+        return path
+    
+    def _writer_loop(self) -> None:
+        while True:
+            stopping = self._stop_event.wait(self._flush_interval)
+            try:
+                self._drain()
+            except Exception as e:
+                logger.error(f"Error writing session records: {e}")
+            if stopping:
+                break
+        
+        self._close_segment()
+    
+    def _drain(self) -> None:
+        items = []
+        while True:
+            try:
+                items.append(self._pending.get_nowait())
+            except queue.Empty:
+                break
+        
+        # Consecutive samples with the same shape are voted and written together
+        start = 0
+        for end in range(1, len(items) + 1):
+            if end == len(items) or self._item_layout(items[end]) != self._item_layout(items[start]):
+                self._write_run(items[start:end])
+                start = end
+    
+    @staticmethod
+    def _item_layout(item: tuple[SampleRecord, np.ndarray]) -> tuple[int, int]:
+        record, registers = item
+        return len(record.values), len(registers)
+    
+    def _write_run(self, items: list[tuple[SampleRecord, np.ndarray]]) -> None:
+        layout = self._item_layout(items[0])
+        num_sensors, register_count = layout
+        rows = np.zeros(len(items), dtype=record_dtype(num_sensors, register_count, len(self._strategy_names)))
+        
+        rows["sequence"] = [record.sequence for record, _ in items]
+        rows["monotonic_time"] = [record.monotonic_time for record, _ in items]
+        rows["wall_time"] = [record.wall_time for record, _ in items]
+        if num_sensors:
+            rows["values"] = np.stack([record.values for record, _ in items])
+            rows["mask"] = np.stack([record.mask for record, _ in items])
+        if register_count:
+            rows["registers"] = np.stack([np.asarray(registers, dtype=np.int64) & 0xFFFF for _, registers in items])
+        
+        if self._strategy_names and num_sensors:
+            votes = self._voter.vote_batch(rows["values"], rows["mask"])
+            rows["votes"] = np.column_stack([votes[name] for name in self._strategy_names])
+        else:
+            rows["votes"] = np.nan
+        
+        data = rows.tobytes()
+        if self._file is None or layout != self._layout or (
+            self._segment_bytes and self._segment_bytes + len(data) > self._segment_size
+        ):
+            self._open_segment(layout)
+        
+        self._file.write(data)
+        self._file.flush()
+        self._segment_bytes += len(data)
+        self._bytes_written += len(data)
+        self._records += len(items)
+    
+    def _open_segment(self, layout: tuple[int, int]) -> None:
+        self._close_segment()
+        
+        num_sensors, register_count = layout
+        header = json.dumps({
+            "version": SESSION_VERSION,
+            "num_sensors": num_sensors,
+            "register_count": register_count,
+            "strategies": self._strategy_names,
+            "created": time.time(),
+        }).encode("utf-8")
+        if len(SESSION_MAGIC) + len(header) > SESSION_HEADER_SIZE:
+            raise ValueError("Session header does not fit in its block")
+        
+        path = os.path.join(self._session_directory, f"segment_{self._segments:05d}{SEGMENT_SUFFIX}")
+        self._file = open(path, "wb")
+        self._file.write((SESSION_MAGIC + header).ljust(SESSION_HEADER_SIZE, b" "))
+        self._layout = layout
+        self._segment_bytes = 0
+        self._segments += 1
+    
+    def _close_segment(self) -> None:
+        if self._file is not None:
+            try:
+                self._file.close()
+            except OSError as e:
+                logger.warning(f"Error closing session segment: {e}")
+            finally:
+                self._file = None
+                self._layout = None
+
+
+class SessionSegment:
+    
+    def __init__(self, path: str):
+        with open(path, "rb") as file:
+            header = file.read(SESSION_HEADER_SIZE)
+        if len(header) < SESSION_HEADER_SIZE or not header.startswith(SESSION_MAGIC):
+            raise ValueError(f"Not a session segment: {path}")
+        
+        self._path = path
+        self._header = json.loads(header[len(SESSION_MAGIC):].decode("utf-8"))
+        if self._header.get("version") != SESSION_VERSION:
+            raise ValueError(f"Unsupported session version {self._header.get('version')} in {path}")
+        
+        self._dtype = record_dtype(self.num_sensors, self.register_count, len(self.strategies))
+        # A record cut short by a crash is left out
+        count = (os.path.getsize(path) - SESSION_HEADER_SIZE) // self._dtype.itemsize
+        if count:
+            self._records = np.memmap(path, dtype=self._dtype, mode="r", offset=SESSION_HEADER_SIZE, shape=(count,))
+        else:
+            self._records = np.zeros(0, dtype=self._dtype)
+    
+    @property
+    def path(self) -> str:
+        return self._path
+    
+    @property
+    def num_sensors(self) -> int:
+        return self._header["num_sensors"]
+    
+    @property
+    def register_count(self) -> int:
+        return self._header["register_count"]
+    
+    @property
+    def strategies(self) -> list[str]:
+        return list(self._header["strategies"])
+    
+    @property
+    def created(self) -> float:
+        return self._header["created"]
+    
+    @property
+    def records(self) -> np.ndarray:
+        return self._records
+    
+    def __len__(self) -> int:
+        return len(self._records)
+    
+    def votes(self, strategy_name: str) -> np.ndarray:
+        return self._records["votes"][:, self._header["strategies"].index(strategy_name)]
+    
+    def sample_records(self, start: int = 0, stop: Optional[int] = None) -> list[SampleRecord]:
+        rows = self._records[start:stop]
+        values = np.array(rows["values"])
+        masks = np.array(rows["mask"])
+        return [
+            SampleRecord(int(sequence), float(monotonic_time), float(wall_time), values[row], masks[row])
+            for row, (sequence, monotonic_time, wall_time) in enumerate(
+                zip(rows["sequence"].tolist(), rows["monotonic_time"].tolist(), rows["wall_time"].tolist())
+            )
+        ]
+
+
+class SessionReader:
+    
+    def __init__(self, directory: str):
+        names = sorted(name for name in os.listdir(directory) if name.endswith(SEGMENT_SUFFIX))
+        if not names:
+            raise ValueError(f"No session segments in {directory}")
+        
+        self._directory = directory
+        self._segments = [SessionSegment(os.path.join(directory, name)) for name in names]
+    
+    @property
+    def directory(self) -> str:
+        return self._directory
+    
+    @property
+    def segments(self) -> list[SessionSegment]:
+        return self._segments.copy()
+    
+    @property
+    def strategies(self) -> list[str]:
+        return self._segments[0].strategies
+    
+    def __len__(self) -> int:
+        return sum(len(segment) for segment in self._segments)
+    
+    def time_range(self) -> tuple[float, float]:
+        filled = [segment for segment in self._segments if len(segment)]
+        if not filled:
+            return 0.0, 0.0
+        return float(filled[0].records["wall_time"][0]), float(filled[-1].records["wall_time"][-1])
+    
+    def locate(self, wall_time: float) -> tuple[int, int]:
+        # Binary search touches only a handful of pages of each segment
+        for index, segment in enumerate(self._segments):
+            if len(segment) and segment.records["wall_time"][-1] >= wall_time:
+                return index, int(np.searchsorted(segment.records["wall_time"], wall_time))
+        return len(self._segments), 0
+    
+    def iter_batches(
+        self,
+        batch_size: int = 1000,
+        start_time: Optional[float] = None,
+    ) -> Iterator[tuple[SessionSegment, np.ndarray]]:
+        first_segment, first_row = (0, 0) if start_time is None else self.locate(start_time)
+        
+        for index in range(first_segment, len(self._segments)):
+            segment = self._segments[index]
+            start = first_row if index == first_segment else 0
+            for offset in range(start, len(segment), batch_size):
+                yield segment, segment.records[offset:offset + batch_size]
+    
+    def close(self) -> None:
+        self._segments = []
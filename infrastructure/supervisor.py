@@ -0,0 +1,145 @@
+import random
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+from config.settings import MODBUS_SETTINGS
+
+
+CONNECTION_CONNECTING = "connecting"
+CONNECTION_CONNECTED = "connected"
+CONNECTION_RECONNECTING = "reconnecting"
+CONNECTION_STOPPED = "stopped"
+
+
+@dataclass(frozen=True)
+class ConnectionStats:
+    
+    state: str = CONNECTION_STOPPED
+    connects: int = 0
+    connection_losses: int = 0
+    failed_attempts: int = 0
+    watchdog_restarts: int = 0
+    downtime: float = 0.0
+    current_downtime: float = 0.0
+    next_retry_in: float = 0.0
+    last_error: str = ""
+
+
+class ExponentialBackoff:
+    
+    def __init__(
+        self,
+        initial_delay: float = MODBUS_SETTINGS.RECONNECT_INITIAL_DELAY,
+        max_delay: float = MODBUS_SETTINGS.RECONNECT_MAX_DELAY,
+        jitter: float = MODBUS_SETTINGS.RECONNECT_JITTER,
+        rng: Optional[random.Random] = None,
+    ):
+        self._initial_delay = initial_delay
+        self._max_delay = max_delay
+        self._jitter = jitter
+        self._rng = rng or random.Random()
+        self._attempt = 0
+    
+    @property
+    def attempt(self) -> int:
+        return self._attempt
+    
+    def next_delay(self) -> float:
+        delay = min(self._max_delay, self._initial_delay * 2 ** self._attempt)
+        self._attempt += 1
+        # Jitter keeps stations that lost the same gateway from retrying in lockstep
+        return delay * (1.0 + self._rng.uniform(-self._jitter, self._jitter))
+    
+    def reset(self) -> None:
+        self._attempt = 0
+
+
+class ConnectionMonitor:
+    
+    def __init__(self, clock: Callable[[], float] = time.monotonic):
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._state = CONNECTION_STOPPED
+        self._connects = 0
+        self._connection_losses = 0
+        self._failed_attempts = 0
+        self._watchdog_restarts = 0
+        self._downtime = 0.0
+        self._down_since: Optional[float] = None
+        self._retry_at: Optional[float] = None
+        self._last_error = ""
+    
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._state
+    
+    def connecting(self) -> None:
+        with self._lock:
+            self._state = CONNECTION_CONNECTING
+            self._retry_at = None
+            self._mark_down()
+    
+    def connected(self) -> None:
+        with self._lock:
+            self._state = CONNECTION_CONNECTED
+            self._connects += 1
+            self._retry_at = None
+            self._mark_up()
+    
+    def attempt_failed(self, error: Exception, retry_in: float) -> None:
+        with self._lock:
+            self._state = CONNECTION_RECONNECTING
+            self._failed_attempts += 1
+            self._retry_at = self._clock() + retry_in
+            self._last_error = str(error)
+            self._mark_down()
+    
+    def connection_lost(self, error: Exception) -> None:
+        with self._lock:
+            self._state = CONNECTION_RECONNECTING
+            self._connection_losses += 1
+            self._last_error = str(error)
+            self._mark_down()
+    
+    def watchdog_restart(self, reason: str, stalled_for: float) -> None:
+        with self._lock:
+            self._state = CONNECTION_RECONNECTING
+            self._watchdog_restarts += 1
+            self._last_error = reason
+            # The stall itself was downtime, not just the restart after it
+            if self._down_since is None:
+                self._down_since = self._clock() - stalled_for
+    
+    def stopped(self) -> None:
+        with self._lock:
+            self._state = CONNECTION_STOPPED
+            self._retry_at = None
+            self._mark_up()
+    
+    def stats(self) -> ConnectionStats:
+        with self._lock:
+            now = self._clock()
+            current_downtime = now - self._down_since if self._down_since is not None else 0.0
+            return ConnectionStats(
+                state=self._state,
+                connects=self._connects,
+                connection_losses=self._connection_losses,
+                failed_attempts=self._failed_attempts,
+                watchdog_restarts=self._watchdog_restarts,
+                downtime=self._downtime + current_downtime,
+                current_downtime=current_downtime,
+                next_retry_in=max(0.0, self._retry_at - now) if self._retry_at is not None else 0.0,
+                last_error=self._last_error,
+            )
+    
+    def _mark_down(self) -> None:
+        if self._down_since is None:
+            self._down_since = self._clock()
+    
+    def _mark_up(self) -> None:
+        if self._down_since is not None:
+            self._downtime += self._clock() - self._down_since
+            self._down_since = None
@@ -0,0 +1,216 @@
+import logging
+import socket
+import threading
+from typing import Optional
+
+import numpy as np
+
+from config.settings import MODBUS_SETTINGS
+from core.interfaces import ModbusReader
+from infrastructure.modbus_frames import MBAP_HEADER_LENGTH, ModbusFrames
+from infrastructure.register_plan import RegisterBlock
+
+
+logger = logging.getLogger(__name__)
+
+
+class TcpGatewayConnection:
+    
+    def __init__(self, host: str, port: int = MODBUS_SETTINGS.TCP_PORT):
+        self._host = host
+        self._port = port
+        self._socket: Optional[socket.socket] = None
+        self._lock = threading.Lock()
+        self._transaction_id = 0
+        self._reconnects = 0
+    
+    @property
+    def name(self) -> str:
+        return f"{self._host}:{self._port}"
+    
+    @property
+    def reconnects(self) -> int:
+        return self._reconnects
+    
+    def open(self, timeout: float = MODBUS_SETTINGS.TIMEOUT) -> None:
+        with self._lock:
+            if self._socket is None:
+                self._open(timeout)
+    
+    def close(self) -> None:
+        with self._lock:
+            self._close()
+    
+    def is_connected(self) -> bool:
+        return self._socket is not None
+    
+    def transact(self, unit: int, pdus: list[bytes], timeout: float) -> list[bytes]:
+        # One retry on a fresh socket hides gateway restarts and idle
+        # disconnects from the caller
+        with self._lock:
+            for attempt in range(2):
+                if self._socket is None:
+                    self._open(timeout)
+                    if attempt:
+                        self._reconnects += 1
+                
+                try:
+                    return self._exchange(unit, pdus, timeout)
+                except TimeoutError:
+                    # Late responses would be stale; start the next call clean
+                    self._close()
+                    raise
+                except OSError as e:
+                    self._close()
+                    if attempt:
+                        raise ConnectionError(f"Lost connection to {self.name}: {e}") from e
+                    logger.warning(f"Connection to {self.name} lost, reconnecting: {e}")
+    
+    def _open(self, timeout: float) -> None:
+        try:
+            self._socket = socket.create_connection((self._host, self._port), timeout=timeout)
+            self._socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            logger.info(f"Connected to Modbus TCP gateway {self.name}")
+        except OSError as e:
+            raise ConnectionError(f"Failed to connect to {self.name}: {e}") from e
+    
+    def _close(self) -> None:
+        if self._socket is not None:
+            try:
+                self._socket.close()
+            except OSError as e:
+                logger.warning(f"Error closing {self.name}: {e}")
+            finally:
+                self._socket = None
+    
+    def _exchange(self, unit: int, pdus: list[bytes], timeout: float) -> list[bytes]:
+        # All requests go out before the first response is awaited, so a
+        # multi-block read costs one round trip instead of one per block
+        positions = {}
+        frames = []
+        for position, pdu in enumerate(pdus):
+            self._transaction_id = (self._transaction_id + 1) & 0xFFFF
+            positions[self._transaction_id] = position
+            frames.append(ModbusFrames.mbap_frame(self._transaction_id, unit, pdu))
+        
+        self._socket.settimeout(timeout)
+        self._socket.sendall(b"".join(frames))
+        
+        responses: list[Optional[bytes]] = [None] * len(pdus)
+        while positions:
+            header = self._receive(MBAP_HEADER_LENGTH)
+            transaction_id, length, _ = ModbusFrames.parse_mbap_header(header)
+            pdu = self._receive(length)
+            
+            position = positions.pop(transaction_id, None)
+            if position is not None:
+                responses[position] = pdu
+        
+        return responses
+    
+    def _receive(self, size: int) -> bytes:
+        buffer = bytearray()
+        while len(buffer) < size:
+            chunk = self._socket.recv(size - len(buffer))
+            if not chunk:
+                raise ConnectionResetError("Gateway closed the connection")
+            buffer += chunk
+        return bytes(buffer)
+
+
+class TcpConnectionPool:
+    
+    def __init__(self):
+        self._connections: dict[tuple[str, int], TcpGatewayConnection] = {}
+        self._users: dict[tuple[str, int], int] = {}
+        self._lock = threading.Lock()
+    
+    def acquire(self, host: str, port: int) -> TcpGatewayConnection:
+        # Slaves behind one gateway share a single persistent socket
+        key = (host, port)
+        with self._lock:
+            if key not in self._connections:
+                self._connections[key] = TcpGatewayConnection(host, port)
+                self._users[key] = 0
+            self._users[key] += 1
+            return self._connections[key]
+    
+    def release(self, connection: TcpGatewayConnection) -> None:
+        with self._lock:
+            for key, pooled in self._connections.items():
+                if pooled is connection:
+                    self._users[key] -= 1
+                    if self._users[key] == 0:
+                        del self._connections[key]
+                        del self._users[key]
+                        connection.close()
+                    return
+    
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._connections)
+
+
+TCP_CONNECTION_POOL = TcpConnectionPool()
+
+
+class TcpModbusReader(ModbusReader):
+    
+    def __init__(
+        self,
+        host: str = MODBUS_SETTINGS.TCP_HOST,
+        unit: int = MODBUS_SETTINGS.ADDRESS,
+        port: int = MODBUS_SETTINGS.TCP_PORT,
+        timeout: float = MODBUS_SETTINGS.TIMEOUT,
+        pool: TcpConnectionPool = TCP_CONNECTION_POOL,
+    ):
+        self._host = host
+        self._unit = unit
+        self._port = port
+        self._timeout = timeout
+        self._pool = pool
+        self._connection: Optional[TcpGatewayConnection] = None
+    
+    @property
+    def port(self) -> str:
+        return f"{self._host}:{self._port}"
+    
+    @property
+    def address(self) -> int:
+        return self._unit
+    
+    def connect(self) -> None:
+        if self._connection is None:
+            self._connection = self._pool.acquire(self._host, self._port)
+        
+        try:
+            self._connection.open(self._timeout)
+        except ConnectionError as e:
+            logger.error(f"Failed to connect to Modbus unit {self._unit} at {self.port}: {e}")
+            raise
+    
+    def disconnect(self) -> None:
+        if self._connection is not None:
+            self._pool.release(self._connection)
+            self._connection = None
+    
+    def is_connected(self) -> bool:
+        return self._connection is not None and self._connection.is_connected()
+    
+    def read_registers(self, start_address: int, count: int) -> list[int]:
+        return self.read_register_blocks([RegisterBlock(start_address, count)])[0].tolist()
+    
+    def read_register_blocks(self, blocks: list[RegisterBlock]) -> list[np.ndarray]:
+        if self._connection is None:
+            raise RuntimeError("Not connected to Modbus device")
+        
+        function_code = MODBUS_SETTINGS.FUNCTION_CODE
+        responses = self._connection.transact(
+            self._unit,
+            [ModbusFrames.read_request_pdu(function_code, block.start, block.count) for block in blocks],
+            self._timeout,
+        )
+        return [
+            ModbusFrames.parse_read_response_pdu(response, function_code, block.count)
+            for block, response in zip(blocks, responses)
+        ]
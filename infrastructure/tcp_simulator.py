@@ -0,0 +1,162 @@
+import logging
+import socket
+import socketserver
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+from infrastructure.loopback_device import LoopbackDevice
+from infrastructure.modbus_frames import MBAP_HEADER_LENGTH, ModbusFrames
+
+
+logger = logging.getLogger(__name__)
+
+
+GATEWAY_TARGET_FAILED = 11
+
+
+class _SimulatorServer(socketserver.ThreadingTCPServer):
+    
+    daemon_threads = True
+    allow_reuse_address = True
+    
+    def __init__(self, address: tuple[str, int], simulator: "ModbusTcpSimulator"):
+        self.simulator = simulator
+        super().__init__(address, _SimulatorHandler)
+
+
+class _SimulatorHandler(socketserver.BaseRequestHandler):
+    
+    def handle(self) -> None:
+        simulator = self.server.simulator
+        simulator.connection_opened(self.request)
+        self.request.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        write_lock = threading.Lock()
+        
+        # Requests are answered concurrently, like a gateway fronting
+        # several slaves, so pipelined clients see out-of-order replies
+        with ThreadPoolExecutor(max_workers=simulator.workers) as executor:
+            try:
+                while True:
+                    header = self._receive(MBAP_HEADER_LENGTH)
+                    if header is None:
+                        break
+                    
+                    transaction_id, length, unit = ModbusFrames.parse_mbap_header(header)
+                    pdu = self._receive(length)
+                    if pdu is None:
+                        break
+                    
+                    executor.submit(self._respond, write_lock, transaction_id, unit, pdu)
+            except (OSError, ValueError) as e:
+                logger.debug(f"Simulator connection closed: {e}")
+            finally:
+                simulator.connection_closed(self.request)
+    
+    def _respond(self, write_lock: threading.Lock, transaction_id: int, unit: int, pdu: bytes) -> None:
+        latency, response = self.server.simulator.handle(unit, pdu)
+        if response is None:
+            return
+        
+        time.sleep(latency)
+        try:
+            with write_lock:
+                self.request.sendall(ModbusFrames.mbap_frame(transaction_id, unit, response))
+        except OSError:
+            pass
+    
+    def _receive(self, size: int) -> Optional[bytes]:
+        buffer = bytearray()
+        while len(buffer) < size:
+            chunk = self.request.recv(size - len(buffer))
+            if not chunk:
+                return None
+            buffer += chunk
+        return bytes(buffer)
+
+
+class ModbusTcpSimulator:
+    
+    def __init__(
+        self,
+        devices: dict[int, LoopbackDevice],
+        host: str = "127.0.0.1",
+        port: int = 0,
+        workers: int = 8,
+    ):
+        self._devices = devices
+        self._host = host
+        self._port = port
+        self._workers = workers
+        self._server: Optional[_SimulatorServer] = None
+        self._thread: Optional[threading.Thread] = None
+        self._device_lock = threading.Lock()
+        self._sockets: set = set()
+        self._connections = 0
+    
+    @property
+    def address(self) -> tuple[str, int]:
+        if self._server is None:
+            return self._host, self._port
+        return self._server.server_address[:2]
+    
+    @property
+    def workers(self) -> int:
+        return self._workers
+    
+    @property
+    def connections(self) -> int:
+        return self._connections
+    
+    def start(self) -> None:
+        if self._server is not None:
+            return
+        
+        self._server = _SimulatorServer((self._host, self._port), self)
+        self._thread = threading.Thread(
+            target=self._server.serve_forever,
+            name="ModbusTcpSimulator",
+            daemon=True,
+        )
+        self._thread.start()
+        logger.info(f"Modbus TCP simulator listening on {self.address[0]}:{self.address[1]}")
+    
+    def stop(self) -> None:
+        if self._server is None:
+            return
+        
+        self._server.shutdown()
+        self._server.server_close()
+        
+        # Dropping open sockets too makes stop() look like a gateway restart
+        with self._device_lock:
+            sockets = list(self._sockets)
+        for connection in sockets:
+            try:
+                connection.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+        
+        self._thread.join(timeout=2.0)
+        self._server = None
+        self._thread = None
+    
+    def connection_opened(self, connection: socket.socket) -> None:
+        with self._device_lock:
+            self._sockets.add(connection)
+            self._connections += 1
+    
+    def connection_closed(self, connection: socket.socket) -> None:
+        with self._device_lock:
+            self._sockets.discard(connection)
+    
+    def handle(self, unit: int, pdu: bytes) -> tuple[float, Optional[bytes]]:
+        device = self._devices.get(unit)
+        if device is None:
+            return 0.0, ModbusFrames.exception_pdu(pdu[0], GATEWAY_TARGET_FAILED)
+        
+        # LoopbackDevice keeps its own random state, which is not thread-safe
+        with self._device_lock:
+            response = device.handle(pdu)
+        return device.latency, response
@@ -1,9 +1,22 @@
+import argparse
 import logging
 import sys
+from typing import Optional
 
-from config.settings import MODBUS_SETTINGS, SENSOR_SETTINGS
+from config.settings import MODBUS_SETTINGS, RECORDING_SETTINGS, SENSOR_SETTINGS
+from core.interfaces import DataQueueProvider
+from infrastructure.async_service import AsyncModbusService
+from infrastructure.async_transport import AsyncModbusDevice, AsyncRtuTransport
+from infrastructure.loopback_device import LoopbackDevice, LoopbackTransport
 from infrastructure.modbus_service import ModbusService
+from infrastructure.polling_engine import BusConfig
+from infrastructure.polling_service import PollingModbusService
+from infrastructure.process_service import ProcessModbusService
+from infrastructure.replay_service import ReplayService
+from infrastructure.session_recorder import SessionRecorder
+from infrastructure.tcp_reader import TcpModbusReader
 from ui.main_window import MainWindow
+from utils.register_map import RegisterMap
 
 
 def setup_logging() -> None:
@@ -16,24 +29,97 @@ def setup_logging() -> None:
     )
 
 
-def create_modbus_service() -> ModbusService:
+def parse_args(argv: Optional[list[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Live temperature sensor voting")
+    parser.add_argument(
+        "--replay",
+        metavar="PATH",
+        help="replay a recorded session directory or an exported CSV instead of reading Modbus",
+    )
+    parser.add_argument(
+        "--speed",
+        type=float,
+        default=1.0,
+        help="replay speed factor, e.g. 1 or 100; 0 replays as fast as the UI consumes",
+    )
+    parser.add_argument(
+        "--loop",
+        action="store_true",
+        help="start the replay over when it reaches the end",
+    )
+    return parser.parse_args(argv)
+
+
+def create_modbus_service() -> DataQueueProvider:
+    recorder = SessionRecorder(RECORDING_SETTINGS.DIRECTORY) if RECORDING_SETTINGS.ENABLED else None
+    
+    if MODBUS_SETTINGS.BUSES:
+        return PollingModbusService(
+            buses=[BusConfig.from_dict(bus) for bus in MODBUS_SETTINGS.BUSES],
+            num_sensors=SENSOR_SETTINGS.DEFAULT_NUM_SENSORS,
+            reading_frequency=SENSOR_SETTINGS.DEFAULT_READING_FREQUENCY,
+            recorder=recorder,
+        )
+    
+    if MODBUS_SETTINGS.TCP_HOST:
+        return ModbusService(
+            num_sensors=SENSOR_SETTINGS.DEFAULT_NUM_SENSORS,
+            reading_frequency=SENSOR_SETTINGS.DEFAULT_READING_FREQUENCY,
+            reader=TcpModbusReader(MODBUS_SETTINGS.TCP_HOST, MODBUS_SETTINGS.ADDRESS, MODBUS_SETTINGS.TCP_PORT),
+            recorder=recorder,
+        )
+    
+    if SENSOR_SETTINGS.ACQUISITION_MODE in ("async", "loopback"):
+        if SENSOR_SETTINGS.ACQUISITION_MODE == "loopback":
+            # The simulated slave exposes every sensor so the count can be changed freely
+            num_registers = SENSOR_SETTINGS.MAX_SENSORS
+            transport = LoopbackTransport({MODBUS_SETTINGS.ADDRESS: LoopbackDevice(num_registers)})
+        else:
+            num_registers = SENSOR_SETTINGS.DEFAULT_NUM_SENSORS
+            transport = AsyncRtuTransport(MODBUS_SETTINGS.PORT, MODBUS_SETTINGS.BAUDRATE)
+        
+        return AsyncModbusService(
+            devices=[AsyncModbusDevice(transport, MODBUS_SETTINGS.ADDRESS, num_registers)],
+            num_sensors=SENSOR_SETTINGS.DEFAULT_NUM_SENSORS,
+            reading_frequency=SENSOR_SETTINGS.DEFAULT_READING_FREQUENCY,
+            recorder=recorder,
+        )
+    
+    register_map = RegisterMap.from_dicts(MODBUS_SETTINGS.REGISTER_MAP) if MODBUS_SETTINGS.REGISTER_MAP else None
+    if SENSOR_SETTINGS.ACQUISITION_MODE == "process":
+        return ProcessModbusService(
+            port=MODBUS_SETTINGS.PORT,
+            address=MODBUS_SETTINGS.ADDRESS,
+            baudrate=MODBUS_SETTINGS.BAUDRATE,
+            num_sensors=SENSOR_SETTINGS.DEFAULT_NUM_SENSORS,
+            reading_frequency=SENSOR_SETTINGS.DEFAULT_READING_FREQUENCY,
+            register_map=register_map,
+            record_directory=RECORDING_SETTINGS.DIRECTORY if RECORDING_SETTINGS.ENABLED else None,
+        )
+    
     return ModbusService(
         port=MODBUS_SETTINGS.PORT,
         address=MODBUS_SETTINGS.ADDRESS,
         baudrate=MODBUS_SETTINGS.BAUDRATE,
         num_sensors=SENSOR_SETTINGS.DEFAULT_NUM_SENSORS,
         reading_frequency=SENSOR_SETTINGS.DEFAULT_READING_FREQUENCY,
+        register_map=register_map,
+        recorder=recorder,
     )
 
 
-def main() -> int:
+def main(argv: Optional[list[str]] = None) -> int:
+    args = parse_args(argv)
     setup_logging()
     logger = logging.getLogger(__name__)
     
     logger.info("Starting Sensor Fusion Application")
     
     try:
-        modbus_service = create_modbus_service()
+        if args.replay:
+            modbus_service = ReplayService(args.replay, speed=args.speed, loop=args.loop)
+        else:
+            modbus_service = create_modbus_service()
         modbus_service.start()
         app = MainWindow(data_provider=modbus_service)
         logger.info("Application initialized, starting main loop")
@@ -1,13 +1,27 @@
+import time
+from datetime import datetime
 from typing import Optional
 
 import customtkinter as ctk
 import matplotlib.pyplot as plt
+from matplotlib.backend_bases import DrawEvent
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 from matplotlib.figure import Figure
 from matplotlib.axes import Axes
+from matplotlib.collections import LineCollection
+from matplotlib.legend import Legend
+from matplotlib.lines import Line2D
+import numpy as np
 
 from config.settings import CHART_SETTINGS
+from core.sample_record import SampleRecord
 from utils.data_parser import DataParser
+from utils.decimation import DECIMATION_LTTB, DECIMATION_MIN_MAX, Decimator
+from utils.ring_buffer import HistoryStore, RingBuffer
+
+
+RENDER_MODE_BLIT = "blit"
+RENDER_MODE_FULL = "full"
 
 
 class ChartWidget(ctk.CTkFrame):
@@ -16,23 +30,62 @@ class ChartWidget(ctk.CTkFrame):
         self,
         parent: ctk.CTkBaseClass,
         num_sensors: int = 6,
+        render_mode: str = CHART_SETTINGS.RENDER_MODE,
+        capacity: int = CHART_SETTINGS.HISTORY_CAPACITY,
+        spill_history: bool = CHART_SETTINGS.SPILL_HISTORY,
         **kwargs,
     ):
         super().__init__(parent, **kwargs)
         
+        if render_mode not in (RENDER_MODE_BLIT, RENDER_MODE_FULL):
+            raise ValueError(f"Unknown render mode: {render_mode}")
+        
         self._num_sensors = num_sensors
+        self._render_mode = render_mode
+        self._max_capacity = capacity
+        self._capacity = self._history_capacity(num_sensors)
+        self._spill_history = spill_history
         
         self._fig: Optional[Figure] = None
         self._ax: Optional[Axes] = None
         self._canvas: Optional[FigureCanvasTkAgg] = None
         
-        self._x_data: list[float] = []
-        self._y_data_raw: list[list[float]] = [[] for _ in range(num_sensors)]
-        self._y_data_smoothed: list[list[float]] = [[] for _ in range(num_sensors)]
-        self._voting_data: dict[str, list[Optional[float]]] = {}
+        self._x_data = self._create_buffer(1)
+        self._meta_data = self._create_buffer(2)
+        self._y_data_raw = self._create_buffer(num_sensors)
+        self._y_data_smoothed = self._create_buffer(num_sensors, spill=False)
+        self._voting_data: dict[str, RingBuffer] = {}
         
+        self._time_origin: Optional[float] = None
+        self._last_sequence: Optional[int] = None
+        self._last_raw: Optional[np.ndarray] = None
+        
+        # The smoothed series is derived from the raw one on demand and cached
+        # per factor; only rows appended since the last draw are filtered
         self._smoothing_factor = CHART_SETTINGS.DEFAULT_SMOOTHING_FACTOR
+        self._smoothed_factor: Optional[float] = None
+        self._smoothed_rows = 0
+        self._smoothed_seed: Optional[np.ndarray] = None
+        self._active_strategies: list[str] = []
         self._reading_frequency = 1.0
+        
+        self._sensor_lines: dict[int, Line2D] = {}
+        self._sensor_collection: Optional[LineCollection] = None
+        self._voting_lines: dict[str, Line2D] = {}
+        self._legend: Optional[Legend] = None
+        self._artist_layout: Optional[tuple] = None
+        self._background = None
+        self._draw_cid: Optional[int] = None
+        
+        self._y_min = np.inf
+        self._y_max = -np.inf
+        self._fit_limits = True
+        
+        self._last_batch_size = 0
+        self._max_batch_size = 0
+        self._last_latency = 0.0
+        self._max_latency = 0.0
+        self._missed_samples = 0
     
     def initialize(self) -> None:
         if self._fig is not None:
@@ -42,10 +95,21 @@ class ChartWidget(ctk.CTkFrame):
         self._fig, self._ax = plt.subplots()
         self._canvas = FigureCanvasTkAgg(self._fig, master=self)
         self._canvas.get_tk_widget().pack(fill="both", expand=True)
+        
+        self._ax.grid(True, linestyle="--", alpha=0.3)
+        self._ax.set_xlabel("Time [s]")
+        self._ax.set_ylabel("Temperature [ºC]")
+        self._ax.set_title("Temperature Live Data")
         self._fig.tight_layout()
+        
+        self._draw_cid = self._canvas.mpl_connect("draw_event", self._on_draw)
+        self._fit_limits = True
     
     def destroy_chart(self) -> None:
         if self._canvas:
+            if self._draw_cid is not None:
+                self._canvas.mpl_disconnect(self._draw_cid)
+                self._draw_cid = None
             self._canvas.get_tk_widget().destroy()
             self._canvas = None
         
@@ -54,119 +118,427 @@ class ChartWidget(ctk.CTkFrame):
             self._fig = None
         
         self._ax = None
+        self._reset_artists()
+    
+    def _history_capacity(self, num_sensors: int) -> int:
+        # Every buffer row is stored twice (mirrored ring) as float64: raw and
+        # smoothed sensors plus time and metadata columns
+        row_bytes = 2 * 8 * (2 * num_sensors + 3)
+        budget = CHART_SETTINGS.HISTORY_MEMORY_LIMIT_MB * 1024 * 1024
+        return max(1, min(self._max_capacity, budget // row_bytes))
+    
+    def _create_buffer(self, width: int, spill: bool = True) -> RingBuffer:
+        history = HistoryStore(width) if spill and self._spill_history else None
+        return RingBuffer(self._capacity, width, history)
+    
+    def destroy(self) -> None:
+        for buffer in (self._x_data, self._meta_data, self._y_data_raw, self._y_data_smoothed, *self._voting_data.values()):
+            buffer.close()
+        super().destroy()
     
     def clear_data(self) -> None:
         self._x_data.clear()
-        self._y_data_raw = [[] for _ in range(self._num_sensors)]
-        self._y_data_smoothed = [[] for _ in range(self._num_sensors)]
+        self._meta_data.clear()
+        self._y_data_raw.clear()
+        self._y_data_smoothed.clear()
+        for buffer in self._voting_data.values():
+            buffer.close()
         self._voting_data.clear()
+        self._time_origin = None
+        self._last_sequence = None
+        self._last_raw = None
+        self._smoothed_factor = None
+        self._smoothed_rows = 0
+        self._smoothed_seed = None
+        self._y_min = np.inf
+        self._y_max = -np.inf
+        self._fit_limits = True
+        self._artist_layout = None
+        self._last_batch_size = 0
+        self._max_batch_size = 0
+        self._last_latency = 0.0
+        self._max_latency = 0.0
+        self._missed_samples = 0
     
     def update_chart(
         self,
-        sensor_data: list[Optional[float]],
+        record: SampleRecord,
         voting_results: dict[str, Optional[float]],
         active_strategies: list[str],
+    ) -> None:
+        self.update_chart_batch([record], [voting_results], active_strategies)
+    
+    def update_chart_batch(
+        self,
+        records: list[SampleRecord],
+        voting_batch: list[dict[str, Optional[float]]],
+        active_strategies: list[str],
     ) -> None:
         if self._ax is None or self._fig is None:
             return
         
-        if self._x_data:
-            self._x_data.append(self._x_data[-1] + self._reading_frequency)
-        else:
-            self._x_data.append(0)
+        if len(records) != len(voting_batch):
+            raise ValueError("Sample and voting batches must have the same length")
         
-        for i in range(min(len(sensor_data), self._num_sensors)):
-            raw_value = sensor_data[i]
-            
-            if raw_value is None:
-                if self._y_data_raw[i]:
-                    raw_value = self._y_data_raw[i][-1]
-                else:
-                    raw_value = 0.0
-            
-            self._y_data_raw[i].append(raw_value)
-            
-            if self._y_data_smoothed[i]:
-                previous_smoothed = self._y_data_smoothed[i][-1]
-            else:
-                previous_smoothed = raw_value
-            
-            smoothed_value = DataParser.apply_exponential_smoothing(raw_value, previous_smoothed, self._smoothing_factor)
-            self._y_data_smoothed[i].append(smoothed_value)
+        if not records:
+            return
         
-        for name, value in voting_results.items():
-            if name not in self._voting_data:
-                self._voting_data[name] = []
-            self._voting_data[name].append(value)
+        self._append_samples(records, voting_batch)
         
+        self._last_batch_size = len(records)
+        self._max_batch_size = max(self._max_batch_size, self._last_batch_size)
+        self._active_strategies = list(active_strategies)
         self._redraw(active_strategies)
+        
+        now = time.monotonic()
+        self._last_latency = records[-1].latency(now)
+        self._max_latency = max(self._max_latency, records[0].latency(now))
+    
+    def _append_samples(
+        self,
+        records: list[SampleRecord],
+        voting_batch: list[dict[str, Optional[float]]],
+    ) -> None:
+        count = len(records)
+        
+        raw = np.full((count, self._num_sensors), np.nan)
+        for row, record in enumerate(records):
+            values = record.values[:self._num_sensors]
+            raw[row, :len(values)] = values
+        
+        # Missing readings repeat the sensor's last value, carried across batches
+        raw = DataParser.forward_fill(raw, previous=self._last_raw)
+        self._last_raw = raw[-1].copy()
+        
+        monotonic_times = np.array([record.monotonic_time for record in records])
+        sequences = np.array([record.sequence for record in records], dtype=np.int64)
+        if self._time_origin is None:
+            self._time_origin = monotonic_times[0]
+        x = monotonic_times - self._time_origin
+        meta = np.column_stack((
+            [record.wall_time for record in records],
+            sequences.astype(np.float64),
+        ))
+        
+        gaps, gap_x = self._find_gaps(x, sequences)
+        
+        self._x_data.extend(np.insert(x, gaps, gap_x))
+        self._meta_data.extend(np.insert(meta, gaps, np.nan, axis=0))
+        self._y_data_raw.extend(np.insert(raw, gaps, np.nan, axis=0))
+        self._track_y_extent(raw)
+        
+        names = {name for voting_results in voting_batch for name in voting_results}
+        for name in names:
+            if name not in self._voting_data:
+                self._voting_data[name] = self._create_buffer(1)
+        
+        for name, buffer in self._voting_data.items():
+            votes = np.array([
+                np.nan if voting_results.get(name) is None else voting_results[name]
+                for voting_results in voting_batch
+            ])
+            buffer.extend(np.insert(votes, gaps, np.nan))
+            self._track_y_extent(votes)
+    
+    def _find_gaps(self, x: np.ndarray, sequences: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        previous_x = self._x_data.last()
+        times = x if previous_x is None else np.concatenate((previous_x, x))
+        if self._last_sequence is not None:
+            sequences = np.concatenate(([self._last_sequence], sequences))
+        self._last_sequence = int(sequences[-1])
+        
+        # A NaN row before each late or out-of-sequence sample breaks the
+        # lines there instead of interpolating across the missing reads
+        missed = np.diff(sequences) - 1
+        late = np.diff(times) > self._reading_frequency * CHART_SETTINGS.GAP_THRESHOLD
+        self._missed_samples += int(missed[missed > 0].sum())
+        
+        # Positions are relative to the new rows; a first batch has no row before it
+        offset = len(times) - len(x)
+        gaps = np.flatnonzero(late | (missed > 0))
+        return gaps + 1 - offset, (times[gaps] + times[gaps + 1]) / 2
+    
+    def _smoothed_view(self) -> np.ndarray:
+        raw = self._y_data_raw.view()
+        new_rows = self._y_data_raw.total_rows - self._smoothed_rows
+        
+        if self._smoothed_factor != self._smoothing_factor or new_rows > len(raw):
+            # A new factor (or rows that already left the window) refilters
+            # everything still on screen from its first row
+            self._y_data_smoothed.clear()
+            self._smoothed_factor = self._smoothing_factor
+            self._smoothed_seed = None
+            new_rows = len(raw)
+        
+        if new_rows:
+            rows = raw[len(raw) - new_rows:]
+            smoothed = np.full_like(rows, np.nan)
+            # Gap rows stay NaN and the filter runs straight across them
+            valid = ~np.all(np.isnan(rows), axis=1)
+            if valid.any():
+                smoothed[valid] = DataParser.exponential_smoothing(
+                    rows[valid], self._smoothing_factor, self._smoothed_seed
+                )
+                self._smoothed_seed = smoothed[valid][-1].copy()
+            self._y_data_smoothed.extend(smoothed)
+            self._smoothed_rows = self._y_data_raw.total_rows
+        
+        return self._y_data_smoothed.view()
+    
+    def _track_y_extent(self, values: np.ndarray) -> None:
+        if values.size == 0 or np.isnan(values).all():
+            return
+        
+        self._y_min = min(self._y_min, float(np.nanmin(values)))
+        self._y_max = max(self._y_max, float(np.nanmax(values)))
     
     def _redraw(self, active_strategies: list[str]) -> None:
         if self._ax is None or self._fig is None or self._canvas is None:
             return
         
-        self._ax.cla()
+        visible_strategies = tuple(
+            name for name in active_strategies
+            if name in self._voting_data and len(self._voting_data[name])
+        )
+        visible_sensors = tuple(range(self._num_sensors)) if len(self._y_data_raw) else ()
+        layout = (bool(active_strategies), visible_strategies, visible_sensors)
         
-        has_active_voting = bool(active_strategies)
+        needs_full_draw = self._render_mode == RENDER_MODE_FULL
+        if layout != self._artist_layout:
+            self._rebuild_artists(*layout)
+            needs_full_draw = True
         
-        for strategy_name in active_strategies:
-            if strategy_name not in self._voting_data:
-                continue
-            
-            data = self._voting_data[strategy_name]
-            if not data:
-                continue
-            
-            color = CHART_SETTINGS.VOTING_COLORS.get(strategy_name, "#ffffff")
-            linestyle = CHART_SETTINGS.VOTING_LINESTYLES.get(strategy_name, "-")
+        self._update_artists()
+        
+        if self._update_limits():
+            needs_full_draw = True
+        
+        if needs_full_draw or self._background is None:
+            self._canvas.draw()
+        else:
+            self._blit_artists()
+    
+    def _rebuild_artists(
+        self,
+        has_active_voting: bool,
+        visible_strategies: tuple[str, ...],
+        visible_sensors: tuple[int, ...],
+    ) -> None:
+        self._reset_artists()
+        animated = self._render_mode == RENDER_MODE_BLIT
+        
+        for strategy_name in visible_strategies:
+            (line,) = self._ax.plot(
+                [],
+                [],
+                color=CHART_SETTINGS.VOTING_COLORS.get(strategy_name, "#ffffff"),
+                linestyle=CHART_SETTINGS.VOTING_LINESTYLES.get(strategy_name, "-"),
+                linewidth=4,
+                animated=animated,
+            )
+            self._voting_lines[strategy_name] = line
+        
+        if has_active_voting:
+            colour_pool = CHART_SETTINGS.COLOUR_POOL_SECONDARY
+            linestyle = "--"
+            linewidth = 0.8
+        else:
+            colour_pool = CHART_SETTINGS.COLOUR_POOL_PRIMARY
+            linestyle = "-"
+            linewidth = 2
+        
+        if len(visible_sensors) > CHART_SETTINGS.MAX_INDIVIDUAL_LINES:
+            # One artist for all sensors keeps drawing cost flat in N
+            self._sensor_collection = LineCollection(
+                [],
+                colors=[colour_pool[i % len(colour_pool)] for i in visible_sensors],
+                linestyles=linestyle,
+                linewidths=min(linewidth, 0.8),
+                animated=animated,
+            )
+            self._ax.add_collection(self._sensor_collection)
+        else:
+            for i in visible_sensors:
+                (line,) = self._ax.plot(
+                    [],
+                    [],
+                    color=colour_pool[i % len(colour_pool)],
+                    linestyle=linestyle,
+                    linewidth=linewidth,
+                    animated=animated,
+                )
+                self._sensor_lines[i] = line
+        
+        self._update_labels()
+        
+        handles = self._line_artists()
+        if handles:
+            self._legend = self._ax.legend(
+                handles=handles,
+                loc="upper left",
+                prop={"family": "monospace", "size": 10},
+            )
+            self._legend.set_animated(animated)
+        
+        self._artist_layout = (has_active_voting, visible_strategies, visible_sensors)
+    
+    def _line_artists(self) -> list:
+        artists = [*self._voting_lines.values(), *self._sensor_lines.values()]
+        if self._sensor_collection is not None:
+            artists.append(self._sensor_collection)
+        return artists
+    
+    def _reset_artists(self) -> None:
+        for artist in self._line_artists():
+            artist.remove()
+        self._voting_lines.clear()
+        self._sensor_lines.clear()
+        self._sensor_collection = None
+        
+        if self._legend is not None:
+            self._legend.remove()
+            self._legend = None
+        
+        self._artist_layout = None
+        self._background = None
+    
+    def _update_artists(self) -> None:
+        x_data = self._x_data.column(0)
+        max_points = self._display_points()
+        
+        for strategy_name, line in self._voting_lines.items():
+            data = self._voting_data[strategy_name].column(0)
+            line.set_data(*self._decimate(x_data[len(x_data) - len(data):], data, max_points))
+        
+        smoothed = self._smoothed_view()
+        for i, line in self._sensor_lines.items():
+            line.set_data(*self._decimate(x_data, smoothed[:, i], max_points))
+        
+        if self._sensor_collection is not None:
+            # LTTB picks points per series, so the shared x needs the envelope
+            method = CHART_SETTINGS.DECIMATION_METHOD
+            if method == DECIMATION_LTTB:
+                method = DECIMATION_MIN_MAX
+            x_points, y_points = Decimator.decimate(x_data, smoothed, max_points, method)
             
-            last_value = data[-1]
-            if last_value is None:
+            segments = np.empty((smoothed.shape[1], len(x_points), 2))
+            segments[:, :, 0] = x_points
+            segments[:, :, 1] = y_points.T
+            self._sensor_collection.set_segments(segments)
+        
+        self._update_labels()
+    
+    def _display_points(self) -> int:
+        if self._ax is None:
+            return 0
+        
+        pixels = max(1, int(self._ax.bbox.width))
+        return int(pixels * CHART_SETTINGS.DECIMATION_POINTS_PER_PIXEL)
+    
+    def _decimate(
+        self,
+        x: np.ndarray,
+        y: np.ndarray,
+        max_points: int,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        return Decimator.decimate(x, y, max_points, CHART_SETTINGS.DECIMATION_METHOD)
+    
+    def _update_labels(self) -> None:
+        labels: list[str] = []
+        
+        for strategy_name, line in self._voting_lines.items():
+            last_value = self._voting_data[strategy_name].last()[0]
+            if np.isnan(last_value):
                 label_text = f"{strategy_name:<19}: no correct data"
             else:
                 label_text = f"{strategy_name:<19}: {last_value:>11.2f}ºC"
-            
-            self._ax.plot(
-                self._x_data[:len(data)],
-                data,
-                label=label_text,
-                color=color,
-                linestyle=linestyle,
-                linewidth=4,
-            )
+            line.set_label(label_text)
+            labels.append(label_text)
         
-        for i in range(self._num_sensors):
-            if i >= len(self._y_data_smoothed) or not self._y_data_smoothed[i]:
-                continue
-            
-            data = self._y_data_smoothed[i]
-            last_raw = self._y_data_raw[i][-1] if self._y_data_raw[i] else 0
-            
-            if has_active_voting:
-                color = CHART_SETTINGS.COLOUR_POOL_SECONDARY[i % len(CHART_SETTINGS.COLOUR_POOL_SECONDARY)]
-                linestyle = "--"
-                linewidth = 0.8
+        last_raw_row = self._y_data_raw.last()
+        for i, line in self._sensor_lines.items():
+            last_raw = last_raw_row[i] if last_raw_row is not None else 0
+            label_text = f"Sensor {i + 1}: {last_raw:.1f}ºC"
+            line.set_label(label_text)
+            labels.append(label_text)
+        
+        if self._sensor_collection is not None:
+            if last_raw_row is not None:
+                low, high = np.nanmin(last_raw_row), np.nanmax(last_raw_row)
             else:
-                color = CHART_SETTINGS.COLOUR_POOL_PRIMARY[i % len(CHART_SETTINGS.COLOUR_POOL_PRIMARY)]
-                linestyle = "-"
-                linewidth = 2
-            
-            self._ax.plot(
-                self._x_data[:len(data)],
-                data,
-                label=f"Sensor {i + 1}: {last_raw:.1f}ºC",
-                color=color,
-                linestyle=linestyle,
-                linewidth=linewidth,
-            )
+                low = high = 0
+            label_text = f"Sensors 1-{self._num_sensors}: {low:.1f}..{high:.1f}ºC"
+            self._sensor_collection.set_label(label_text)
+            labels.append(label_text)
         
-        self._ax.grid(True, linestyle="--", alpha=0.3)
-        self._ax.legend(loc="upper left", prop={"family": "monospace", "size": 10})
-        self._ax.set_xlabel("Time [s]")
-        self._ax.set_ylabel("Temperature [ºC]")
-        self._ax.set_title("Temperature Live Data")
+        if self._legend is not None:
+            for text, label_text in zip(self._legend.get_texts(), labels):
+                text.set_text(label_text)
+    
+    def _update_limits(self) -> bool:
+        if self._ax is None or not len(self._x_data):
+            return False
         
-        self._canvas.draw()
+        changed = False
+        
+        x_data = self._x_data.column(0)
+        x_first = float(x_data[0])
+        x_last = float(x_data[-1])
+        x_left, x_right = self._ax.get_xlim()
+        scrolled_out = x_first - x_left > (x_right - x_left) * CHART_SETTINGS.X_AXIS_HEADROOM
+        if x_last > x_right or x_first < x_left or scrolled_out or self._fit_limits:
+            span = max(x_last - x_first, self._reading_frequency)
+            self._ax.set_xlim(x_first, x_last + span * CHART_SETTINGS.X_AXIS_HEADROOM)
+            changed = True
+        
+        if self._y_min <= self._y_max:
+            y_bottom, y_top = self._ax.get_ylim()
+            if self._y_min < y_bottom or self._y_max > y_top or self._fit_limits:
+                margin = max(
+                    (self._y_max - self._y_min) * CHART_SETTINGS.Y_AXIS_MARGIN,
+                    CHART_SETTINGS.MIN_Y_AXIS_MARGIN,
+                )
+                self._ax.set_ylim(self._y_min - margin, self._y_max + margin)
+                changed = True
+        
+        self._fit_limits = False
+        return changed
+    
+    def _on_draw(self, event: Optional[DrawEvent]) -> None:
+        if self._canvas is None or self._fig is None:
+            return
+        
+        if self._render_mode != RENDER_MODE_BLIT:
+            return
+        
+        self._background = self._canvas.copy_from_bbox(self._fig.bbox)
+        self._draw_animated()
+    
+    def _blit_artists(self) -> None:
+        if self._canvas is None or self._fig is None:
+            return
+        
+        self._canvas.restore_region(self._background)
+        self._draw_animated()
+        self._canvas.blit(self._fig.bbox)
+        self._canvas.flush_events()
+    
+    def _draw_animated(self) -> None:
+        if self._fig is None:
+            return
+        
+        for artist in self._line_artists():
+            self._fig.draw_artist(artist)
+        
+        if self._legend is not None:
+            self._fig.draw_artist(self._legend)
+    
+    def _set_artists_animated(self, animated: bool) -> None:
+        for artist in self._line_artists():
+            artist.set_animated(animated)
+        
+        if self._legend is not None:
+            self._legend.set_animated(animated)
     
     @property
     def is_initialized(self) -> bool:
@@ -176,23 +548,62 @@ class ChartWidget(ctk.CTkFrame):
     def figure(self) -> Optional[Figure]:
         return self._fig
     
+    @property
+    def render_mode(self) -> str:
+        return self._render_mode
+    
+    @property
+    def last_batch_size(self) -> int:
+        return self._last_batch_size
+    
+    @property
+    def max_batch_size(self) -> int:
+        return self._max_batch_size
+    
+    @property
+    def last_latency(self) -> float:
+        return self._last_latency
+    
+    @property
+    def max_latency(self) -> float:
+        return self._max_latency
+    
+    @property
+    def missed_samples(self) -> int:
+        return self._missed_samples
+    
     def set_num_sensors(self, num_sensors: int) -> None:
         self._num_sensors = num_sensors
-        self._y_data_raw = [[] for _ in range(num_sensors)]
-        self._y_data_smoothed = [[] for _ in range(num_sensors)]
+        self._capacity = self._history_capacity(num_sensors)
+        for buffer in (self._x_data, self._meta_data, self._y_data_raw, self._y_data_smoothed):
+            buffer.close()
+        self._x_data = self._create_buffer(1)
+        self._meta_data = self._create_buffer(2)
+        self._y_data_raw = self._create_buffer(num_sensors)
+        self._y_data_smoothed = self._create_buffer(num_sensors, spill=False)
+        self.clear_data()
     
     def set_smoothing_factor(self, factor: float) -> None:
-        self._smoothing_factor = max(0.0, min(1.0, factor))
+        factor = max(0.0, min(1.0, factor))
+        if factor == self._smoothing_factor:
+            return
+        
+        self._smoothing_factor = factor
+        # Redraw now so a paused chart shows the whole history refiltered
+        if len(self._y_data_raw):
+            self._redraw(self._active_strategies)
     
     def set_reading_frequency(self, frequency: float) -> None:
         self._reading_frequency = frequency
     
     def get_chart_data(self) -> dict:
         return {
-            "x_data": self._x_data.copy(),
-            "sensor_data": [data.copy() for data in self._y_data_raw],
-            "smoothed_data": [data.copy() for data in self._y_data_smoothed],
-            "voting_data": {k: v.copy() for k, v in self._voting_data.items()},
+            "x_data": self._x_data.column(0),
+            "wall_time": self._meta_data.column(0),
+            "sequence": self._meta_data.column(1),
+            "sensor_data": self._y_data_raw.view(),
+            "smoothed_data": self._smoothed_view(),
+            "voting_data": {k: v.column(0) for k, v in self._voting_data.items()},
         }
     
     def save_as_png(self, filepath: str) -> bool:
@@ -200,26 +611,41 @@ class ChartWidget(ctk.CTkFrame):
             return False
         
         try:
+            self._set_artists_animated(False)
             self._fig.savefig(filepath)
             return True
         except Exception:
             return False
+        finally:
+            self._set_artists_animated(self._render_mode == RENDER_MODE_BLIT)
     
     def export_to_csv(self, filepath: str) -> bool:
-        if not self._x_data:
+        if not len(self._x_data):
             return False
         
         try:
+            x_data = self._x_data.to_array()[:, 0]
+            meta_data = self._meta_data.to_array()
+            raw_data = self._y_data_raw.to_array()
+            
             with open(filepath, "w", encoding="utf-8", newline="") as file:
-                headers = ["Time [s]"]
+                headers = ["Time [s]", "Timestamp", "Sequence"]
                 headers.extend([f"Sensor_{i + 1} [C]" for i in range(self._num_sensors)])
                 file.write(";".join(headers) + "\n")
                 
-                for i in range(len(self._x_data)):
-                    row = [f"{self._x_data[i]:.1f}".replace(".", ",")]
+                for i in range(len(x_data)):
+                    wall_time, sequence = meta_data[i]
+                    if np.isnan(sequence):
+                        continue
+                    
+                    row = [
+                        f"{x_data[i]:.3f}".replace(".", ","),
+                        datetime.fromtimestamp(wall_time).isoformat(timespec="milliseconds"),
+                        str(int(sequence)),
+                    ]
                     for j in range(self._num_sensors):
-                        if j < len(self._y_data_raw) and i < len(self._y_data_raw[j]):
-                            row.append(f"{self._y_data_raw[j][i]:.1f}".replace(".", ","))
+                        if i < len(raw_data) and not np.isnan(raw_data[i, j]):
+                            row.append(f"{raw_data[i, j]:.1f}".replace(".", ","))
                         else:
                             row.append("")
                     file.write(";".join(row) + "\n")
@@ -31,6 +31,7 @@ class ControlPanel(ctk.CTkFrame):
         self._resume_button: Optional[ctk.CTkButton] = None
         self._settings_button: Optional[ctk.CTkButton] = None
         self._back_button: Optional[ctk.CTkButton] = None
+        self._status_label: Optional[ctk.CTkLabel] = None
         
         self._create_widgets()
     
@@ -78,6 +79,9 @@ class ControlPanel(ctk.CTkFrame):
             command=self._handle_settings_toggle,
         )
         self._settings_button.pack(side="right", padx=5, pady=5)
+        
+        self._status_label = ctk.CTkLabel(self, text="")
+        self._status_label.pack(side="right", padx=10, pady=5)
     
     def _handle_reset(self) -> None:
         if self._on_reset:
@@ -128,6 +132,10 @@ class ControlPanel(ctk.CTkFrame):
         if self._settings_button:
             text = "Hide Settings" if is_visible else "Settings"
             self._settings_button.configure(text=text)
+    
+    def set_status_text(self, text: str) -> None:
+        if self._status_label:
+            self._status_label.configure(text=text)
 
 
 class HomeControls(ctk.CTkFrame):
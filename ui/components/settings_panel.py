@@ -6,6 +6,11 @@ from config.settings import SENSOR_SETTINGS, CHART_SETTINGS
 from core.algorithms import VotingStrategy
 
 
+# Beyond this many positions the slider moves in coarse steps; exact
+# counts are typed into the entry next to it
+NUM_SENSORS_SLIDER_STEPS = 64
+
+
 class SettingsPanel(ctk.CTkFrame):
     
     def __init__(
@@ -29,6 +34,7 @@ class SettingsPanel(ctk.CTkFrame):
         self._smoothing_factor = CHART_SETTINGS.DEFAULT_SMOOTHING_FACTOR
         self._reading_frequency = SENSOR_SETTINGS.DEFAULT_READING_FREQUENCY
         self._num_sensors = SENSOR_SETTINGS.DEFAULT_NUM_SENSORS
+        self._max_sensors = SENSOR_SETTINGS.MAX_SENSORS
         
         self._strategy_states: dict[str, bool] = {
             strategy.name: False for strategy in self._available_strategies
@@ -40,6 +46,7 @@ class SettingsPanel(ctk.CTkFrame):
         self._frequency_label: Optional[ctk.CTkLabel] = None
         self._num_sensors_slider: Optional[ctk.CTkSlider] = None
         self._num_sensors_label: Optional[ctk.CTkLabel] = None
+        self._num_sensors_entry: Optional[ctk.CTkEntry] = None
         self._strategy_checkboxes: dict[str, ctk.CTkCheckBox] = {}
         
         self._create_widgets()
@@ -94,14 +101,22 @@ class SettingsPanel(ctk.CTkFrame):
         frame = ctk.CTkFrame(self, fg_color="transparent")
         frame.pack(side="left", padx=10, pady=0, fill="y")
         
-        self._num_sensors_label = ctk.CTkLabel(frame, text="")
-        self._num_sensors_label.pack(side="top", pady=(5, 0))
+        header = ctk.CTkFrame(frame, fg_color="transparent")
+        header.pack(side="top", pady=(5, 0))
+        
+        self._num_sensors_label = ctk.CTkLabel(header, text="")
+        self._num_sensors_label.pack(side="left")
+        
+        self._num_sensors_entry = ctk.CTkEntry(header, width=55)
+        self._num_sensors_entry.bind("<Return>", self._on_num_sensors_entry_confirm)
+        self._num_sensors_entry.bind("<FocusOut>", self._on_num_sensors_entry_confirm)
+        self._num_sensors_entry.pack(side="left", padx=(5, 0))
         
         self._num_sensors_slider = ctk.CTkSlider(
             frame,
             from_=SENSOR_SETTINGS.MIN_SENSORS,
-            to=SENSOR_SETTINGS.MAX_SENSORS,
-            number_of_steps=SENSOR_SETTINGS.MAX_SENSORS - SENSOR_SETTINGS.MIN_SENSORS,
+            to=self._max_sensors,
+            number_of_steps=self._num_sensors_slider_steps(self._max_sensors),
             command=self._on_num_sensors_slider_change,
         )
         self._num_sensors_slider.bind("<ButtonRelease-1>", self._on_num_sensors_slider_release)
@@ -169,13 +184,35 @@ class SettingsPanel(ctk.CTkFrame):
             self._frequency_label.configure(text=f"Reading Frequency: {value / 100:.2f} s")
     
     def _on_num_sensors_slider_change(self, value: float) -> None:
-        self._update_num_sensors_label(int(value))
+        self._update_num_sensors_label(round(value))
     
     def _on_num_sensors_slider_release(self, event) -> None:
         if self._num_sensors_slider is None:
             return
         
-        value = int(self._num_sensors_slider.get())
+        value = round(self._num_sensors_slider.get())
+        self._num_sensors = value
+        
+        if self._on_num_sensors_change:
+            self._on_num_sensors_change(value)
+    
+    def _on_num_sensors_entry_confirm(self, event) -> None:
+        if self._num_sensors_entry is None:
+            return
+        
+        try:
+            value = int(self._num_sensors_entry.get())
+        except ValueError:
+            value = self._num_sensors
+        value = max(SENSOR_SETTINGS.MIN_SENSORS, min(value, self._max_sensors))
+        
+        if self._num_sensors_slider:
+            self._num_sensors_slider.set(value)
+        self._update_num_sensors_label(value)
+        
+        # Return followed by leaving the field must not restart twice
+        if value == self._num_sensors:
+            return
         self._num_sensors = value
         
         if self._on_num_sensors_change:
@@ -183,7 +220,14 @@ class SettingsPanel(ctk.CTkFrame):
     
     def _update_num_sensors_label(self, value: int) -> None:
         if self._num_sensors_label:
-            self._num_sensors_label.configure(text=f"Number of Sensors: {value}")
+            self._num_sensors_label.configure(text=f"Number of Sensors (max {self._max_sensors}):")
+        if self._num_sensors_entry:
+            self._num_sensors_entry.delete(0, "end")
+            self._num_sensors_entry.insert(0, str(value))
+    
+    @staticmethod
+    def _num_sensors_slider_steps(maximum: int) -> int:
+        return min(maximum - SENSOR_SETTINGS.MIN_SENSORS, NUM_SENSORS_SLIDER_STEPS)
     
     def _on_strategy_checkbox_toggle(self, strategy_name: str) -> None:
         self._strategy_states[strategy_name] = not self._strategy_states[strategy_name]
@@ -203,6 +247,23 @@ class SettingsPanel(ctk.CTkFrame):
     def num_sensors(self) -> int:
         return self._num_sensors
     
+    def set_num_sensors(self, value: int) -> None:
+        self._num_sensors = value
+        if self._num_sensors_slider:
+            self._num_sensors_slider.set(value)
+        self._update_num_sensors_label(value)
+    
+    def set_max_sensors(self, value: int) -> None:
+        # Slider and entry only offer what the data provider can deliver
+        self._max_sensors = max(value, SENSOR_SETTINGS.MIN_SENSORS)
+        maximum = max(value, SENSOR_SETTINGS.MIN_SENSORS + 1)
+        if self._num_sensors_slider:
+            self._num_sensors_slider.configure(
+                to=maximum,
+                number_of_steps=self._num_sensors_slider_steps(maximum),
+            )
+        self.set_num_sensors(min(self._num_sensors, self._max_sensors))
+    
     def get_active_strategies(self) -> list[str]:
         return [name for name, active in self._strategy_states.items() if active]
     
@@ -2,9 +2,11 @@ import queue
 from typing import Optional
 
 import customtkinter as ctk
+import numpy as np
 
 from config.settings import CHART_SETTINGS, SENSOR_SETTINGS
 from core.interfaces import DataQueueProvider
+from core.sample_record import SampleRecord
 from core.algorithms import (
     Voter,
     VotingStrategy,
@@ -17,7 +19,6 @@ from core.algorithms import (
 from ui.chart_widget import ChartWidget
 from ui.components.settings_panel import SettingsPanel
 from ui.components.controls import ControlPanel, HomeControls
-from utils.data_parser import DataParser
 
 
 class MainWindow(ctk.CTk):
@@ -33,6 +34,10 @@ class MainWindow(ctk.CTk):
         
         self._data_provider = data_provider
         self._data_queue = data_provider.get_data_queue()
+        self._sample_ring = data_provider.get_sample_ring()
+        self._drain_block: Optional[np.ndarray] = None
+        if self._sample_ring is not None:
+            self._drain_block = np.empty((self._sample_ring.capacity, self._sample_ring.width))
         
         self.geometry(f"{width}x{height}")
         self.title(title)
@@ -41,6 +46,9 @@ class MainWindow(ctk.CTk):
         self._settings_visible = False
         self._after_id: Optional[str] = None
         self._num_sensors = SENSOR_SETTINGS.DEFAULT_NUM_SENSORS
+        if hasattr(self._data_provider, 'num_sensors'):
+            # The provider may deliver fewer sensors than the default asks for
+            self._num_sensors = self._data_provider.num_sensors
         self._reading_frequency = SENSOR_SETTINGS.DEFAULT_READING_FREQUENCY
         self._smoothing_factor = CHART_SETTINGS.DEFAULT_SMOOTHING_FACTOR
         
@@ -116,6 +124,9 @@ class MainWindow(ctk.CTk):
             on_strategy_toggle=self._handle_strategy_toggle,
             available_strategies=list(self._all_strategies.values()),
         )
+        if hasattr(self._data_provider, 'max_sensors'):
+            self._settings_panel.set_max_sensors(self._data_provider.max_sensors)
+        self._settings_panel.set_num_sensors(self._num_sensors)
         
         self._chart_widget = ChartWidget(
             self._sensors_frame,
@@ -192,6 +203,11 @@ class MainWindow(ctk.CTk):
     def _handle_num_sensors_change(self, num_sensors: int) -> None:
         self._num_sensors = num_sensors
         self._data_provider.update_num_sensors(num_sensors) if hasattr(self._data_provider, 'update_num_sensors') else None
+        if hasattr(self._data_provider, 'num_sensors'):
+            # Samples are filtered on this count, so it must match what arrives
+            self._num_sensors = self._data_provider.num_sensors
+            if self._settings_panel:
+                self._settings_panel.set_num_sensors(self._num_sensors)
         
         self._handle_restart()
     
@@ -253,35 +269,113 @@ class MainWindow(ctk.CTk):
             return
         
         if not self._is_chart_paused:
-            try:
-                data_updated = False
-                
-                while not self._data_queue.empty():
-                    data = self._data_queue.get_nowait()
-                    
-                    if not data or len(data) != self._num_sensors:
-                        continue
-                    
-                    data_updated = True
-                    
-                    valid_readings = DataParser.filter_valid_readings(data)
-                    
-                    if valid_readings:
-                        voting_results = self._voter.vote(valid_readings)
-                    else:
-                        voting_results = {}
-                    
-                    self._chart_widget.update_chart(
-                        sensor_data=data,
-                        voting_results=voting_results,
-                        active_strategies=list(self._active_strategy_names),
-                    )
-                    
-            except queue.Empty:
-                pass
+            if self._sample_ring is not None:
+                record_batch, voting_batch = self._drain_sample_ring()
+            else:
+                record_batch, voting_batch = self._drain_data_queue()
+            
+            if record_batch:
+                self._chart_widget.update_chart_batch(
+                    records=record_batch,
+                    voting_batch=voting_batch,
+                    active_strategies=list(self._active_strategy_names),
+                )
+                self._update_status()
         
         self._schedule_chart_update()
     
+    def _drain_data_queue(self) -> tuple[list[SampleRecord], list[dict[str, Optional[float]]]]:
+        record_batch: list[SampleRecord] = []
+        
+        try:
+            while not self._data_queue.empty():
+                record = self._data_queue.get_nowait()
+                
+                if len(record) == self._num_sensors:
+                    record_batch.append(record)
+                
+        except queue.Empty:
+            pass
+        
+        return record_batch, self._vote_records(record_batch)
+    
+    def _drain_sample_ring(self) -> tuple[list[SampleRecord], list[dict[str, Optional[float]]]]:
+        count = self._sample_ring.drain_into(self._drain_block)
+        record_batch = [
+            record for record in map(SampleRecord.from_row, self._drain_block[:count])
+            if len(record) == self._num_sensors
+        ]
+        return record_batch, self._vote_records(record_batch)
+    
+    def _vote_records(self, record_batch: list[SampleRecord]) -> list[dict[str, Optional[float]]]:
+        if not record_batch:
+            return []
+        
+        # One vectorized vote over the whole tick instead of one per sample
+        samples = np.stack([record.values for record in record_batch])
+        results = self._voter.vote_batch(samples, np.stack([record.mask for record in record_batch]))
+        voting_batch = [
+            {name: None if np.isnan(votes[row]) else float(votes[row]) for name, votes in results.items()}
+            for row in range(len(record_batch))
+        ]
+        
+        return voting_batch
+    
+    def _update_status(self) -> None:
+        if self._control_panel is None or self._chart_widget is None:
+            return
+        
+        status = (
+            f"Samples/tick: {self._chart_widget.last_batch_size} "
+            f"(max {self._chart_widget.max_batch_size}) | "
+            f"Latency: {self._chart_widget.last_latency * 1000:.0f} ms "
+            f"(max {self._chart_widget.max_latency * 1000:.0f}) | "
+            f"Missed: {self._chart_widget.missed_samples}"
+        )
+        
+        if hasattr(self._data_provider, 'scheduler_stats'):
+            stats = self._data_provider.scheduler_stats
+            status += (
+                f" | Jitter: {stats.mean_jitter * 1000:.1f} ms "
+                f"(max {stats.max_jitter * 1000:.1f}) | "
+                f"Overruns: {stats.overruns}, skipped: {stats.skipped_slots}, "
+                f"caught up: {stats.caught_up_slots}"
+            )
+        
+        if hasattr(self._data_provider, 'connection_stats'):
+            stats = self._data_provider.connection_stats
+            status += f" | Link: {stats.state}"
+            if stats.current_downtime > 0:
+                status += f" for {stats.current_downtime:.0f} s"
+            if stats.next_retry_in > 0:
+                status += f", retry in {stats.next_retry_in:.1f} s"
+        
+        if hasattr(self._data_provider, 'device_timings'):
+            # Multi-slave providers time every slave on its own
+            timings = list(self._data_provider.device_timings.values())
+            quarantined = sum(1 for stats in timings if stats.quarantined)
+            status += f" | Timeout: max {max((stats.timeout for stats in timings), default=0.0) * 1000:.0f} ms"
+            if quarantined:
+                status += f" ({quarantined} of {len(timings)} slaves quarantined)"
+        elif hasattr(self._data_provider, 'device_timing'):
+            stats = self._data_provider.device_timing
+            status += f" | Timeout: {stats.timeout * 1000:.0f} ms"
+            if stats.quarantined:
+                status += f" (quarantined, polled every {stats.poll_interval})"
+        
+        if hasattr(self._data_provider, 'replay_progress'):
+            replayed, total = self._data_provider.replay_progress
+            status += f" | Replay: {replayed}/{total} at {self._data_provider.speed_label}"
+        
+        if hasattr(self._data_provider, 'queue_stats'):
+            stats = self._data_provider.queue_stats
+            status += (
+                f" | Queue: {stats.size}/{stats.max_size} "
+                f"(peak {stats.high_watermark}), dropped: {stats.dropped}"
+            )
+        
+        self._control_panel.set_status_text(status)
+    
     def _show_closing_dialog(self) -> None:
         dialog = ctk.CTkToplevel(self)
         dialog.geometry("600x200")
@@ -1,3 +1,19 @@
+from utils.bounded_queue import BoundedSampleQueue, QueueStats
 from utils.data_parser import DataParser
+from utils.decimation import Decimator
+from utils.register_map import DecodedRegisters, RegisterField, RegisterMap
+from utils.ring_buffer import HistoryStore, RingBuffer
+from utils.spsc_ring import SpscRing
 
-__all__ = ["DataParser"]
+__all__ = [
+    "BoundedSampleQueue",
+    "QueueStats",
+    "DataParser",
+    "Decimator",
+    "RegisterMap",
+    "RegisterField",
+    "DecodedRegisters",
+    "HistoryStore",
+    "RingBuffer",
+    "SpscRing",
+]
@@ -0,0 +1,102 @@
+import queue
+from dataclasses import dataclass
+from typing import Any, Optional
+
+
+QUEUE_POLICY_DROP_OLDEST = "drop_oldest"
+QUEUE_POLICY_DROP_NEWEST = "drop_newest"
+QUEUE_POLICY_BLOCK = "block"
+QUEUE_POLICY_CONFLATE_LATEST = "conflate_latest"
+
+QUEUE_POLICIES = (
+    QUEUE_POLICY_DROP_OLDEST,
+    QUEUE_POLICY_DROP_NEWEST,
+    QUEUE_POLICY_BLOCK,
+    QUEUE_POLICY_CONFLATE_LATEST,
+)
+
+
+@dataclass(frozen=True)
+class QueueStats:
+    
+    policy: str
+    size: int
+    max_size: int
+    dropped: int
+    high_watermark: int
+
+
+class BoundedSampleQueue(queue.Queue):
+    
+    def __init__(self, maxsize: int, policy: str = QUEUE_POLICY_DROP_OLDEST):
+        if maxsize < 1:
+            raise ValueError("Bounded queue needs a positive size")
+        
+        if policy not in QUEUE_POLICIES:
+            raise ValueError(f"Unknown queue policy: {policy}")
+        
+        super().__init__(maxsize)
+        self._policy = policy
+        self._dropped = 0
+        self._high_watermark = 0
+    
+    @property
+    def policy(self) -> str:
+        return self._policy
+    
+    def put(self, item: Any, block: bool = True, timeout: Optional[float] = None) -> None:
+        if self._policy == QUEUE_POLICY_BLOCK:
+            try:
+                super().put(item, block, timeout)
+            except queue.Full:
+                with self.mutex:
+                    self._dropped += 1
+                raise
+            return
+        
+        # The non-blocking policies never make the producer wait
+        with self.mutex:
+            discarded = 0
+            if self._policy == QUEUE_POLICY_CONFLATE_LATEST:
+                # A newer sample supersedes whatever is still waiting, so the
+                # consumer always finds the latest value and nothing older
+                discarded = self._qsize()
+                self.queue.clear()
+            elif self._qsize() >= self.maxsize:
+                if self._policy == QUEUE_POLICY_DROP_NEWEST:
+                    self._dropped += 1
+                    return
+                
+                discarded = 1
+                self._get()
+            
+            if discarded:
+                self._dropped += discarded
+                self.unfinished_tasks -= discarded
+            
+            self._put(item)
+            self.unfinished_tasks += 1
+            self.not_empty.notify()
+    
+    def clear(self) -> None:
+        with self.mutex:
+            self.unfinished_tasks -= self._qsize()
+            self.queue.clear()
+            self.not_full.notify_all()
+            if self.unfinished_tasks <= 0:
+                self.unfinished_tasks = 0
+                self.all_tasks_done.notify_all()
+    
+    def stats(self) -> QueueStats:
+        with self.mutex:
+            return QueueStats(
+                policy=self._policy,
+                size=self._qsize(),
+                max_size=self.maxsize,
+                dropped=self._dropped,
+                high_watermark=self._high_watermark,
+            )
+    
+    def _put(self, item: Any) -> None:
+        super()._put(item)
+        self._high_watermark = max(self._high_watermark, self._qsize())
@@ -1,8 +1,14 @@
 from typing import Optional
 
+import numpy as np
+
 from config.settings import MODBUS_SETTINGS, SENSOR_SETTINGS
 
 
+# exp(600) is far from float64 overflow, which bounds one closed-form smoothing chunk
+SMOOTHING_EXPONENT_LIMIT = 600.0
+
+
 class DataParser:
     
     @staticmethod
@@ -21,6 +27,85 @@ class DataParser:
         
         return parsed_values
     
+    @staticmethod
+    def parse_temperature_array(
+        raw_values: np.ndarray,
+        error_value: int = MODBUS_SETTINGS.ERROR_VALUE,
+        scale_factor: float = SENSOR_SETTINGS.TEMPERATURE_SCALE_FACTOR,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        # One read or a block of them: float values with NaN for errors, and
+        # the matching validity mask
+        raw_values = np.asarray(raw_values)
+        mask = raw_values != error_value
+        values = np.divide(raw_values, scale_factor, dtype=np.float64)
+        values[~mask] = np.nan
+        return values, mask
+    
+    @staticmethod
+    def forward_fill(
+        values: np.ndarray,
+        mask: Optional[np.ndarray] = None,
+        previous: Optional[np.ndarray] = None,
+        default_value: float = 0.0,
+    ) -> np.ndarray:
+        # Along the time axis (rows): each gap takes the last valid value
+        # above it, then `previous`, then the default
+        values = np.asarray(values, dtype=np.float64)
+        if mask is None:
+            mask = ~np.isnan(values)
+        one_dimensional = values.ndim == 1
+        if one_dimensional:
+            values, mask = values[:, None], mask[:, None]
+        
+        rows = np.arange(len(values))[:, None]
+        last_valid = np.maximum.accumulate(np.where(mask, rows, -1), axis=0)
+        filled = np.take_along_axis(values, np.maximum(last_valid, 0), axis=0)
+        
+        unfilled = last_valid < 0
+        if unfilled.any():
+            fallback = np.broadcast_to(
+                default_value if previous is None else np.asarray(previous, dtype=np.float64),
+                values.shape[1:],
+            )
+            filled[unfilled] = np.broadcast_to(fallback, filled.shape)[unfilled]
+        
+        return filled[:, 0] if one_dimensional else filled
+    
+    @staticmethod
+    def exponential_smoothing(
+        values: np.ndarray,
+        smoothing_factor: float,
+        previous_smoothed: Optional[np.ndarray] = None,
+    ) -> np.ndarray:
+        # y[n] = a*x[n] + (1-a)*y[n-1] over the rows of `values`, starting from
+        # previous_smoothed (or the first row). With b = 1-a the recursion
+        # unrolls to y[n] = b^(n+1) * (y[-1] + a * sum(x[k] / b^(k+1))), one
+        # cumsum per chunk; chunks keep b^-(k+1) from overflowing.
+        values = np.asarray(values, dtype=np.float64)
+        if len(values) == 0:
+            return values.copy()
+        
+        initial = values[0] if previous_smoothed is None else np.asarray(previous_smoothed, dtype=np.float64)
+        decay = 1.0 - smoothing_factor
+        if decay <= 0.0:
+            return values.copy()
+        if decay >= 1.0:
+            return np.broadcast_to(initial, values.shape).copy()
+        
+        chunk = max(1, int(SMOOTHING_EXPONENT_LIMIT / -np.log(decay)))
+        shape = (-1,) + (1,) * (values.ndim - 1)
+        powers = decay ** np.arange(1, min(chunk, len(values)) + 1).reshape(shape)
+        
+        smoothed = np.empty_like(values)
+        for start in range(0, len(values), chunk):
+            block = values[start:start + chunk]
+            block_powers = powers[:len(block)]
+            weighted = np.cumsum(block / block_powers, axis=0)
+            smoothed[start:start + chunk] = block_powers * (initial + smoothing_factor * weighted)
+            initial = smoothed[start + len(block) - 1]
+        
+        return smoothed
+    
     @staticmethod
     def filter_valid_readings(readings: list[Optional[float]]) -> list[float]:
         return [reading for reading in readings if reading is not None]
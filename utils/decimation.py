@@ -0,0 +1,102 @@
+import warnings
+
+import numpy as np
+
+
+DECIMATION_NONE = "none"
+DECIMATION_MIN_MAX = "minmax"
+DECIMATION_LTTB = "lttb"
+
+
+class Decimator:
+    
+    @staticmethod
+    def decimate(
+        x: np.ndarray,
+        y: np.ndarray,
+        max_points: int,
+        method: str = DECIMATION_MIN_MAX,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        if method == DECIMATION_NONE or len(x) <= max_points:
+            return x, y
+        
+        if method == DECIMATION_MIN_MAX:
+            return Decimator.min_max(x, y, max(1, max_points // 2))
+        
+        if method == DECIMATION_LTTB:
+            if y.ndim != 1:
+                raise ValueError("LTTB decimation expects a single series")
+            return Decimator.lttb(x, y, max_points)
+        
+        raise ValueError(f"Unknown decimation method: {method}")
+    
+    @staticmethod
+    def min_max(
+        x: np.ndarray,
+        y: np.ndarray,
+        buckets: int,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        n = len(x)
+        if n <= 2 * buckets:
+            return x, y
+        
+        starts = np.linspace(0, n, buckets + 1).astype(np.intp)[:-1]
+        ends = np.append(starts[1:], n) - 1
+        
+        # fmin/fmax ignore NaN, so a bucket is only empty if all its values are missing
+        minima = np.fmin.reduceat(y, starts, axis=0)
+        maxima = np.fmax.reduceat(y, starts, axis=0)
+        
+        x_out = np.empty(2 * buckets, dtype=np.float64)
+        x_out[0::2] = x[starts]
+        x_out[1::2] = x[ends]
+        
+        y_out = np.empty((2 * buckets,) + y.shape[1:], dtype=np.float64)
+        y_out[0::2] = minima
+        y_out[1::2] = maxima
+        
+        return x_out, y_out
+    
+    @staticmethod
+    def lttb(
+        x: np.ndarray,
+        y: np.ndarray,
+        threshold: int,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        n = len(x)
+        if threshold >= n or threshold < 3:
+            return x, y
+        
+        edges = np.linspace(1, n - 1, threshold - 1).astype(np.intp)
+        selected = np.empty(threshold, dtype=np.intp)
+        selected[0] = 0
+        selected[-1] = n - 1
+        
+        previous = 0
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", RuntimeWarning)
+            
+            for bucket in range(threshold - 2):
+                start, end = edges[bucket], edges[bucket + 1]
+                next_start = end
+                next_end = edges[bucket + 2] if bucket + 2 < len(edges) else n
+                
+                avg_x = np.mean(x[next_start:next_end])
+                avg_y = np.nanmean(y[next_start:next_end])
+                if np.isnan(avg_y):
+                    avg_y = y[previous]
+                
+                areas = np.abs(
+                    (x[previous] - avg_x) * (y[start:end] - y[previous])
+                    - (x[previous] - x[start:end]) * (avg_y - y[previous])
+                )
+                
+                if np.isnan(areas).all():
+                    chosen = start
+                else:
+                    chosen = start + int(np.nanargmax(areas))
+                
+                selected[bucket + 1] = chosen
+                previous = chosen
+        
+        return x[selected], y[selected]
@@ -0,0 +1,212 @@
+from dataclasses import dataclass
+from typing import Optional, Union
+
+import numpy as np
+
+from config.settings import MODBUS_SETTINGS, SENSOR_SETTINGS
+
+
+# Wire formats by field type: numpy dtype and width in 16-bit registers
+FIELD_TYPES: dict[str, tuple[str, int]] = {
+    "int16": (">i2", 1),
+    "uint16": (">u2", 1),
+    "int32": (">i4", 2),
+    "uint32": (">u4", 2),
+    "float32": (">f4", 2),
+}
+
+QUANTITY_TEMPERATURE = "temperature"
+
+
+@dataclass(frozen=True)
+class RegisterField:
+    
+    name: str
+    offset: int
+    type: str = "int16"
+    divisor: float = 1.0
+    error_value: Optional[Union[int, float]] = None
+    quantity: str = ""
+    # Low word first, as some devices send 32-bit values
+    word_swap: bool = False
+    
+    @property
+    def width(self) -> int:
+        return FIELD_TYPES[self.type][1]
+
+
+class DecodedRegisters:
+    
+    def __init__(
+        self,
+        fields: tuple[RegisterField, ...],
+        blocks: list[tuple[tuple[RegisterField, ...], np.ndarray, np.ndarray]],
+    ):
+        self._fields = fields
+        self._blocks = blocks
+        self._columns = {
+            field.name: (index, column)
+            for index, (group, _, _) in enumerate(blocks)
+            for column, field in enumerate(group)
+        }
+    
+    def __len__(self) -> int:
+        return len(self._blocks[0][1]) if self._blocks else 0
+    
+    def __getitem__(self, name: str) -> np.ndarray:
+        index, column = self._columns[name]
+        return self._blocks[index][1][:, column]
+    
+    @property
+    def values(self) -> dict[str, np.ndarray]:
+        return {field.name: self[field.name] for field in self._fields}
+    
+    @property
+    def masks(self) -> dict[str, np.ndarray]:
+        return {field.name: self.mask(field.name) for field in self._fields}
+    
+    def mask(self, name: str) -> np.ndarray:
+        index, column = self._columns[name]
+        return self._blocks[index][2][:, column]
+    
+    def quantity(self, quantity: str) -> np.ndarray:
+        # Columns of one physical quantity, in map order, as a (rows x fields) block
+        blocks = [values for group, values, _ in self._blocks if group[0].quantity == quantity]
+        if not blocks:
+            return np.empty((len(self), 0))
+        return blocks[0] if len(blocks) == 1 else np.hstack(blocks)
+    
+    def quantity_mask(self, quantity: str) -> np.ndarray:
+        masks = [mask for group, _, mask in self._blocks if group[0].quantity == quantity]
+        if not masks:
+            return np.empty((len(self), 0), dtype=bool)
+        return masks[0] if len(masks) == 1 else np.hstack(masks)
+
+
+class RegisterMap:
+    
+    def __init__(self, fields: list[RegisterField]):
+        if not fields:
+            raise ValueError("Register map needs at least one field")
+        
+        for field in fields:
+            if field.type not in FIELD_TYPES:
+                raise ValueError(f"Unknown register type '{field.type}' for field '{field.name}'")
+        
+        names = [field.name for field in fields]
+        if len(set(names)) != len(names):
+            raise ValueError("Register map field names must be unique")
+        
+        self._fields = tuple(sorted(fields, key=lambda field: field.offset))
+        self._register_count = max(field.offset + field.width for field in self._fields)
+        
+        occupied = np.zeros(self._register_count, dtype=int)
+        for field in self._fields:
+            occupied[field.offset:field.offset + field.width] += 1
+        if occupied.max() > 1:
+            raise ValueError("Register map fields overlap")
+        
+        # Runs of identical, adjacent fields are decoded as one strided 2D view
+        self._groups = self._group_fields(self._fields)
+    
+    @classmethod
+    def from_dicts(cls, fields: list[dict]) -> "RegisterMap":
+        # {"name": "temperature", "offset": 0, "count": 6, ...} expands to
+        # temperature_1..temperature_6 on consecutive registers
+        expanded = []
+        for config in fields:
+            config = dict(config)
+            count = config.pop("count", None)
+            if count is None:
+                expanded.append(RegisterField(**config))
+                continue
+            
+            width = FIELD_TYPES[config.get("type", "int16")][1]
+            name = config.pop("name")
+            offset = config.pop("offset")
+            for index in range(count):
+                expanded.append(RegisterField(name=f"{name}_{index + 1}", offset=offset + index * width, **config))
+        return cls(expanded)
+    
+    @classmethod
+    def temperatures(
+        cls,
+        count: int,
+        error_value: int = MODBUS_SETTINGS.ERROR_VALUE,
+        scale_factor: float = SENSOR_SETTINGS.TEMPERATURE_SCALE_FACTOR,
+    ) -> "RegisterMap":
+        # The layout DataParser.parse_temperature_registers assumes
+        return cls([
+            RegisterField(
+                name=f"temperature_{index + 1}",
+                offset=index,
+                divisor=scale_factor,
+                error_value=error_value,
+                quantity=QUANTITY_TEMPERATURE,
+            )
+            for index in range(count)
+        ])
+    
+    @property
+    def fields(self) -> tuple[RegisterField, ...]:
+        return self._fields
+    
+    @property
+    def register_count(self) -> int:
+        return self._register_count
+    
+    def quantity_count(self, quantity: str) -> int:
+        return sum(1 for field in self._fields if field.quantity == quantity)
+    
+    def decode(self, registers: np.ndarray) -> DecodedRegisters:
+        # Accepts one read or a (reads x registers) block; values may be
+        # signed or unsigned since only the low 16 bits are kept
+        words = np.atleast_2d(np.asarray(registers, dtype=np.int64))
+        if words.shape[1] != self._register_count:
+            raise ValueError(f"Expected {self._register_count} registers, got {words.shape[1]}")
+        
+        data = (words & 0xFFFF).astype(">u2")
+        blocks = []
+        for group in self._groups:
+            field = group[0]
+            raw = np.ndarray(
+                (len(data), len(group)),
+                dtype=">u4" if field.word_swap else FIELD_TYPES[field.type][0],
+                buffer=data,
+                offset=2 * field.offset,
+                strides=(data.strides[0], 2 * field.width),
+            )
+            if field.word_swap:
+                raw = (((raw & 0xFFFF) << 16) | (raw >> 16)).astype(">u4").view(FIELD_TYPES[field.type][0])
+            
+            mask = np.ones(raw.shape, dtype=bool)
+            if field.error_value is not None:
+                mask &= raw != field.error_value
+            
+            if field.type == "float32" or field.divisor != 1.0:
+                values = np.divide(raw, field.divisor, dtype=np.float64)
+                mask &= np.isfinite(values)
+                values[~mask] = np.nan
+            else:
+                # Status words and counters stay integers
+                values = raw.astype(np.int64)
+            
+            blocks.append((group, values, mask))
+        
+        return DecodedRegisters(self._fields, blocks)
+    
+    @staticmethod
+    def _group_fields(fields: tuple[RegisterField, ...]) -> list[tuple[RegisterField, ...]]:
+        groups: list[list[RegisterField]] = []
+        for field in fields:
+            if groups:
+                previous = groups[-1][-1]
+                same_kind = (
+                    (field.type, field.divisor, field.error_value, field.quantity, field.word_swap)
+                    == (previous.type, previous.divisor, previous.error_value, previous.quantity, previous.word_swap)
+                )
+                if same_kind and field.offset == previous.offset + previous.width:
+                    groups[-1].append(field)
+                    continue
+            groups.append([field])
+        return [tuple(group) for group in groups]
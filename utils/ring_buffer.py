@@ -0,0 +1,156 @@
+import tempfile
+from typing import Optional
+
+import numpy as np
+
+
+class HistoryStore:
+    
+    def __init__(self, width: int, directory: Optional[str] = None):
+        self._width = width
+        self._dtype = np.dtype("<f8")
+        self._file = tempfile.TemporaryFile(dir=directory)
+        self._rows = 0
+    
+    @property
+    def width(self) -> int:
+        return self._width
+    
+    def __len__(self) -> int:
+        return self._rows
+    
+    def append(self, rows: np.ndarray) -> None:
+        if len(rows) == 0:
+            return
+        
+        self._file.seek(0, 2)
+        self._file.write(np.ascontiguousarray(rows, dtype=self._dtype).tobytes())
+        self._rows += len(rows)
+    
+    def read(self) -> np.ndarray:
+        if self._rows == 0:
+            return np.empty((0, self._width), dtype=self._dtype)
+        
+        self._file.flush()
+        return np.memmap(self._file, dtype=self._dtype, mode="r", shape=(self._rows, self._width))
+    
+    def clear(self) -> None:
+        self._file.seek(0)
+        self._file.truncate()
+        self._rows = 0
+    
+    def close(self) -> None:
+        self._file.close()
+        self._rows = 0
+
+
+class RingBuffer:
+    
+    def __init__(
+        self,
+        capacity: int,
+        width: int = 1,
+        history: Optional[HistoryStore] = None,
+    ):
+        if capacity < 1:
+            raise ValueError("Ring buffer capacity must be positive")
+        
+        if history is not None and history.width != width:
+            raise ValueError("History store width does not match ring buffer width")
+        
+        self._capacity = capacity
+        self._width = width
+        self._history = history
+        
+        # Every row is written twice, at i and i + capacity, so the newest
+        # `capacity` rows are always one contiguous slice of the block.
+        self._buffer = np.full((2 * capacity, width), np.nan, dtype=np.float64)
+        self._start = 0
+        self._size = 0
+        self._total_rows = 0
+    
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+    
+    @property
+    def width(self) -> int:
+        return self._width
+    
+    @property
+    def total_rows(self) -> int:
+        return self._total_rows
+    
+    @property
+    def history(self) -> Optional[HistoryStore]:
+        return self._history
+    
+    def __len__(self) -> int:
+        return self._size
+    
+    def append(self, row: np.ndarray) -> None:
+        self.extend(np.asarray(row, dtype=np.float64).reshape(1, self._width))
+    
+    def extend(self, rows: np.ndarray) -> None:
+        rows = np.asarray(rows, dtype=np.float64).reshape(-1, self._width)
+        count = len(rows)
+        if count == 0:
+            return
+        
+        self._total_rows += count
+        
+        if count > self._capacity:
+            self._spill(self.view())
+            self._spill(rows[:count - self._capacity])
+            rows = rows[count - self._capacity:]
+            count = self._capacity
+            self._start = 0
+            self._size = 0
+        
+        overflow = self._size + count - self._capacity
+        if overflow > 0:
+            self._spill(self.view()[:overflow])
+            self._start = (self._start + overflow) % self._capacity
+            self._size -= overflow
+        
+        end = self._start + self._size
+        indices = (end + np.arange(count)) % self._capacity
+        self._buffer[indices] = rows
+        self._buffer[indices + self._capacity] = rows
+        self._size += count
+    
+    def view(self) -> np.ndarray:
+        view = self._buffer[self._start:self._start + self._size]
+        view.flags.writeable = False
+        return view
+    
+    def column(self, index: int) -> np.ndarray:
+        return self.view()[:, index]
+    
+    def last(self) -> Optional[np.ndarray]:
+        if self._size == 0:
+            return None
+        return self._buffer[self._start + self._size - 1].copy()
+    
+    def to_array(self) -> np.ndarray:
+        if self._history is None or len(self._history) == 0:
+            return self.view().copy()
+        return np.concatenate((self._history.read(), self.view()))
+    
+    def clear(self) -> None:
+        self._buffer.fill(np.nan)
+        self._start = 0
+        self._size = 0
+        self._total_rows = 0
+        
+        if self._history is not None:
+            self._history.clear()
+    
+    def close(self) -> None:
+        if self._history is not None:
+            self._history.close()
+            self._history = None
+    
+    def _spill(self, rows: np.ndarray) -> None:
+        if self._history is not None:
+            self._history.append(rows)
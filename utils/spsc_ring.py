@@ -0,0 +1,220 @@
+import time
+from multiprocessing import shared_memory
+from typing import Optional
+
+import numpy as np
+
+from utils.bounded_queue import (
+    QUEUE_POLICIES,
+    QUEUE_POLICY_BLOCK,
+    QUEUE_POLICY_CONFLATE_LATEST,
+    QUEUE_POLICY_DROP_NEWEST,
+    QUEUE_POLICY_DROP_OLDEST,
+    QueueStats,
+)
+
+
+# Written by the producer only
+HEAD = 0
+DROPPED = 1
+HIGH_WATERMARK = 2
+# Index of the newest row that replaced an unread one
+OVERWRITTEN = 3
+# Rows before this index were superseded under conflate_latest
+CONFLATED = 4
+# Written by the consumer only
+TAIL = 5
+SKIPPED = 6
+COUNTERS = 7
+
+BLOCK_POLL_INTERVAL = 0.001
+
+
+class SpscRing:
+    
+    def __init__(
+        self,
+        capacity: int,
+        width: int,
+        policy: str = QUEUE_POLICY_DROP_OLDEST,
+        shm: Optional[shared_memory.SharedMemory] = None,
+    ):
+        if capacity < 1:
+            raise ValueError("Ring capacity must be positive")
+        
+        if policy not in QUEUE_POLICIES:
+            raise ValueError(f"Unknown queue policy: {policy}")
+        
+        self._capacity = capacity
+        self._width = width
+        self._policy = policy
+        self._shm = shm
+        
+        # Every counter has a single writer, see above. Each side publishes
+        # its counters after touching the rows, and an aligned 8-byte store
+        # is atomic, so neither side needs a lock - also when both ends live
+        # in different processes. The policies that discard old samples let
+        # the producer overwrite unread rows; the consumer notices from
+        # OVERWRITTEN and CONFLATED and skips them instead of moving TAIL.
+        if shm is None:
+            self._counters = np.zeros(COUNTERS, dtype=np.int64)
+            # Rows are always written in full before they are committed, and
+            # leaving the block uninitialised keeps untouched pages unmapped
+            self._buffer = np.empty((capacity, width), dtype=np.float64)
+        else:
+            self._counters = np.ndarray((COUNTERS,), dtype=np.int64, buffer=shm.buf)
+            self._buffer = np.ndarray(
+                (capacity, width),
+                dtype=np.float64,
+                buffer=shm.buf,
+                offset=self._counters.nbytes,
+            )
+    
+    @classmethod
+    def create_shared(cls, capacity: int, width: int, policy: str = QUEUE_POLICY_DROP_OLDEST) -> "SpscRing":
+        shm = shared_memory.SharedMemory(create=True, size=cls.shared_size(capacity, width))
+        ring = cls(capacity, width, policy, shm)
+        ring._counters.fill(0)
+        return ring
+    
+    @classmethod
+    def attach(cls, name: str, capacity: int, width: int, policy: str = QUEUE_POLICY_DROP_OLDEST) -> "SpscRing":
+        return cls(capacity, width, policy, shared_memory.SharedMemory(name=name))
+    
+    @staticmethod
+    def shared_size(capacity: int, width: int) -> int:
+        return COUNTERS * 8 + capacity * width * 8
+    
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+    
+    @property
+    def width(self) -> int:
+        return self._width
+    
+    @property
+    def policy(self) -> str:
+        return self._policy
+    
+    @property
+    def shared_name(self) -> Optional[str]:
+        return self._shm.name if self._shm is not None else None
+    
+    def __len__(self) -> int:
+        return int(self._counters[HEAD]) - self._oldest_readable(int(self._counters[TAIL]))
+    
+    def push(self, row: np.ndarray, timeout: Optional[float] = None) -> bool:
+        slot = self.reserve(timeout)
+        if slot is None:
+            return False
+        
+        slot[:] = row
+        self.commit()
+        return True
+    
+    def reserve(self, timeout: Optional[float] = None) -> Optional[np.ndarray]:
+        # Hands the producer the next row to fill in place; it becomes
+        # visible to the consumer only on commit(). A full ring is handled
+        # like BoundedSampleQueue.put: None means the sample is dropped, and
+        # only the block policy waits for the consumer, up to timeout.
+        head = int(self._counters[HEAD])
+        tail = int(self._counters[TAIL])
+        if self._policy == QUEUE_POLICY_CONFLATE_LATEST:
+            # Everything still unread is superseded by this row, and the
+            # slot it reuses is below CONFLATED, so it is never read torn
+            if head > self._oldest_readable(tail):
+                self._counters[CONFLATED] = head
+        elif head - tail >= self._capacity and head - self._oldest_readable(tail) >= self._capacity:
+            if self._policy == QUEUE_POLICY_DROP_NEWEST:
+                self._counters[DROPPED] += 1
+                return None
+            
+            if self._policy == QUEUE_POLICY_BLOCK:
+                if not self._wait_for_space(head, timeout):
+                    self._counters[DROPPED] += 1
+                    return None
+            else:
+                # Published before the row is touched, so a consumer copying
+                # it at the same time knows to throw its copy away
+                self._counters[OVERWRITTEN] = head
+        
+        return self._buffer[head % self._capacity]
+    
+    def commit(self) -> None:
+        head = int(self._counters[HEAD]) + 1
+        self._counters[HEAD] = head
+        size = head - int(self._counters[TAIL])
+        if size > self._capacity or self._policy == QUEUE_POLICY_CONFLATE_LATEST:
+            size = len(self)
+        if size > self._counters[HIGH_WATERMARK]:
+            self._counters[HIGH_WATERMARK] = size
+    
+    def drain_into(self, out: np.ndarray) -> int:
+        tail = int(self._counters[TAIL])
+        first_row = self._oldest_readable(tail)
+        count = min(int(self._counters[HEAD]) - first_row, len(out))
+        if count <= 0:
+            if first_row > tail:
+                self._skip_to(first_row, first_row - tail)
+            return 0
+        
+        start = first_row % self._capacity
+        first = min(count, self._capacity - start)
+        out[:first] = self._buffer[start:start + first]
+        if first < count:
+            out[first:count] = self._buffer[:count - first]
+        
+        # Rows the producer reached while they were being copied are torn
+        discarded = min(count, max(0, self._oldest_readable(tail) - first_row))
+        if discarded:
+            out[:count - discarded] = out[discarded:count]
+        
+        self._skip_to(first_row + count, first_row - tail + discarded)
+        return count - discarded
+    
+    def clear(self) -> None:
+        self._counters[TAIL] = self._counters[HEAD]
+    
+    def stats(self) -> QueueStats:
+        return QueueStats(
+            policy=self._policy,
+            size=len(self),
+            max_size=self._capacity,
+            dropped=int(self._counters[DROPPED]) + int(self._counters[SKIPPED]),
+            high_watermark=int(self._counters[HIGH_WATERMARK]),
+        )
+    
+    def _oldest_readable(self, tail: int) -> int:
+        return max(
+            tail,
+            int(self._counters[CONFLATED]),
+            int(self._counters[OVERWRITTEN]) - self._capacity + 1,
+        )
+    
+    def _skip_to(self, new_tail: int, skipped: int) -> None:
+        if skipped:
+            self._counters[SKIPPED] += skipped
+        self._counters[TAIL] = new_tail
+    
+    def _wait_for_space(self, head: int, timeout: Optional[float]) -> bool:
+        # The consumer cannot signal across processes, so the producer polls
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while head - int(self._counters[TAIL]) >= self._capacity:
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+            time.sleep(BLOCK_POLL_INTERVAL)
+        return True
+    
+    def close(self) -> None:
+        if self._shm is None:
+            return
+        
+        # Drop the views before closing, the mapping cannot go while they exist
+        self._counters = np.zeros(COUNTERS, dtype=np.int64)
+        self._buffer = np.empty((0, self._width))
+        self._shm.close()
+    
+    def unlink(self) -> None:
+        if self._shm is not None:
+            self._shm.unlink()